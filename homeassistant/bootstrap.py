@@ -243,7 +243,8 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         """
         platform.uname().processor  # pylint: disable=expression-not-assigned
 
-    # Load the registries and cache the result of platform.uname().processor
+    # Load the registries and the integration cache and cache the result of
+    # platform.uname().processor
     entity.async_setup(hass)
     template.async_setup(hass)
     await asyncio.gather(
@@ -254,6 +255,7 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
         restore_state.async_load(hass),
+        loader.async_load_integration_cache(hass),
     )
 
 
@@ -301,6 +303,7 @@ async def async_from_config_dict(
         return None
 
     await _async_set_up_integrations(hass, config)
+    hass.async_create_task(loader.async_save_integration_cache(hass))
 
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
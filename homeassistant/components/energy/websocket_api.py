@@ -275,6 +275,7 @@ async def ws_get_fossil_energy_consumption(
         "hour",
         {"energy": UnitOfEnergy.KILO_WATT_HOUR},
         {"mean", "change"},
+        priority=recorder.DBPriority.INTERACTIVE,
     )
 
     def _combine_change_statistics(
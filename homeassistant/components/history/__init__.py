@@ -10,7 +10,7 @@ import voluptuous as vol
 
 from homeassistant.components import frontend
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import DBPriority, get_instance, history
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
 from homeassistant.core import HomeAssistant, valid_entity_id
@@ -126,6 +126,7 @@ class HistoryPeriodView(HomeAssistantView):
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
+                priority=DBPriority.INTERACTIVE,
             ),
         )
 
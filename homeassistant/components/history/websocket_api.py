@@ -2,16 +2,21 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import threading
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import DBPriority, get_instance, history
+from homeassistant.components.recorder.state_intervals import (
+    RESOLUTIONS,
+    get_state_intervals,
+)
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -93,6 +98,31 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_get_state_intervals(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    resolution: int,
+    include_start_time_state: bool,
+) -> str:
+    """Fetch the downsampled states and convert them to json in the executor."""
+    return JSON_DUMP(
+        messages.result_message(
+            msg_id,
+            get_state_intervals(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                resolution,
+                include_start_time_state,
+            ),
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +133,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("resolution"): vol.In(RESOLUTIONS),
     }
 )
 @websocket_api.async_response
@@ -141,6 +172,22 @@ async def ws_get_history_during_period(
     include_start_time_state = msg["include_start_time_state"]
     no_attributes = msg["no_attributes"]
 
+    if resolution := msg.get("resolution"):
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_get_state_intervals,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                RESOLUTIONS[resolution],
+                include_start_time_state,
+                priority=DBPriority.INTERACTIVE,
+            )
+        )
+        return
+
     if (
         not include_start_time_state
         and entity_ids
@@ -166,12 +213,13 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            priority=DBPriority.INTERACTIVE,
         )
     )
 
 
 def _generate_stream_message(
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: Mapping[str, Any],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -263,6 +311,71 @@ def _generate_historical_response(
     )
 
 
+def _stream_columnar_historical_response(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    send_empty: bool,
+    cancelled: threading.Event,
+) -> float:
+    """Stream a historical response as chunks of columns.
+
+    Each chunk is sent as soon as it has been read from the database.
+    The last chunk also holds the start_time and end_time of the response.
+    Streaming stops when cancelled is set by the unsubscribe of the client.
+    """
+    last_time_ts = 0.0
+    pending: dict[str, dict[str, list[Any]]] | None = None
+    for chunk in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    ):
+        if cancelled.is_set():
+            # The client unsubscribed while we were reading the database
+            return last_time_ts
+        for columns in chunk.values():
+            if (
+                state_last_time := columns[COMPRESSED_STATE_LAST_UPDATED][-1]
+            ) > last_time_ts:
+                last_time_ts = state_last_time
+        if pending is not None:
+            hass.loop.call_soon_threadsafe(
+                connection.send_message,
+                JSON_DUMP(messages.event_message(msg_id, {"states": pending})),
+            )
+        pending = chunk
+
+    if pending is None:
+        if not send_empty:
+            return last_time_ts
+        pending = {}
+    last_time_dt = (
+        dt_util.utc_from_timestamp(last_time_ts) if last_time_ts else end_time
+    )
+    hass.loop.call_soon_threadsafe(
+        connection.send_message,
+        JSON_DUMP(
+            messages.event_message(
+                msg_id, _generate_stream_message(pending, start_time, last_time_dt)
+            )
+        ),
+    )
+    return last_time_ts
+
+
 async def _async_send_historical_states(
     hass: HomeAssistant,
     connection: ActiveConnection,
@@ -275,9 +388,33 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    cancelled: threading.Event,
+    columnar: bool = False,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    The columnar response is streamed from the executor, which stops when
+    cancelled is set.
+    """
     instance = get_instance(hass)
+    if columnar:
+        last_time_ts = await instance.async_add_executor_job(
+            _stream_columnar_historical_response,
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+            cancelled,
+            priority=DBPriority.INTERACTIVE,
+        )
+        return dt_util.utc_from_timestamp(last_time_ts) if last_time_ts else None
     last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
         _generate_historical_response,
         hass,
@@ -290,6 +427,7 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        priority=DBPriority.INTERACTIVE,
     )
     if payload:
         connection.send_message(payload)
@@ -325,12 +463,42 @@ def _events_to_compressed_states(
     return states_by_entity_ids
 
 
+def _events_to_columnar_states(
+    events: Iterable[Event], no_attributes: bool
+) -> dict[str, dict[str, list[Any]]]:
+    """Convert events to columns of states."""
+    columns_by_entity_ids: dict[str, dict[str, list[Any]]] = {}
+    for event in events:
+        state: State = event.data["new_state"]
+        if (columns := columns_by_entity_ids.get(state.entity_id)) is None:
+            columns = columns_by_entity_ids[state.entity_id] = {
+                COMPRESSED_STATE_STATE: [],
+                COMPRESSED_STATE_LAST_UPDATED: [],
+                COMPRESSED_STATE_LAST_CHANGED: [],
+            }
+            if not no_attributes or state.domain in history.NEED_ATTRIBUTE_DOMAINS:
+                columns[COMPRESSED_STATE_ATTRIBUTES] = []
+        columns[COMPRESSED_STATE_STATE].append(state.state)
+        columns[COMPRESSED_STATE_LAST_UPDATED].append(
+            dt_util.utc_to_timestamp(state.last_updated)
+        )
+        columns[COMPRESSED_STATE_LAST_CHANGED].append(
+            dt_util.utc_to_timestamp(state.last_changed)
+            if state.last_changed != state.last_updated
+            else None
+        )
+        if (attributes := columns.get(COMPRESSED_STATE_ATTRIBUTES)) is not None:
+            attributes.append(state.attributes)
+    return columns_by_entity_ids
+
+
 async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
     msg_id: int,
     stream_queue: asyncio.Queue[Event],
     no_attributes: bool,
+    columnar: bool,
 ) -> None:
     """Stream events from the queue."""
     while True:
@@ -347,7 +515,12 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
-        if history_states := _events_to_compressed_states(events, no_attributes):
+        history_states: Mapping[str, Any]
+        if columnar:
+            history_states = _events_to_columnar_states(events, no_attributes)
+        else:
+            history_states = _events_to_compressed_states(events, no_attributes)
+        if history_states:
             connection.send_message(
                 JSON_DUMP(
                     messages.event_message(
@@ -404,6 +577,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -443,6 +617,10 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    columnar = msg["columnar"]
+    # Set from the event loop when the client unsubscribes, the subscriptions
+    # of the connection can not be read from the executor
+    cancelled = threading.Event()
 
     if end_time and end_time <= utc_now:
         if (
@@ -455,7 +633,7 @@ async def ws_stream(
             _async_send_empty_response(connection, msg_id, start_time, end_time)
             return
 
-        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.subscriptions[msg_id] = callback(lambda: cancelled.set())
         connection.send_result(msg_id)
         await _async_send_historical_states(
             hass,
@@ -469,6 +647,8 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            cancelled,
+            columnar,
         )
         return
 
@@ -517,8 +697,15 @@ async def ws_stream(
         significant_changes_only=significant_changes_only,
         minimal_response=minimal_response,
     )
+
+    @callback
+    def _unsub_and_cancel() -> None:
+        """Unsubscribe from all events and stop streaming the history."""
+        cancelled.set()
+        _unsub()
+
     subscriptions_setup_complete_time = dt_util.utcnow()
-    connection.subscriptions[msg_id] = _unsub
+    connection.subscriptions[msg_id] = _unsub_and_cancel
     connection.send_result(msg_id)
     # Fetch everything from history
     last_event_time = await _async_send_historical_states(
@@ -533,6 +720,8 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        cancelled,
+        columnar,
     )
 
     if msg_id not in connection.subscriptions:
@@ -546,6 +735,7 @@ async def ws_stream(
             msg_id,
             stream_queue,
             no_attributes,
+            columnar,
         )
     )
 
@@ -574,4 +764,6 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        cancelled=cancelled,
+        columnar=columnar,
     )
@@ -10,7 +10,7 @@ from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder import DBPriority, get_instance
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import InvalidEntityFormatError
@@ -116,5 +116,9 @@ class LogbookView(HomeAssistantView):
             )
 
         return cast(
-            web.Response, await get_instance(hass).async_add_executor_job(json_events)
+            web.Response,
+            await get_instance(hass).async_add_executor_job(
+                json_events,
+                priority=DBPriority.INTERACTIVE,
+            ),
         )
@@ -11,7 +11,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder import DBPriority, get_instance
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
@@ -175,6 +175,7 @@ async def _async_get_ws_stream_events(
         formatter,
         event_processor,
         partial,
+        priority=DBPriority.INTERACTIVE,
     )
 
 
@@ -510,5 +511,6 @@ async def ws_get_events(
             start_time,
             end_time,
             event_processor,
+            priority=DBPriority.INTERACTIVE,
         )
     )
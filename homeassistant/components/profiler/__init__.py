@@ -14,7 +14,7 @@ from typing import Any, cast
 from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
@@ -22,6 +22,7 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util.job_stats import JobStats
 
 from .const import DOMAIN
 
@@ -35,6 +36,9 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_START_JOB_STATS = "start_job_stats"
+SERVICE_STOP_JOB_STATS = "stop_job_stats"
+SERVICE_LOG_JOB_STATS = "log_job_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -57,14 +61,19 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_START_JOB_STATS,
+    SERVICE_STOP_JOB_STATS,
+    SERVICE_LOG_JOB_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
+DEFAULT_MAX_JOBS = 20
 
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_MAX_JOBS = "max_jobs"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -254,6 +263,42 @@ async def async_setup_entry(  # noqa: C901
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
 
+    @callback
+    def _async_start_job_stats(call: ServiceCall) -> None:
+        if hass.job_stats is not None:
+            raise HomeAssistantError("Job stats already started")
+
+        hass.job_stats = JobStats()
+
+    @callback
+    def _async_stop_job_stats(call: ServiceCall) -> None:
+        if hass.job_stats is None:
+            raise HomeAssistantError("Job stats not running")
+
+        hass.job_stats = None
+
+    @callback
+    def _async_log_job_stats(call: ServiceCall) -> None:
+        """Log the jobs that spent the most time in the event loop."""
+        if (job_stats := hass.job_stats) is None:
+            raise HomeAssistantError("Job stats not running")
+
+        for stats in job_stats.as_list()[: call.data[CONF_MAX_JOBS]]:
+            _LOGGER.critical(
+                (
+                    "Job %s (%s, %s): %s calls, %.6fs total, %.6fs p50, %.6fs p99,"
+                    " %.6fs max"
+                ),
+                stats["name"],
+                stats["target"],
+                stats["integration"],
+                stats["calls"],
+                stats["total"],
+                stats["p50"],
+                stats["p99"],
+                stats["max"],
+            )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -348,6 +393,36 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_JOB_STATS,
+        _async_start_job_stats,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_JOB_STATS,
+        _async_stop_job_stats,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_JOB_STATS,
+        _async_log_job_stats,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_MAX_JOBS, default=DEFAULT_MAX_JOBS): vol.Range(
+                    min=1, max=1024
+                ),
+            }
+        ),
+    )
+
+    websocket_api.async_register_command(hass, websocket_job_stats)
+
     return True
 
 
@@ -358,9 +433,31 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
     hass.data.pop(DOMAIN)
+    hass.job_stats = None
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/job_stats"})
+@callback
+def websocket_job_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the time jobs spent running in the event loop."""
+    if (job_stats := hass.job_stats) is None:
+        connection.send_error(msg["id"], "not_running", "Job stats not running")
+        return
+    connection.send_result(
+        msg["id"],
+        {
+            "duration": time.perf_counter() - job_stats.started,
+            "jobs": job_stats.as_list(),
+        },
+    )
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -33,6 +33,7 @@ from .const import (  # noqa: F401
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD,
     SQLITE_URL_PREFIX,
+    DBPriority,
     SupportedDialect,
 )
 from .core import Recorder
@@ -49,12 +50,15 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_DB_READ_WORKERS = 4
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_DB_READ_WORKERS = "db_read_workers"
+CONF_PARTITION_TABLES = "partition_tables"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
@@ -108,6 +112,10 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_RETRY_WAIT, default=DEFAULT_DB_RETRY_WAIT
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_DB_READ_WORKERS, default=DEFAULT_DB_READ_WORKERS
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Optional(CONF_PARTITION_TABLES, default=False): cv.boolean,
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
@@ -141,6 +149,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    db_read_workers = conf[CONF_DB_READ_WORKERS]
+    partition_tables = conf[CONF_PARTITION_TABLES]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -158,6 +168,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
+        db_read_workers=db_read_workers,
+        partition_tables=partition_tables,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
     )
@@ -0,0 +1,221 @@
+"""Insert the rows of the event session in bulk.
+
+The rows are written with executemany Core inserts instead of going
+through the ORM unit of work. Rows that reference rows inserted in the
+same commit are resolved once the referenced rows have their ids.
+"""
+from __future__ import annotations
+
+from typing import Any, cast
+
+from sqlalchemy import Column, Table, insert
+from sqlalchemy.engine import Connection
+
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+from .db_schema import (
+    EVENT_ORIGIN_TO_IDX,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from .models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+_STATES_META_TABLE = cast(Table, StatesMeta.__table__)
+_EVENT_TYPES_TABLE = cast(Table, EventTypes.__table__)
+_STATE_ATTRIBUTES_TABLE = cast(Table, StateAttributes.__table__)
+_EVENT_DATA_TABLE = cast(Table, EventData.__table__)
+_EVENTS_TABLE = cast(Table, Events.__table__)
+_STATES_TABLE = cast(Table, States.__table__)
+
+
+class PendingRow:
+    """A row waiting to be inserted into the database."""
+
+    __slots__ = ("params", "refs", "row_id")
+
+    def __init__(self, params: dict[str, Any]) -> None:
+        """Initialize the pending row."""
+        self.params = params
+        self.refs: dict[str, PendingRow] | None = None
+        self.row_id: int | None = None
+
+    def set_ref(self, column: str, row: PendingRow) -> None:
+        """Set a column to the id of a row inserted in the same commit."""
+        if self.refs is None:
+            self.refs = {column: row}
+        else:
+            self.refs[column] = row
+
+    def resolve(self) -> dict[str, Any]:
+        """Return the params with the referenced row ids filled in."""
+        if refs := self.refs:
+            params = self.params
+            for column, row in refs.items():
+                params[column] = row.row_id
+        return self.params
+
+
+class PendingRows:
+    """Rows of the event session waiting to be inserted."""
+
+    __slots__ = (
+        "states_meta",
+        "event_types",
+        "state_attributes",
+        "event_data",
+        "events",
+        "states",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the pending rows."""
+        self.states_meta: list[PendingRow] = []
+        self.event_types: list[PendingRow] = []
+        self.state_attributes: list[PendingRow] = []
+        self.event_data: list[PendingRow] = []
+        self.events: list[PendingRow] = []
+        self.states: list[PendingRow] = []
+
+    def insert(self, connection: Connection) -> None:
+        """Insert the pending rows in the order they depend on each other.
+
+        The rows are kept until clear is called once the transaction is
+        committed. If the transaction is rolled back instead, reset_ids
+        must be called before the rows are inserted again.
+        """
+        for rows, table, primary_key in (
+            (self.states_meta, _STATES_META_TABLE, _STATES_META_TABLE.c.metadata_id),
+            (self.event_types, _EVENT_TYPES_TABLE, _EVENT_TYPES_TABLE.c.event_type_id),
+            (
+                self.state_attributes,
+                _STATE_ATTRIBUTES_TABLE,
+                _STATE_ATTRIBUTES_TABLE.c.attributes_id,
+            ),
+            (self.event_data, _EVENT_DATA_TABLE, _EVENT_DATA_TABLE.c.data_id),
+        ):
+            if rows:
+                _insert_returning_ids(connection, table, primary_key, rows)
+        if events := self.events:
+            # Nothing references the events so their ids are not needed
+            connection.execute(insert(_EVENTS_TABLE), [row.resolve() for row in events])
+        if states := self.states:
+            _insert_states(connection, states)
+
+    def reset_ids(self) -> None:
+        """Forget the ids of rows inserted in a transaction that was rolled back."""
+        for rows in (
+            self.states_meta,
+            self.event_types,
+            self.state_attributes,
+            self.event_data,
+            self.states,
+        ):
+            for row in rows:
+                row.row_id = None
+
+    def clear(self) -> None:
+        """Drop all pending rows."""
+        self.states_meta.clear()
+        self.event_types.clear()
+        self.state_attributes.clear()
+        self.event_data.clear()
+        self.events.clear()
+        self.states.clear()
+
+
+def event_row_from_event(event: Event) -> PendingRow:
+    """Create a pending Events row from a native event."""
+    context = event.context
+    return PendingRow(
+        {
+            "event_type_id": None,
+            "data_id": None,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "time_fired_ts": dt_util.utc_to_timestamp(event.time_fired),
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        }
+    )
+
+
+def state_row_from_event(event: Event, keep_entity_id: bool) -> PendingRow:
+    """Create a pending States row from a state_changed event."""
+    context = event.context
+    state: State | None = event.data.get("new_state")
+    params: dict[str, Any] = {
+        "entity_id": event.data["entity_id"] if keep_entity_id else None,
+        "state": None,
+        "last_updated_ts": None,
+        "last_changed_ts": None,
+        "old_state_id": None,
+        "attributes_id": None,
+        "metadata_id": None,
+        "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+        "context_id_bin": ulid_to_bytes_or_none(context.id),
+        "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+        "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+    }
+    # None state means the state was removed from the state machine
+    if state is None:
+        params["last_updated_ts"] = dt_util.utc_to_timestamp(event.time_fired)
+        return PendingRow(params)
+
+    params["state"] = state.state
+    params["last_updated_ts"] = dt_util.utc_to_timestamp(state.last_updated)
+    if state.last_updated != state.last_changed:
+        params["last_changed_ts"] = dt_util.utc_to_timestamp(state.last_changed)
+    return PendingRow(params)
+
+
+def _insert_returning_ids(
+    connection: Connection,
+    table: Table,
+    primary_key: Column[int],
+    rows: list[PendingRow],
+) -> None:
+    """Insert rows and set their row_id to the id they were assigned."""
+    if connection.dialect.insert_executemany_returning_sort_by_parameter_order:
+        result = connection.execute(
+            insert(table).returning(primary_key, sort_by_parameter_order=True),
+            [row.resolve() for row in rows],
+        )
+        for row, row_id in zip(rows, result.scalars()):
+            row.row_id = row_id
+        return
+
+    # The dialect can not return the ids of an executemany so
+    # each row has to be inserted on its own to get its id
+    stmt = insert(table)
+    for row in rows:
+        row.row_id = connection.execute(stmt, row.resolve()).inserted_primary_key[0]
+
+
+def _insert_states(connection: Connection, rows: list[PendingRow]) -> None:
+    """Insert States rows.
+
+    A state links to the previous state of the entity with old_state_id
+    and the previous state may be pending in the same commit. The rows
+    are inserted in runs that end before the first state whose previous
+    state has no id yet, which keeps the rows in the order they happened.
+    """
+    primary_key = _STATES_TABLE.c.state_id
+    start = 0
+    for index, row in enumerate(rows):
+        if (
+            start < index
+            and (refs := row.refs)
+            and (old_state := refs.get("old_state_id"))
+            and old_state.row_id is None
+        ):
+            _insert_returning_ids(
+                connection, _STATES_TABLE, primary_key, rows[start:index]
+            )
+            start = index
+    if start < len(rows):
+        _insert_returning_ids(connection, _STATES_TABLE, primary_key, rows[start:])
@@ -1,6 +1,6 @@
 """Recorder constants."""
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
@@ -73,3 +73,13 @@ class SupportedDialect(StrEnum):
     SQLITE = "sqlite"
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
+
+
+class DBPriority(IntEnum):
+    """The priority of a job in the database executor.
+
+    Jobs with a lower value run first.
+    """
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
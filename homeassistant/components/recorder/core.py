@@ -27,6 +27,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     MATCH_ALL,
 )
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
@@ -41,6 +42,12 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .bulk_insert import (
+    PendingRow,
+    PendingRows,
+    event_row_from_event,
+    state_row_from_event,
+)
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
@@ -59,6 +66,7 @@ from .const import (
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
     STATISTICS_ROWS_SCHEMA_VERSION,
+    DBPriority,
     SupportedDialect,
 )
 from .db_schema import (
@@ -68,17 +76,15 @@ from .db_schema import (
     TABLE_STATES,
     Base,
     EventData,
-    Events,
-    EventTypes,
     StateAttributes,
-    States,
-    StatesMeta,
     Statistics,
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .partitions import supports_partitions
+from .pool import MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -108,6 +114,7 @@ from .tasks import (
     EventTypeIDMigrationTask,
     ImportStatisticsTask,
     KeepAliveTask,
+    PartitionTablesTask,
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
@@ -157,9 +164,6 @@ DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
-# Pool size must accommodate Recorder thread + All db executors
-MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
-
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -176,6 +180,8 @@ class Recorder(threading.Thread):
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        db_read_workers: int,
+        partition_tables: bool,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
     ) -> None:
@@ -193,6 +199,8 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_workers = db_read_workers
+        self.partition_tables = partition_tables
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -215,6 +223,7 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._pending_rows = PendingRows()
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -231,6 +240,10 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.purge_progress: PurgeProgress | None = None
+        # The resolutions of the state intervals compiled for the entities
+        # without an interval, see state_intervals
+        self.state_intervals_seeded: set[int] = set()
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -291,7 +304,7 @@ class Recorder(threading.Thread):
         """Start the executor."""
         self._db_executor = DBInterruptibleThreadPoolExecutor(
             thread_name_prefix=DB_WORKER_PREFIX,
-            max_workers=MAX_DB_EXECUTOR_WORKERS,
+            max_workers=self.db_read_workers,
             shutdown_hook=self._shutdown_pool,
         )
 
@@ -315,6 +328,13 @@ class Recorder(threading.Thread):
                 return
 
             if (entity_id := event.data.get(ATTR_ENTITY_ID)) is None:
+                if event.event_type == EVENT_STATE_CHANGED_BATCH:
+                    # Record the coalesced state changes individually
+                    if EVENT_STATE_CHANGED not in exclude_event_types:
+                        for state_event in event.data["events"]:
+                            if entity_filter(state_event.data[ATTR_ENTITY_ID]):
+                                queue_put(event_task(state_event))
+                    return
                 queue_put(event_task(event))
                 return
 
@@ -363,10 +383,30 @@ class Recorder(threading.Thread):
 
     @callback
     def async_add_executor_job(
-        self, target: Callable[..., T], *args: Any
+        self,
+        target: Callable[..., T],
+        *args: Any,
+        priority: DBPriority = DBPriority.BACKGROUND,
     ) -> asyncio.Future[T]:
-        """Add an executor job from within the event loop."""
-        return self.hass.loop.run_in_executor(self._db_executor, target, *args)
+        """Add an executor job from within the event loop.
+
+        Jobs answering a user waiting on the result should be added
+        with the interactive priority so they run ahead of the
+        background jobs already queued.
+        """
+        if (executor := self._db_executor) is None:
+            return self.hass.loop.run_in_executor(None, target, *args)
+        return asyncio.wrap_future(
+            executor.submit_with_priority(priority, target, *args),
+            loop=self.hass.loop,
+        )
+
+    @callback
+    def async_db_executor_wait_stats(self) -> dict[str, dict[str, float]]:
+        """Return how long the database executor jobs waited for a worker."""
+        if (executor := self._db_executor) is None:
+            return {}
+        return executor.wait_stats()
 
     def _stop_executor(self) -> None:
         """Stop the executor."""
@@ -706,10 +746,10 @@ class Recorder(threading.Thread):
             # anything goes wrong in the run loop
             self._shutdown()
 
-    def _add_to_session(self, session: Session, obj: object) -> None:
-        """Add an object to the session."""
+    def _add_pending_row(self, rows: list[PendingRow], row: PendingRow) -> None:
+        """Add a row to be inserted at the next commit."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        rows.append(row)
 
     def _run(self) -> None:
         """Start processing events to save."""
@@ -775,9 +815,18 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        self._load_recent_shared_data()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
+    def _load_recent_shared_data(self) -> None:
+        """Warm up the attributes and event data caches from the newest rows."""
+        with session_scope(
+            session=self.get_session(), read_only=True
+        ) as session, contextlib.suppress(SQLAlchemyError):
+            self.state_attributes_manager.load_recent(session)
+            self.event_data_manager.load_recent(session)
+
     def _activate_and_set_db_ready(self) -> None:
         """Activate the table managers or schedule migrations and mark the db as ready."""
         with session_scope(session=self.get_session(), read_only=True) as session:
@@ -844,6 +893,11 @@ class Recorder(threading.Thread):
                         self.queue_task(EventIdMigrationTask())
                         self.use_legacy_events_index = True
 
+        if supports_partitions(self):
+            self.queue_task(PartitionTablesTask())
+        elif self.partition_tables:
+            _LOGGER.warning("Partitioned tables are only supported on PostgreSQL")
+
         # We must only set the db ready after we have set the table managers
         # to active if there is no data to migrate.
         #
@@ -1028,22 +1082,23 @@ class Recorder(threading.Thread):
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
+        pending_rows = self._pending_rows
+        dbevent = event_row_from_event(event)
 
         # Map the event_type to the EventTypes table
         event_type_manager = self.event_type_manager
         if pending_event_types := event_type_manager.get_pending(event.event_type):
-            dbevent.event_type_rel = pending_event_types
+            dbevent.set_ref("event_type_id", pending_event_types)
         elif event_type_id := event_type_manager.get(event.event_type, session, True):
-            dbevent.event_type_id = event_type_id
+            dbevent.params["event_type_id"] = event_type_id
         else:
-            event_types = EventTypes(event_type=event.event_type)
-            event_type_manager.add_pending(event_types)
-            self._add_to_session(session, event_types)
-            dbevent.event_type_rel = event_types
+            event_types = PendingRow({"event_type": event.event_type})
+            event_type_manager.add_pending(event.event_type, event_types)
+            self._add_pending_row(pending_rows.event_types, event_types)
+            dbevent.set_ref("event_type_id", event_types)
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_row(pending_rows.events, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1054,43 +1109,38 @@ class Recorder(threading.Thread):
         shared_data = shared_data_bytes.decode("utf-8")
         # Matching attributes found in the pending commit
         if pending_event_data := event_data_manager.get_pending(shared_data):
-            dbevent.event_data_rel = pending_event_data
+            dbevent.set_ref("data_id", pending_event_data)
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
             (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
-            dbevent.data_id = data_id
+            dbevent.params["data_id"] = data_id
         else:
             # No matching attributes found, save them in the DB
-            dbevent_data = EventData(shared_data=shared_data, hash=hash_)
-            event_data_manager.add_pending(dbevent_data)
-            self._add_to_session(session, dbevent_data)
-            dbevent.event_data_rel = dbevent_data
+            dbevent_data = PendingRow({"shared_data": shared_data, "hash": hash_})
+            event_data_manager.add_pending(shared_data, dbevent_data)
+            self._add_pending_row(pending_rows.event_data, dbevent_data)
+            dbevent.set_ref("data_id", dbevent_data)
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_row(pending_rows.events, dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
+        pending_rows = self._pending_rows
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        dbstate = state_row_from_event(event, not states_meta_manager.active)
+        params = dbstate.params
 
         states_manager = self.states_manager
         if old_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = old_state
+            dbstate.set_ref("old_state_id", old_state)
         elif old_state_id := states_manager.pop_committed(entity_id):
-            dbstate.old_state_id = old_state_id
-        if entity_removed:
-            dbstate.state = None
-        else:
-            states_manager.add_pending(entity_id, dbstate)
-
-        if states_meta_manager.active:
-            dbstate.entity_id = None
+            params["old_state_id"] = old_state_id
 
         if entity_id is None or not (
             shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
@@ -1101,9 +1151,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         # Map the entity_id to the StatesMeta table
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
-            dbstate.states_meta_rel = pending_states_meta
+            dbstate.set_ref("metadata_id", pending_states_meta)
         elif metadata_id := states_meta_manager.get(entity_id, session, True):
-            dbstate.metadata_id = metadata_id
+            params["metadata_id"] = metadata_id
         elif states_meta_manager.active and entity_removed:
             # If the entity was removed, we don't need to add it to the
             # StatesMeta table or record it in the pending commit
@@ -1111,17 +1161,16 @@ class Recorder(threading.Thread):
             # it either never existed or was just renamed.
             return
         else:
-            states_meta = StatesMeta(entity_id=entity_id)
-            states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
+            states_meta = PendingRow({"entity_id": entity_id})
+            states_meta_manager.add_pending(entity_id, states_meta)
+            self._add_pending_row(pending_rows.states_meta, states_meta)
+            dbstate.set_ref("metadata_id", states_meta)
 
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
+            dbstate.set_ref("attributes_id", pending_event_data)
         # Matching attributes id found in the cache
         elif (
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
@@ -1133,15 +1182,19 @@ class Recorder(threading.Thread):
                 )
             )
         ):
-            dbstate.attributes_id = attributes_id
+            params["attributes_id"] = attributes_id
         else:
             # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
-            state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
+            dbstate_attributes = PendingRow(
+                {"shared_attrs": shared_attrs, "hash": hash_}
+            )
+            state_attributes_manager.add_pending(shared_attrs, dbstate_attributes)
+            self._add_pending_row(pending_rows.state_attributes, dbstate_attributes)
+            dbstate.set_ref("attributes_id", dbstate_attributes)
 
-        self._add_to_session(session, dbstate)
+        if not entity_removed:
+            states_manager.add_pending(entity_id, dbstate)
+        self._add_pending_row(pending_rows.states, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1174,12 +1227,24 @@ class Recorder(threading.Thread):
 
                 tries += 1
                 time.sleep(self.db_retry_wait)
+                self._rollback_event_session()
+
+    def _rollback_event_session(self) -> None:
+        """Roll back a failed commit so it can be retried.
+
+        The pending rows are kept, but the ids they were given by the
+        rolled back inserts are no longer valid.
+        """
+        assert self.event_session is not None
+        self.event_session.rollback()
+        self._pending_rows.reset_ids()
 
     def _commit_event_session(self) -> None:
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
 
+        self._pending_rows.insert(session.connection())
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1191,6 +1256,7 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        self._pending_rows.clear()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1212,12 +1278,15 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_rows.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.state_intervals_seeded.clear()
+        statistics.get_statistics_period_cache(self.hass).clear()
 
         if not self.event_session:
             return
@@ -1392,6 +1461,12 @@ class Recorder(threading.Thread):
                 with contextlib.suppress(ImportError):
                     kwargs["connect_args"]["conv"] = build_mysqldb_conv()
 
+        if kwargs.get("poolclass") is not MutexPool:
+            # Keep a connection for the recorder thread and every db executor.
+            # The executors read while the recorder thread writes, which
+            # SQLite allows in WAL mode.
+            kwargs["pool_size"] = self.db_read_workers + 1
+
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
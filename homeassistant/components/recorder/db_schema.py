@@ -68,7 +68,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 42
+SCHEMA_VERSION = 43
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -78,6 +78,7 @@ TABLE_EVENT_TYPES = "event_types"
 TABLE_STATES = "states"
 TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_STATES_META = "states_meta"
+TABLE_STATES_INTERVALS = "states_intervals"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
@@ -101,6 +102,7 @@ ALL_TABLES = [
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATES_META,
+    TABLE_STATES_INTERVALS,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
@@ -622,6 +624,44 @@ class StatesMeta(Base):
         )
 
 
+class StatesIntervals(Base):
+    """Downsampled state history.
+
+    A row holds the state of an entity at the end of the periods
+    from its start until the start of the next row of the entity.
+    """
+
+    __table_args__ = (
+        Index(
+            "ix_states_intervals_metadata_id_resolution_start_ts",
+            "metadata_id",
+            "resolution",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATES_INTERVALS
+    id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("states_meta.metadata_id")
+    )
+    # The length of the periods in seconds
+    resolution: Mapped[int | None] = mapped_column(Integer)
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    state: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatesIntervals("
+            f"id={self.id}, metadata_id={self.metadata_id},"
+            f" resolution={self.resolution}, start_ts={self.start_ts},"
+            f" state='{self.state}'"
+            ")>"
+        )
+
+
 class StatisticsBase:
     """Statistics base class."""
 
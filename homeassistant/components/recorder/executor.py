@@ -2,13 +2,84 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import Future
 from concurrent.futures.thread import _threads_queues, _worker
+from heapq import heappop, heappush
+from itertools import count
+import queue
 import threading
-from typing import Any
+from time import monotonic
+from typing import Any, Final, TypeVar
 import weakref
 
 from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
+from .const import DBPriority
+
+_T = TypeVar("_T")
+
+# The None that tells a worker to exit is queued behind all jobs
+_EXIT_PRIORITY: Final = max(DBPriority) + 1
+
+
+class QueueWaitStats:
+    """Time jobs of one priority waited for a worker."""
+
+    __slots__ = ("jobs", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize the wait statistics."""
+        self.jobs = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, wait: float) -> None:
+        """Record the wait of one job."""
+        self.jobs += 1
+        self.total += wait
+        if wait > self.max:
+            self.max = wait
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the statistics as a dict."""
+        return {
+            "jobs": self.jobs,
+            "mean": self.total / self.jobs if self.jobs else 0.0,
+            "max": self.max,
+        }
+
+
+class _PriorityWorkQueue(queue.Queue[Any]):
+    """A work queue that hands out the jobs with the highest priority first.
+
+    Jobs with the same priority run in the order they were queued.
+    """
+
+    queue: list[tuple[int, int, float, Any]]
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        super().__init__()
+        self.next_priority = DBPriority.BACKGROUND
+        self.wait_stats = {priority: QueueWaitStats() for priority in DBPriority}
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = []
+        self._counter = count()
+
+    def _qsize(self) -> int:
+        return len(self.queue)
+
+    def _put(self, item: Any) -> None:
+        priority = _EXIT_PRIORITY if item is None else self.next_priority
+        heappush(self.queue, (priority, next(self._counter), monotonic(), item))
+
+    def _get(self) -> Any:
+        priority, _, queued, item = heappop(self.queue)
+        if item is not None:
+            self.wait_stats[DBPriority(priority)].record(monotonic() - queued)
+        return item
+
 
 def _worker_with_shutdown_hook(
     shutdown_hook: Callable[[], None], *args: Any, **kwargs: Any
@@ -25,6 +96,32 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
         """Init the executor with a shutdown hook support."""
         self._shutdown_hook: Callable[[], None] = kwargs.pop("shutdown_hook")
         super().__init__(*args, **kwargs)
+        self._priority_queue = _PriorityWorkQueue()
+        self._work_queue = self._priority_queue  # type: ignore[assignment]
+        self._priority_lock = threading.RLock()
+
+    def submit(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> Future[_T]:
+        """Submit a job with the background priority."""
+        return self.submit_with_priority(DBPriority.BACKGROUND, fn, *args, **kwargs)
+
+    def submit_with_priority(
+        self, priority: DBPriority, fn: Callable[..., _T], /, *args: Any, **kwargs: Any
+    ) -> Future[_T]:
+        """Submit a job that runs before the queued jobs with a lower priority."""
+        work_queue = self._priority_queue
+        with self._priority_lock:
+            work_queue.next_priority = priority
+            try:
+                return super().submit(fn, *args, **kwargs)
+            finally:
+                work_queue.next_priority = DBPriority.BACKGROUND
+
+    def wait_stats(self) -> dict[str, dict[str, float]]:
+        """Return how long the jobs of each priority waited for a worker."""
+        return {
+            priority.name.lower(): stats.as_dict()
+            for priority, stats in self._priority_queue.wait_stats.items()
+        }
 
     def _adjust_thread_count(self) -> None:
         """Overridden to add support for shutdown hook.
@@ -1,7 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import Iterator, MutableMapping
 from datetime import datetime
 from typing import Any
 
@@ -11,13 +11,15 @@ from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
 from ..filters import Filters
-from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS, STREAM_CHUNK_SIZE
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_significant_state_columns_with_session as _modern_get_significant_state_columns_with_session,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states as _modern_stream_significant_states,
 )
 
 # These are the APIs of this package
@@ -26,9 +28,11 @@ __all__ = [
     "SIGNIFICANT_DOMAINS",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_significant_state_columns_with_session",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states",
 ]
 
 
@@ -80,6 +84,35 @@ def get_last_state_changes(
     return _target(hass, number_of_states, entity_id)
 
 
+def get_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return the significant states of entities as columns."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_state_columns_with_session as _legacy_get_significant_state_columns_with_session,
+        )
+
+        _target = _legacy_get_significant_state_columns_with_session
+    else:
+        _target = _modern_get_significant_state_columns_with_session
+    return _target(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+    )
+
+
 def get_significant_states(
     hass: HomeAssistant,
     start_time: datetime,
@@ -181,3 +214,36 @@ def state_changes_during_period(
         limit,
         include_start_time_state,
     )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[dict[str, dict[str, list[Any]]]]:
+    """Stream significant states during a time period as chunks of columns."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            stream_significant_states as _legacy_stream_significant_states,
+        )
+
+        _target = _legacy_stream_significant_states
+    else:
+        _target = _modern_stream_significant_states
+    return _target(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+    )
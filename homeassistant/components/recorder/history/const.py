@@ -20,3 +20,6 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+# The maximum number of states in a chunk of streamed history
+STREAM_CHUNK_SIZE = 4096
@@ -6,6 +6,7 @@ from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
 from itertools import groupby
 from operator import attrgetter
+import sys
 import time
 from typing import Any, cast
 
@@ -16,7 +17,12 @@ from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import literal
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -42,6 +48,7 @@ from .const import (
     SIGNIFICANT_DOMAINS,
     SIGNIFICANT_DOMAINS_ENTITY_ID_LIKE,
     STATE_KEY,
+    STREAM_CHUNK_SIZE,
 )
 
 _BASE_STATES = (
@@ -226,6 +233,108 @@ def get_significant_states(
         )
 
 
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[dict[str, dict[str, list[Any]]]]:
+    """Stream significant states as columns.
+
+    The legacy schema is only read until the migration finishes so the
+    states are read at once and split into chunks afterwards.
+    """
+    states = get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    yield from _compressed_states_to_columns(
+        states, not significant_changes_only, chunk_size
+    )
+
+
+def get_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return the significant states of entities as columns."""
+    states = get_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        False,
+        False,
+        True,
+    )
+    columns: dict[str, dict[str, list[Any]]] = {}
+    for chunk in _compressed_states_to_columns(states, False, sys.maxsize):
+        columns.update(chunk)
+    return columns
+
+
+def _compressed_states_to_columns(
+    states: MutableMapping[str, list[State | dict[str, Any]]],
+    include_last_changed: bool,
+    chunk_size: int,
+) -> Iterator[dict[str, dict[str, list[Any]]]]:
+    """Convert compressed states to chunks of columns."""
+    chunk: dict[str, dict[str, list[Any]]] = {}
+    chunk_states = 0
+    for entity_id, entity_states in states.items():
+        columns: dict[str, list[Any]] | None = None
+        for comp_state in cast(list[dict[str, Any]], entity_states):
+            if columns is None:
+                columns = chunk[entity_id] = {
+                    COMPRESSED_STATE_STATE: [],
+                    COMPRESSED_STATE_LAST_UPDATED: [],
+                }
+                if include_last_changed:
+                    columns[COMPRESSED_STATE_LAST_CHANGED] = []
+                if COMPRESSED_STATE_ATTRIBUTES in comp_state:
+                    columns[COMPRESSED_STATE_ATTRIBUTES] = []
+            columns[COMPRESSED_STATE_STATE].append(comp_state[COMPRESSED_STATE_STATE])
+            columns[COMPRESSED_STATE_LAST_UPDATED].append(
+                comp_state[COMPRESSED_STATE_LAST_UPDATED]
+            )
+            if include_last_changed:
+                columns[COMPRESSED_STATE_LAST_CHANGED].append(
+                    comp_state.get(COMPRESSED_STATE_LAST_CHANGED)
+                )
+            if (attributes := columns.get(COMPRESSED_STATE_ATTRIBUTES)) is not None:
+                attributes.append(comp_state.get(COMPRESSED_STATE_ATTRIBUTES))
+            chunk_states += 1
+            if chunk_states >= chunk_size:
+                yield chunk
+                chunk = {}
+                chunk_states = 0
+                columns = None
+    if chunk:
+        yield chunk
+
+
 def _significant_states_stmt(
     schema_version: int,
     start_time: datetime,
@@ -5,6 +5,7 @@ from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
+import sys
 from typing import Any, cast
 
 from sqlalchemy import (
@@ -21,7 +22,12 @@ from sqlalchemy import (
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -35,12 +41,14 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
+    STREAM_CHUNK_SIZE,
 )
 
 _FIELD_MAP = {
@@ -209,6 +217,133 @@ def get_significant_states_with_session(
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            False,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = query
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        cast(list[str], entity_ids),
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[dict[str, dict[str, list[Any]]]]:
+    """Stream significant states as columns while they are read from the database.
+
+    Each chunk maps entity_ids to parallel lists of states, last_updated
+    timestamps and, when requested, last_changed timestamps and attributes.
+    A chunk holds at most chunk_size states. The states of an entity
+    continue in the next chunk when they do not fit in one chunk.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                True,
+            )
+        ):
+            return
+        rows, start_time_ts, entity_id_to_metadata_id = query
+        yield from _sorted_states_to_columns(
+            rows,
+            start_time_ts,
+            entity_id_to_metadata_id,
+            minimal_response,
+            not significant_changes_only,
+            no_attributes,
+            chunk_size,
+        )
+
+
+def get_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return the significant states of entities as columns.
+
+    Maps entity_ids to parallel lists of states, last_updated timestamps
+    and attributes, without creating a State for every row.
+    """
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            False,
+            False,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = query
+    columns: dict[str, dict[str, list[Any]]] = {}
+    # A chunk can hold all rows, so there is a single chunk
+    for chunk in _sorted_states_to_columns(
+        rows, start_time_ts, entity_id_to_metadata_id, False, False, False, sys.maxsize
+    ):
+        columns.update(chunk)
+    return columns
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    stream: bool,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Query the significant states sorted by metadata_id and last_updated_ts.
+
+    When streaming, the rows of windows longer than a day are fetched
+    in batches instead of at once.
+
+    Returns None when none of the entity_ids have states.
+    """
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
@@ -219,7 +354,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,14 +392,16 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        execute_stmt_lambda_element(
+            session,
+            stmt,
+            start_time if stream else None,
+            end_time,
+            orm_rows=False,
+        ),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -764,3 +901,83 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Iterator[dict[str, dict[str, list[Any]]]]:
+    """Convert SQL results into chunks of columns.
+
+    States must be sorted by metadata_id and last_updated.
+
+    With minimal response only the first state of an entity outside the
+    NEED_ATTRIBUTE_DOMAINS has attributes and the states in-between
+    are only included when the state changed. Like the compressed
+    states, the other entities always have attributes.
+    """
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    chunk: dict[str, dict[str, list[Any]]] = {}
+    chunk_states = 0
+
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        minimal = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        attr_cache: dict[str, dict[str, Any]] = {}
+        columns: dict[str, list[Any]] | None = None
+        first = True
+        prev_state: str | None = None
+        for row in group:
+            state: str = row[state_idx]
+            if minimal and not first and state == prev_state:
+                continue
+            if columns is None:
+                columns = chunk[entity_id] = {
+                    COMPRESSED_STATE_STATE: [],
+                    COMPRESSED_STATE_LAST_UPDATED: [],
+                }
+                if include_last_changed:
+                    columns[COMPRESSED_STATE_LAST_CHANGED] = []
+                if not minimal or (first and not no_attributes):
+                    columns[COMPRESSED_STATE_ATTRIBUTES] = []
+            columns[COMPRESSED_STATE_STATE].append(state)
+            last_updated_ts = row[last_updated_ts_idx] or start_time_ts
+            columns[COMPRESSED_STATE_LAST_UPDATED].append(last_updated_ts)
+            if include_last_changed:
+                last_changed_ts = None if minimal and not first else row.last_changed_ts
+                columns[COMPRESSED_STATE_LAST_CHANGED].append(
+                    last_changed_ts
+                    if last_changed_ts and last_changed_ts != last_updated_ts
+                    else None
+                )
+            if (attributes := columns.get(COMPRESSED_STATE_ATTRIBUTES)) is not None:
+                attributes.append(
+                    decode_attributes_from_source(
+                        getattr(row, "attributes", None), attr_cache
+                    )
+                    if first or not minimal
+                    else None
+                )
+            first = False
+            prev_state = state
+            chunk_states += 1
+            if chunk_states >= chunk_size:
+                yield chunk
+                chunk = {}
+                chunk_states = 0
+                columns = None
+
+    if chunk:
+        yield chunk
@@ -61,6 +61,7 @@ from .db_schema import (
     EventTypes,
     SchemaChanges,
     States,
+    StatesIntervals,
     StatesMeta,
     Statistics,
     StatisticsMeta,
@@ -1059,6 +1060,10 @@ def _apply_update(  # noqa: C901
         _migrate_statistics_columns_to_timestamp_removing_duplicates(
             hass, instance, session_maker, engine
         )
+    elif new_version == 43:
+        # The states_intervals table holds the downsampled state history. It
+        # may already have been created with the tables missing on startup.
+        cast(Table, StatesIntervals.__table__).create(engine, checkfirst=True)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
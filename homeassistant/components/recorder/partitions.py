@@ -0,0 +1,355 @@
+"""Maintain time partitioned tables on PostgreSQL.
+
+The states, events and statistics_short_term tables can be partitioned
+by range on their timestamp column. When the partition_tables option is
+set, the recorder converts the tables into partitioned ones. When it
+finds a table partitioned by range, it creates the daily partitions for
+the next days ahead of time and purges by dropping the partitions that
+only hold rows older than the purge time.
+
+Queries with a range on the timestamp column only read the partitions
+in that range. The history, logbook and statistics queries all filter
+on these columns.
+
+MySQL and MariaDB can not partition by range on the DOUBLE columns
+the timestamps are stored in, so only PostgreSQL is supported.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import re
+from typing import TYPE_CHECKING, Final
+
+from sqlalchemy import Column, ForeignKey, Identity, MetaData, Table, text
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.compiler import IdentifierPreparer
+
+import homeassistant.util.dt as dt_util
+
+from .const import SupportedDialect
+from .db_schema import TABLE_EVENTS, TABLE_STATES, TABLE_STATISTICS_SHORT_TERM, Base
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+# The tables that can be partitioned and the column they are partitioned by
+PARTITIONED_TABLES: Final = {
+    TABLE_STATES: "last_updated_ts",
+    TABLE_EVENTS: "time_fired_ts",
+    TABLE_STATISTICS_SHORT_TERM: "start_ts",
+}
+PARTITION_INTERVAL: Final = timedelta(days=1)
+# The number of partitions to create ahead of the current one
+PARTITIONS_AHEAD: Final = 3
+
+_BOUND_RE: Final = re.compile(r"FROM \(([^)]*)\) TO \(([^)]*)\)")
+
+_PARTITIONS: Final = text(
+    "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+    "FROM pg_inherits "
+    "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+    "WHERE parent.relname = :table_name AND parent.relkind = 'p' "
+    "AND pg_table_is_visible(parent.oid)"
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Partition:
+    """A range partition of a table.
+
+    A bound of None means the partition is not bounded on that side.
+    """
+
+    name: str
+    lower_ts: float | None
+    upper_ts: float | None
+    default: bool = False
+
+    def overlaps(self, lower_ts: float, upper_ts: float) -> bool:
+        """Return if the partition holds any rows in the range."""
+        if self.default:
+            return False
+        return (self.lower_ts is None or self.lower_ts < upper_ts) and (
+            self.upper_ts is None or self.upper_ts > lower_ts
+        )
+
+
+def supports_partitions(instance: Recorder) -> bool:
+    """Return if the database can have partitioned tables."""
+    return instance.dialect_name == SupportedDialect.POSTGRESQL
+
+
+def get_partitions(session: Session, table_name: str) -> list[Partition] | None:
+    """Return the range partitions of a table ordered by their range.
+
+    Returns None when the table is not partitioned.
+    """
+    partitions = [
+        _partition_from_bound(name, bound)
+        for name, bound in session.execute(_PARTITIONS, {"table_name": table_name})
+    ]
+    if not partitions:
+        return None
+    return sorted(
+        partitions,
+        key=lambda partition: (
+            partition.default,
+            partition.lower_ts is not None,
+            partition.lower_ts or 0,
+        ),
+    )
+
+
+def _partition_from_bound(name: str, bound: str) -> Partition:
+    """Create a Partition from a partition bound expression."""
+    if not (match := _BOUND_RE.search(bound)):
+        return Partition(name, None, None, default=True)
+    return Partition(name, _parse_bound(match.group(1)), _parse_bound(match.group(2)))
+
+
+def _parse_bound(bound: str) -> float | None:
+    """Parse the bound of a partition."""
+    bound = bound.strip().strip("'")
+    if bound.upper() in ("MINVALUE", "MAXVALUE"):
+        return None
+    return float(bound)
+
+
+def partitions_to_drop(
+    partitions: list[Partition], purge_before_ts: float
+) -> list[Partition]:
+    """Return the partitions that only hold rows older than purge_before_ts."""
+    return [
+        partition
+        for partition in partitions
+        if not partition.default
+        and partition.upper_ts is not None
+        and partition.upper_ts <= purge_before_ts
+    ]
+
+
+def partition_ranges_to_create(
+    table_name: str, partitions: list[Partition], now: datetime
+) -> list[tuple[str, float, float]]:
+    """Return the name and range of the partitions missing for the next days.
+
+    Ranges that overlap an existing partition are skipped.
+    """
+    start = dt_util.start_of_local_day(dt_util.as_local(now))
+    ranges: list[tuple[str, float, float]] = []
+    for day in range(PARTITIONS_AHEAD + 1):
+        lower = start + PARTITION_INTERVAL * day
+        lower_ts = lower.timestamp()
+        upper_ts = (lower + PARTITION_INTERVAL).timestamp()
+        if any(partition.overlaps(lower_ts, upper_ts) for partition in partitions):
+            continue
+        ranges.append((f"{table_name}_p{lower.strftime('%Y%m%d')}", lower_ts, upper_ts))
+    return ranges
+
+
+def create_partitions_ahead(session: Session) -> None:
+    """Create the partitions for the next days of the partitioned tables."""
+    now = dt_util.utcnow()
+    for table_name in PARTITIONED_TABLES:
+        if partitions := get_partitions(session, table_name):
+            _create_partitions_ahead(session, table_name, table_name, partitions, now)
+
+
+def _create_partitions_ahead(
+    session: Session,
+    table_name: str,
+    parent_name: str,
+    partitions: list[Partition],
+    now: datetime,
+) -> None:
+    """Create the partitions for the next days of a partitioned table."""
+    preparer = _identifier_preparer(session)
+    quoted_parent = preparer.quote(parent_name)
+    default = partitions[-1] if partitions[-1].default else None
+    for name, lower_ts, upper_ts in partition_ranges_to_create(
+        table_name, partitions, now
+    ):
+        _LOGGER.debug("Creating partition %s of %s", name, table_name)
+        statement = text(
+            create_partition_statement(preparer, parent_name, name, lower_ts, upper_ts)
+        )
+        column = preparer.quote(PARTITIONED_TABLES[table_name])
+        in_range = f"WHERE {column} >= :lower_ts AND {column} < :upper_ts"
+        params = {"lower_ts": lower_ts, "upper_ts": upper_ts}
+        if default is None or not (
+            session.execute(
+                text(
+                    f"SELECT 1 FROM {preparer.quote(default.name)} "  # noqa: S608
+                    f"{in_range} LIMIT 1"
+                ),
+                params,
+            ).first()
+        ):
+            session.execute(statement)
+            continue
+        # A partition can not be created for rows in the default partition,
+        # they are moved out while the default partition is detached
+        quoted_default = preparer.quote(default.name)
+        session.execute(
+            text(f"ALTER TABLE {quoted_parent} DETACH PARTITION {quoted_default}")
+        )
+        session.execute(statement)
+        session.execute(
+            text(
+                f"INSERT INTO {quoted_parent} "  # noqa: S608
+                f"SELECT * FROM {quoted_default} {in_range}"
+            ),
+            params,
+        )
+        session.execute(
+            text(f"DELETE FROM {quoted_default} {in_range}"),  # noqa: S608
+            params,
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {quoted_parent} ATTACH PARTITION {quoted_default} DEFAULT"
+            )
+        )
+
+
+def create_partition_statement(
+    preparer: IdentifierPreparer,
+    table_name: str,
+    name: str,
+    lower_ts: float | None,
+    upper_ts: float,
+) -> str:
+    """Return the statement to create a partition.
+
+    A lower bound of None creates a partition for all rows before upper_ts.
+    """
+    lower = "MINVALUE" if lower_ts is None else f"{lower_ts:.0f}"
+    return (
+        f"CREATE TABLE {preparer.quote(name)} PARTITION OF "
+        f"{preparer.quote(table_name)} FOR VALUES FROM ({lower}) TO ({upper_ts:.0f})"
+    )
+
+
+def drop_partition_statement(preparer: IdentifierPreparer, partition: Partition) -> str:
+    """Return the statement to drop a partition with its rows."""
+    return f"DROP TABLE {preparer.quote(partition.name)}"
+
+
+def partition_tables(session: Session) -> None:
+    """Convert the tables that are not partitioned yet into partitioned ones.
+
+    Each table is committed on its own, so a restart during the
+    conversion continues with the tables that are left.
+    """
+    for table_name in PARTITIONED_TABLES:
+        if get_partitions(session, table_name) is not None:
+            continue
+        _LOGGER.warning(
+            "Partitioning the %s table; this may take a while for a large table",
+            table_name,
+        )
+        _partition_table(session, table_name, dt_util.utcnow())
+        session.commit()
+
+
+def _partition_table(session: Session, table_name: str, now: datetime) -> None:
+    """Convert a table into one partitioned by range on its timestamp column.
+
+    PostgreSQL requires the primary key of a partitioned table to include
+    the partition column, and other tables can not reference the rows of a
+    partitioned table. The new table has the id and the timestamp as its
+    primary key and keeps only the foreign keys to tables that are not
+    partitioned. The rows from before today are all moved into a single
+    partition, which is dropped by the purge once it only holds old rows.
+    """
+    table = Base.metadata.tables[table_name]
+    partition_column = PARTITIONED_TABLES[table_name]
+    preparer = _identifier_preparer(session)
+    new_name = f"{table_name}_partitioned"
+    columns: list[Column] = []
+    for column in table.columns:
+        args: list[Identity | ForeignKey] = [
+            ForeignKey(foreign_key.column, ondelete=foreign_key.ondelete)
+            for foreign_key in column.foreign_keys
+            if foreign_key.column.table.name not in PARTITIONED_TABLES
+        ]
+        if column.primary_key:
+            args.append(Identity())
+        in_key = column.primary_key or column.name == partition_column
+        columns.append(
+            Column(
+                column.name,
+                column.type,
+                *args,
+                primary_key=in_key,
+                nullable=column.nullable and not in_key,
+            )
+        )
+    new_table = Table(
+        new_name,
+        MetaData(),
+        *columns,
+        postgresql_partition_by=f"RANGE ({preparer.quote(partition_column)})",
+    )
+    connection = session.connection()
+    new_table.create(connection)
+
+    start_ts = dt_util.start_of_local_day(dt_util.as_local(now)).timestamp()
+    archive = Partition(f"{table_name}_archive", None, start_ts)
+    # Rows with a timestamp no partition is created for are kept
+    default = Partition(f"{table_name}_default", None, None, default=True)
+    session.execute(
+        text(
+            create_partition_statement(preparer, new_name, archive.name, None, start_ts)
+        )
+    )
+    session.execute(
+        text(
+            f"CREATE TABLE {preparer.quote(default.name)} "
+            f"PARTITION OF {preparer.quote(new_name)} DEFAULT"
+        )
+    )
+    _create_partitions_ahead(session, table_name, new_name, [archive, default], now)
+
+    # Rows that predate the timestamp columns have no timestamp
+    names = [preparer.quote(column.name) for column in table.columns]
+    values = [
+        f"COALESCE({name}, 0)" if column.name == partition_column else name
+        for name, column in zip(names, table.columns)
+    ]
+    session.execute(
+        text(
+            f"INSERT INTO {preparer.quote(new_name)} ({', '.join(names)}) "  # noqa: S608
+            f"SELECT {', '.join(values)} FROM {preparer.quote(table_name)}"
+        )
+    )
+    for column in table.primary_key:
+        session.execute(
+            text(
+                "SELECT setval(pg_get_serial_sequence(:table_name, :column_name), "  # noqa: S608
+                f"COALESCE(MAX({preparer.quote(column.name)}), 0) + 1, false) "
+                f"FROM {preparer.quote(new_name)}"
+            ),
+            {"table_name": new_name, "column_name": column.name},
+        )
+
+    # CASCADE drops the foreign keys of other tables referencing the table
+    session.execute(text(f"DROP TABLE {preparer.quote(table_name)} CASCADE"))
+    session.execute(
+        text(
+            f"ALTER TABLE {preparer.quote(new_name)} "
+            f"RENAME TO {preparer.quote(table_name)}"
+        )
+    )
+    for index in table.indexes:
+        index.create(connection)
+
+
+def _identifier_preparer(session: Session) -> IdentifierPreparer:
+    """Return the identifier preparer of the dialect of the session."""
+    return session.get_bind().dialect.identifier_preparer
@@ -2,18 +2,35 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import zip_longest
 import logging
+import math
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
+from sqlalchemy import Select, text, update
 from sqlalchemy.orm.session import Session
 
 import homeassistant.util.dt as dt_util
 
-from .db_schema import Events, States, StatesMeta
+from .db_schema import (
+    TABLE_EVENTS,
+    TABLE_STATES,
+    Events,
+    States,
+    StatesMeta,
+    StatisticsShortTerm,
+)
 from .models import DatabaseEngine
+from .partitions import (
+    PARTITIONED_TABLES,
+    drop_partition_statement,
+    get_partitions,
+    partitions_to_drop,
+    supports_partitions,
+)
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -31,16 +48,25 @@ from .queries import (
     disconnect_states_rows,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_id_range_to_purge,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_states_id_range_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
 from .repack import repack_database
+from .state_intervals import (
+    delete_state_intervals_of_metadata_ids,
+    delete_state_intervals_rows,
+    find_entities_with_only_old_state_intervals,
+    find_state_intervals_to_purge,
+)
+from .statistics import get_statistics_period_cache
 from .util import chunked, retryable_database_job, session_scope
 
 if TYPE_CHECKING:
@@ -52,6 +78,43 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Stop purging batches and let the recorder catch up once
+# this many tasks are waiting in the queue
+MAX_BACKLOG_BEFORE_YIELD = 250
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Track the progress of purging the rows before purge_before."""
+
+    purge_before: datetime
+    started: datetime
+    states_to_purge: int
+    events_to_purge: int
+    states: int = 0
+    state_attributes: int = 0
+    events: int = 0
+    event_data: int = 0
+    short_term_statistics: int = 0
+    partitions: int = 0
+    finished: datetime | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        return {
+            "purge_before": self.purge_before,
+            "started": self.started,
+            "finished": self.finished,
+            "states": self.states,
+            "state_attributes": self.state_attributes,
+            "events": self.events,
+            "event_data": self.event_data,
+            "short_term_statistics": self.short_term_statistics,
+            "partitions": self.partitions,
+            "states_remaining": max(self.states_to_purge - self.states, 0),
+            "events_remaining": max(self.events_to_purge - self.events, 0),
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -70,10 +133,26 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
-    with session_scope(session=instance.get_session()) as session:
+    period_cache = get_statistics_period_cache(instance.hass)
+    with period_cache.write(), session_scope(session=instance.get_session()) as session:
+        purging_legacy_format = (
+            instance.use_legacy_events_index and _purging_legacy_format(session)
+        )
+        if (
+            progress := instance.purge_progress
+        ) is None or progress.purge_before != purge_before:
+            dropped_partitions = (
+                _drop_old_partitions(instance, session, purge_before)
+                if not purging_legacy_format and supports_partitions(instance)
+                else 0
+            )
+            progress = instance.purge_progress = _start_purge_progress(
+                session, purge_before
+            )
+            progress.partitions = dropped_partitions
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
-        if instance.use_legacy_events_index and _purging_legacy_format(session):
+        if purging_legacy_format:
             _LOGGER.debug(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
@@ -103,8 +182,23 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            progress.short_term_statistics += len(short_term_statistics)
+            period_cache.changed(
+                StatisticsShortTerm, None, -math.inf, purge_before.timestamp()
+            )
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
+        state_intervals = _select_state_intervals_to_purge(
+            session, purge_before, instance.max_bind_vars
+        )
+        if state_intervals:
+            _purge_state_intervals(session, state_intervals)
+
+        if (
+            has_more_to_purge
+            or statistics_runs
+            or short_term_statistics
+            or state_intervals
+        ):
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -119,14 +213,126 @@ def purge_old_data(
             _purge_old_event_types(instance, session)
 
         if instance.states_meta_manager.active:
+            _purge_state_intervals_of_removed_entities(instance, session, purge_before)
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
     if repack:
         repack_database(instance)
+    progress.finished = dt_util.utcnow()
     return True
 
 
+def _start_purge_progress(session: Session, purge_before: datetime) -> PurgeProgress:
+    """Start tracking the progress of a purge.
+
+    The number of rows to purge is estimated from the range of ids
+    before purge_before, which avoids counting the rows.
+    """
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    return PurgeProgress(
+        purge_before=purge_before,
+        started=dt_util.utcnow(),
+        states_to_purge=_estimate_rows_to_purge(
+            session, find_states_id_range_to_purge(purge_before_ts)
+        ),
+        events_to_purge=_estimate_rows_to_purge(
+            session, find_events_id_range_to_purge(purge_before_ts)
+        ),
+    )
+
+
+def _estimate_rows_to_purge(session: Session, id_range_stmt: Select) -> int:
+    """Estimate the number of rows to purge from the range of their ids."""
+    first_id, first_kept_id, last_id = session.execute(id_range_stmt).one()
+    if first_id is None:
+        return 0
+    if first_kept_id is None:
+        return int(last_id - first_id + 1)
+    return int(first_kept_id - first_id)
+
+
+def _drop_old_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> int:
+    """Drop the partitions that only hold rows older than purge_before.
+
+    Returns the number of partitions dropped.
+    """
+    preparer = session.get_bind().dialect.identifier_preparer
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    dropped = 0
+    for table_name in PARTITIONED_TABLES:
+        if not (partitions := get_partitions(session, table_name)):
+            continue
+        for partition in partitions_to_drop(partitions, purge_before_ts):
+            from_partition = preparer.quote(partition.name)
+            attributes_ids: set[int] = set()
+            data_ids: set[int] = set()
+            if table_name == TABLE_STATES:
+                attributes_ids = _disconnect_states_partition(
+                    instance, session, from_partition, cast(float, partition.upper_ts)
+                )
+            elif table_name == TABLE_EVENTS:
+                data_ids = {
+                    data_id
+                    for (data_id,) in session.execute(
+                        text(
+                            f"SELECT DISTINCT data_id FROM {from_partition}"  # noqa: S608
+                            " WHERE data_id IS NOT NULL"
+                        )
+                    )
+                }
+            _LOGGER.debug("Dropping partition %s of %s", partition.name, table_name)
+            session.execute(text(drop_partition_statement(preparer, partition)))
+            dropped += 1
+            for attributes_ids_chunk in chunked(attributes_ids, instance.max_bind_vars):
+                _purge_unused_attributes_ids(
+                    instance, session, set(attributes_ids_chunk)
+                )
+            for data_ids_chunk in chunked(data_ids, instance.max_bind_vars):
+                _purge_unused_data_ids(instance, session, set(data_ids_chunk))
+    return dropped
+
+
+def _disconnect_states_partition(
+    instance: Recorder, session: Session, from_partition: str, upper_ts: float
+) -> set[int]:
+    """Unlink the states in a partition about to be dropped.
+
+    Returns the attributes_ids used by the states in the partition.
+    """
+    if (
+        max_state_id := session.execute(
+            text(f"SELECT MAX(state_id) FROM {from_partition}")  # noqa: S608
+        ).scalar()
+    ) is None:
+        return set()
+    # The newer states may link to the states in the partition
+    session.execute(
+        update(States)
+        .where(States.old_state_id <= max_state_id)
+        .where(States.last_updated_ts >= upper_ts)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    instance.states_manager.evict_purged_state_ids_up_to(max_state_id)
+    return {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            text(
+                f"SELECT DISTINCT attributes_id FROM {from_partition}"  # noqa: S608
+                " WHERE attributes_id IS NOT NULL"
+            )
+        )
+    }
+
+
+def _should_yield(instance: Recorder) -> bool:
+    """Check if purging should stop to let the recorder work off its backlog."""
+    return instance.backlog > MAX_BACKLOG_BEFORE_YIELD
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -200,8 +406,17 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if progress := instance.purge_progress:
+            progress.states += len(state_ids)
+        if _should_yield(instance):
+            _LOGGER.debug("Yielding states purge to the recorder backlog")
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    purged_attributes = _purge_unused_attributes_ids(
+        instance, session, attributes_ids_batch
+    )
+    if progress := instance.purge_progress:
+        progress.state_attributes += purged_attributes
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -235,8 +450,15 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if progress := instance.purge_progress:
+            progress.events += len(event_ids)
+        if _should_yield(instance):
+            _LOGGER.debug("Yielding events purge to the recorder backlog")
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    purged_data = _purge_unused_data_ids(instance, session, data_ids_batch)
+    if progress := instance.purge_progress:
+        progress.event_data += purged_data
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -356,14 +578,15 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+) -> int:
+    """Purge unused attributes ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         session, attributes_ids_batch, database_engine
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return len(unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
@@ -400,13 +623,15 @@ def _select_unused_event_data_ids(
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+) -> int:
+    """Purge unused event data ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
         session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    return len(unused_data_ids_set)
 
 
 def _select_statistics_runs_to_purge(
@@ -441,6 +666,17 @@ def _select_short_term_statistics_to_purge(
     return [statistic_id for (statistic_id,) in statistics]
 
 
+def _select_state_intervals_to_purge(
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> list[int]:
+    """Return a list of 5-minute state intervals to purge."""
+    state_intervals = session.execute(
+        find_state_intervals_to_purge(purge_before, max_bind_vars)
+    ).all()
+    _LOGGER.debug("Selected %s state intervals to remove", len(state_intervals))
+    return [state_interval_id for (state_interval_id,) in state_intervals]
+
+
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -557,6 +793,37 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
+def _purge_state_intervals(session: Session, state_intervals: list[int]) -> None:
+    """Delete by id."""
+    deleted_rows = session.execute(delete_state_intervals_rows(state_intervals))
+    _LOGGER.debug("Deleted %s state intervals", deleted_rows)
+
+
+def _purge_state_intervals_of_removed_entities(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Delete the state intervals of the entities that were removed.
+
+    An entity without states and without intervals newer than purge_before
+    that is no longer in the state machine was removed. Its entity_id is
+    purged once its intervals are deleted.
+    """
+    states = instance.hass.states
+    metadata_ids = [
+        metadata_id
+        for metadata_id, entity_id in session.execute(
+            find_entities_with_only_old_state_intervals(purge_before)
+        )
+        if states.get(entity_id) is None
+    ]
+    purge_before_ts = purge_before.timestamp()
+    for metadata_ids_chunk in chunked(metadata_ids, instance.max_bind_vars):
+        deleted_rows = session.execute(
+            delete_state_intervals_of_metadata_ids(metadata_ids_chunk, purge_before_ts)
+        )
+        _LOGGER.debug("Deleted %s state intervals of removed entities", deleted_rows)
+
+
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
@@ -627,7 +894,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
     has_more_states_to_purge = False
-    excluded_metadata_ids: list[str] = [
+    excluded_metadata_ids: list[int] = [
         metadata_id
         for (metadata_id, entity_id) in session.query(
             StatesMeta.metadata_id, StatesMeta.entity_id
@@ -663,7 +930,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    metadata_ids_to_purge: list[str],
+    metadata_ids_to_purge: list[int],
     database_engine: DatabaseEngine,
     purge_before_timestamp: float,
 ) -> bool:
@@ -682,6 +949,12 @@ def _purge_filtered_states(
         .all()
     )
     if not to_purge:
+        deleted_rows = session.execute(
+            delete_state_intervals_of_metadata_ids(
+                metadata_ids_to_purge, purge_before_timestamp
+            )
+        )
+        _LOGGER.debug("Deleted %s state intervals of filtered entities", deleted_rows)
         return True
     state_ids, attributes_ids, event_ids = zip(*to_purge)
     filtered_event_ids = {id_ for id_ in event_ids if id_ is not None}
@@ -756,7 +1029,7 @@ def purge_entity_data(
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
     with session_scope(session=instance.get_session()) as session:
-        selected_metadata_ids: list[str] = [
+        selected_metadata_ids: list[int] = [
             metadata_id
             for (metadata_id, entity_id) in session.query(
                 StatesMeta.metadata_id, StatesMeta.entity_id
@@ -4,7 +4,16 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    delete,
+    distinct,
+    exists,
+    func,
+    lambda_stmt,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -15,6 +24,7 @@ from .db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesIntervals,
     StatesMeta,
     Statistics,
     StatisticsRuns,
@@ -51,6 +61,46 @@ def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def find_recent_shared_attributes(limit: int) -> Select:
+    """Find the shared attributes of the most recent states.
+
+    This query is intentionally not a lambda statement as it
+    only runs once at startup.
+    """
+    recent_states = (
+        select(States.attributes_id)
+        .order_by(States.state_id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    # Many of the recent states share their attributes
+    recent_attributes_ids = select(
+        distinct(recent_states.c.attributes_id).label("attributes_id")
+    ).subquery()
+    return select(StateAttributes.attributes_id, StateAttributes.shared_attrs).join(
+        recent_attributes_ids,
+        StateAttributes.attributes_id == recent_attributes_ids.c.attributes_id,
+    )
+
+
+def find_recent_shared_event_datas(limit: int) -> Select:
+    """Find the shared event data of the most recent events.
+
+    This query is intentionally not a lambda statement as it
+    only runs once at startup.
+    """
+    recent_events = (
+        select(Events.data_id).order_by(Events.event_id.desc()).limit(limit).subquery()
+    )
+    # Many of the recent events share their data
+    recent_data_ids = select(
+        distinct(recent_events.c.data_id).label("data_id")
+    ).subquery()
+    return select(EventData.data_id, EventData.shared_data).join(
+        recent_data_ids, EventData.data_id == recent_data_ids.c.data_id
+    )
+
+
 def find_event_type_ids(event_types: Iterable[str]) -> StatementLambdaElement:
     """Find an event_type id by event_type."""
     return lambda_stmt(
@@ -623,6 +673,40 @@ def find_events_to_purge(
     )
 
 
+def find_states_id_range_to_purge(purge_before: float) -> Select:
+    """Find the first state_id, the first state_id to keep and the last state_id.
+
+    This query is intentionally not a lambda statement as it
+    only runs once per purge.
+    """
+    return select(
+        select(func.min(States.state_id)).scalar_subquery(),
+        select(States.state_id)
+        .filter(States.last_updated_ts >= purge_before)
+        .order_by(States.last_updated_ts)
+        .limit(1)
+        .scalar_subquery(),
+        select(func.max(States.state_id)).scalar_subquery(),
+    )
+
+
+def find_events_id_range_to_purge(purge_before: float) -> Select:
+    """Find the first event_id, the first event_id to keep and the last event_id.
+
+    This query is intentionally not a lambda statement as it
+    only runs once per purge.
+    """
+    return select(
+        select(func.min(Events.event_id)).scalar_subquery(),
+        select(Events.event_id)
+        .filter(Events.time_fired_ts >= purge_before)
+        .order_by(Events.time_fired_ts)
+        .limit(1)
+        .scalar_subquery(),
+        select(func.max(Events.event_id)).scalar_subquery(),
+    )
+
+
 def find_states_to_purge(
     purge_before: float, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -829,9 +913,13 @@ def find_event_types_to_purge() -> StatementLambdaElement:
 
 
 def find_entity_ids_to_purge() -> StatementLambdaElement:
-    """Find entity_ids to purge."""
+    """Find entity_ids to purge.
+
+    The entity_ids of the downsampled state history are kept.
+    """
     return lambda_stmt(
-        lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id).where(
+        lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id)
+        .where(
             StatesMeta.metadata_id.not_in(
                 select(StatesMeta.metadata_id).join(
                     used_states_metadata_id := select(
@@ -842,6 +930,7 @@ def find_entity_ids_to_purge() -> StatementLambdaElement:
                 )
             )
         )
+        .where(~exists().where(StatesIntervals.metadata_id == StatesMeta.metadata_id))
     )
 
 
@@ -0,0 +1,358 @@
+"""Downsampled state history kept as run-length encoded intervals.
+
+The state of every entity at the end of each 5-minute and hourly period
+is compiled together with the statistics. A row is only written when the
+state differs from the state at the end of the previous period, so an
+entity that rarely changes needs few rows, no matter how long the range.
+Changes that are reverted before the end of a period are not kept.
+
+An entity without an interval, such as one recorded before the intervals
+were, starts from its latest state before the first period compiled for it.
+The entities without an interval are only looked up for the first period
+compiled after the recorder started, entities recorded later get their
+first interval from the period their first state was recorded in.
+
+The latest 5-minute interval of each entity is kept when purging, so a
+state that has not changed in a long time is still known. The intervals
+of an entity are purged with its entity_id when it has no states and no
+interval newer than the purge time left and is no longer in the state
+machine.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlalchemy import Select, delete, exists, func, insert, lambda_stmt, select
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .db_schema import States, StatesIntervals, StatesMeta
+from .models import extract_metadata_ids
+from .util import chunked, execute_stmt_lambda_element, get_instance, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+RESOLUTION_5MINUTE: Final = 300
+RESOLUTION_HOUR: Final = 3600
+
+RESOLUTIONS: Final[dict[str, int]] = {
+    "5minute": RESOLUTION_5MINUTE,
+    "hour": RESOLUTION_HOUR,
+}
+
+_NewerStatesIntervals = aliased(StatesIntervals)
+
+
+def _states_during_period_stmt(
+    start_ts: float, end_ts: float
+) -> StatementLambdaElement:
+    """Return the states changed during a period ordered by last_updated_ts."""
+    return lambda_stmt(
+        lambda: select(States.metadata_id, States.state)
+        .filter(States.last_updated_ts >= start_ts)
+        .filter(States.last_updated_ts < end_ts)
+        .filter(States.metadata_id.is_not(None))
+        .order_by(States.last_updated_ts)
+    )
+
+
+def _metadata_ids_without_intervals_stmt(resolution: int) -> StatementLambdaElement:
+    """Return the metadata_ids of the entities without an interval."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id).filter(
+            ~exists().where(
+                (StatesIntervals.metadata_id == StatesMeta.metadata_id)
+                & (StatesIntervals.resolution == resolution)
+            )
+        )
+    )
+
+
+def _latest_states_before(before_ts: float, metadata_ids: Iterable[int]) -> Select:
+    """Return the latest state of each entity that changed before before_ts.
+
+    This query is intentionally not a lambda statement as the
+    metadata_ids change every time it runs.
+    """
+    latest = (
+        select(
+            States.metadata_id.label("latest_metadata_id"),
+            func.max(States.last_updated_ts).label("latest_last_updated_ts"),
+        )
+        .filter(States.last_updated_ts < before_ts)
+        .filter(States.metadata_id.in_(metadata_ids))
+        .group_by(States.metadata_id)
+        .subquery()
+    )
+    return select(States.metadata_id, States.state).join(
+        latest,
+        (States.metadata_id == latest.c.latest_metadata_id)
+        & (States.last_updated_ts == latest.c.latest_last_updated_ts),
+    )
+
+
+def _latest_intervals_before(
+    resolution: int, before_ts: float, metadata_ids: Iterable[int]
+) -> Select:
+    """Return the latest interval of each entity that started before before_ts.
+
+    This query is intentionally not a lambda statement as the
+    metadata_ids change every time it runs.
+    """
+    latest = (
+        select(
+            StatesIntervals.metadata_id.label("latest_metadata_id"),
+            func.max(StatesIntervals.start_ts).label("latest_start_ts"),
+        )
+        .filter(StatesIntervals.resolution == resolution)
+        .filter(StatesIntervals.start_ts < before_ts)
+        .filter(StatesIntervals.metadata_id.in_(metadata_ids))
+        .group_by(StatesIntervals.metadata_id)
+        .subquery()
+    )
+    return select(
+        StatesIntervals.metadata_id, StatesIntervals.start_ts, StatesIntervals.state
+    ).join(
+        latest,
+        (StatesIntervals.metadata_id == latest.c.latest_metadata_id)
+        & (StatesIntervals.resolution == resolution)
+        & (StatesIntervals.start_ts == latest.c.latest_start_ts),
+    )
+
+
+def _intervals_during_period_stmt(
+    resolution: int, start_ts: float, end_ts: float, metadata_ids: list[int]
+) -> StatementLambdaElement:
+    """Return the intervals that started during a period."""
+    return lambda_stmt(
+        lambda: select(
+            StatesIntervals.metadata_id,
+            StatesIntervals.start_ts,
+            StatesIntervals.state,
+        )
+        .filter(StatesIntervals.resolution == resolution)
+        .filter(StatesIntervals.start_ts >= start_ts)
+        .filter(StatesIntervals.start_ts < end_ts)
+        .filter(StatesIntervals.metadata_id.in_(metadata_ids))
+        .order_by(StatesIntervals.metadata_id, StatesIntervals.start_ts)
+    )
+
+
+def compile_state_intervals(
+    instance: Recorder, session: Session, start: datetime
+) -> None:
+    """Compile the intervals of the 5-minute period starting at start.
+
+    The hourly intervals are compiled with the last period of each hour.
+    """
+    end = start + timedelta(minutes=5)
+    _compile_state_intervals(instance, session, RESOLUTION_5MINUTE, start, end)
+    if start.minute == 55:
+        _compile_state_intervals(
+            instance, session, RESOLUTION_HOUR, end - timedelta(hours=1), end
+        )
+
+
+def _compile_state_intervals(
+    instance: Recorder,
+    session: Session,
+    resolution: int,
+    start: datetime,
+    end: datetime,
+) -> None:
+    """Add an interval for each entity whose state changed during the period."""
+    start_ts = start.timestamp()
+    # The later states of an entity replace its earlier ones
+    end_states: dict[int, str | None] = {}
+    for metadata_id, state in execute_stmt_lambda_element(
+        session, _states_during_period_stmt(start_ts, end.timestamp())
+    ):
+        end_states[metadata_id] = state
+
+    # Entities without an interval that did not change during the period
+    # start from their latest state
+    unchanged_metadata_ids: list[int] = []
+    if resolution not in instance.state_intervals_seeded:
+        instance.state_intervals_seeded.add(resolution)
+        unchanged_metadata_ids = [
+            metadata_id
+            for (metadata_id,) in execute_stmt_lambda_element(
+                session, _metadata_ids_without_intervals_stmt(resolution)
+            )
+            if metadata_id not in end_states
+        ]
+    for metadata_ids in chunked(unchanged_metadata_ids, instance.max_bind_vars):
+        for metadata_id, state in session.execute(
+            _latest_states_before(start_ts, metadata_ids)
+        ):
+            end_states[metadata_id] = state
+    if not end_states:
+        return
+
+    for metadata_ids in chunked(end_states, instance.max_bind_vars):
+        for metadata_id, _, state in session.execute(
+            _latest_intervals_before(resolution, start_ts, metadata_ids)
+        ):
+            if end_states[metadata_id] == state:
+                del end_states[metadata_id]
+
+    if not end_states:
+        return
+    _LOGGER.debug(
+        "Adding %s state intervals of %ss at %s", len(end_states), resolution, start
+    )
+    session.execute(
+        insert(StatesIntervals),
+        [
+            {
+                "metadata_id": metadata_id,
+                "resolution": resolution,
+                "start_ts": start_ts,
+                "state": state,
+            }
+            for metadata_id, state in end_states.items()
+        ],
+    )
+
+
+def get_state_intervals(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    resolution: int,
+    include_start_time_state: bool = True,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the downsampled states of entities during a period.
+
+    The states are returned in the compressed state format with the
+    start of each interval as its last_updated. When include_start_time_state
+    is set, the state at start_time is returned as the first state.
+    """
+    instance = get_instance(hass)
+    start_time_ts = start_time.timestamp()
+    end_time_ts = (end_time or dt_util.utcnow()).timestamp()
+    with session_scope(hass=hass, read_only=True) as session:
+        entity_id_to_metadata_id = instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+        if not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+            return {}
+        metadata_id_to_entity_id = {
+            metadata_id: entity_id
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+        }
+        result: dict[str, list[dict[str, Any]]] = {}
+        if include_start_time_state:
+            for metadata_id, _, state in session.execute(
+                _latest_intervals_before(resolution, start_time_ts, metadata_ids)
+            ):
+                result[metadata_id_to_entity_id[metadata_id]] = [
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: start_time_ts,
+                    }
+                ]
+        for metadata_id, start_ts, state in execute_stmt_lambda_element(
+            session,
+            _intervals_during_period_stmt(
+                resolution, start_time_ts, end_time_ts, metadata_ids
+            ),
+        ):
+            compressed_state = {
+                COMPRESSED_STATE_STATE: state,
+                COMPRESSED_STATE_LAST_UPDATED: start_ts,
+            }
+            states = result.setdefault(metadata_id_to_entity_id[metadata_id], [])
+            if start_ts == start_time_ts and states:
+                # The interval replaces the state before start_time
+                states[0] = compressed_state
+            else:
+                states.append(compressed_state)
+    # Keep the order the entities were requested in
+    return {
+        entity_id: result[entity_id] for entity_id in entity_ids if entity_id in result
+    }
+
+
+def find_state_intervals_to_purge(
+    purge_before: datetime, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find the 5-minute state intervals to purge.
+
+    An interval is only purged when a newer interval of the entity started
+    before purge_before, so the state at purge_before is kept. The hourly
+    intervals are kept like the long term statistics, until the entity is
+    removed.
+    """
+    purge_before_ts = purge_before.timestamp()
+    return lambda_stmt(
+        lambda: select(StatesIntervals.id)
+        .filter(StatesIntervals.resolution == RESOLUTION_5MINUTE)
+        .filter(StatesIntervals.start_ts < purge_before_ts)
+        .filter(
+            exists().where(
+                (_NewerStatesIntervals.metadata_id == StatesIntervals.metadata_id)
+                & (_NewerStatesIntervals.resolution == RESOLUTION_5MINUTE)
+                & (_NewerStatesIntervals.start_ts > StatesIntervals.start_ts)
+                & (_NewerStatesIntervals.start_ts <= purge_before_ts)
+            )
+        )
+        .limit(max_bind_vars)
+    )
+
+
+def find_entities_with_only_old_state_intervals(
+    purge_before: datetime,
+) -> StatementLambdaElement:
+    """Find the entities that only have intervals that started before purge_before.
+
+    Entities that still have states are not returned.
+    """
+    purge_before_ts = purge_before.timestamp()
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id)
+        .filter(exists().where(StatesIntervals.metadata_id == StatesMeta.metadata_id))
+        .filter(
+            ~exists().where(
+                (StatesIntervals.metadata_id == StatesMeta.metadata_id)
+                & (StatesIntervals.start_ts >= purge_before_ts)
+            )
+        )
+        .filter(~exists().where(States.metadata_id == StatesMeta.metadata_id))
+    )
+
+
+def delete_state_intervals_rows(
+    state_intervals_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete states_intervals rows."""
+    return lambda_stmt(
+        lambda: delete(StatesIntervals)
+        .where(StatesIntervals.id.in_(state_intervals_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_state_intervals_of_metadata_ids(
+    metadata_ids: Iterable[int], purge_before_ts: float
+) -> StatementLambdaElement:
+    """Delete the states_intervals rows of entities that started before a time."""
+    return lambda_stmt(
+        lambda: delete(StatesIntervals)
+        .where(StatesIntervals.metadata_id.in_(metadata_ids))
+        .where(StatesIntervals.start_ts < purge_before_ts)
+        .execution_options(synchronize_session=False)
+    )
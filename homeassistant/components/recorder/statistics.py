@@ -2,22 +2,36 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
-from operator import itemgetter
+import math
+from operator import attrgetter, itemgetter
 import re
-from statistics import mean
+import threading
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from lru import LRU  # pylint: disable=no-name-in-module
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    case,
+    func,
+    lambda_stmt,
+    literal_column,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError, StatementError
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
@@ -68,6 +82,7 @@ from .models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
 )
+from .state_intervals import compile_state_intervals
 from .util import (
     execute,
     execute_stmt_lambda_element,
@@ -143,6 +158,8 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_PERIOD_CACHE = "recorder_statistics_period_cache"
+STATISTICS_PERIOD_CACHE_SIZE = 64
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -175,6 +192,157 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class _CachedPeriodStatistics:
+    """Statistics read for a period and the data they were read from."""
+
+    result: Any
+    tables: tuple[type[StatisticsBase], ...]
+    # The metadata_ids the statistics were read for, None for all
+    metadata_ids: set[int] | None
+    # The start_ts of the first and after the last row that was read
+    start_ts: float
+    end_ts: float
+    # The units of the states the statistics were converted for
+    state_units: dict[str, str | None]
+
+    def changed_by(
+        self,
+        table: type[StatisticsBase] | None,
+        metadata_ids: set[int] | None,
+        start_ts: float,
+        end_ts: float,
+    ) -> bool:
+        """Return if a change to rows from start_ts to end_ts affects the entry."""
+        return (
+            (table is None or table in self.tables)
+            and (
+                metadata_ids is None
+                or self.metadata_ids is None
+                or not metadata_ids.isdisjoint(self.metadata_ids)
+            )
+            and start_ts < self.end_ts
+            and end_ts >= self.start_ts
+        )
+
+
+class StatisticsPeriodCache:
+    """Cache for statistics read for periods.
+
+    Entries are dropped when the statistics of their metadata_ids are
+    written within their period, or when statistics metadata changes.
+
+    Statistics are written in write blocks, which drop the affected
+    entries once the writes are committed. Results read while a write
+    block is open are not cached, since they may predate the commit.
+    """
+
+    __slots__ = ("_lock", "_entries", "_generation", "_writers", "_changes")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[Any, ...], _CachedPeriodStatistics] = LRU(
+            STATISTICS_PERIOD_CACHE_SIZE
+        )
+        self._generation = 0
+        self._writers = 0
+        self._changes: list[
+            tuple[type[StatisticsBase] | None, set[int] | None, float, float]
+        ] = []
+
+    @property
+    def generation(self) -> int:
+        """Return the generation, which must be read before reading statistics."""
+        return self._generation
+
+    def get_statistics(self, hass: HomeAssistant, key: tuple[Any, ...]) -> Any | None:
+        """Return the cached statistics for a key."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry.state_units != _get_state_units(
+            hass, entry.state_units
+        ):
+            return None
+        return entry.result
+
+    def set_statistics(
+        self,
+        key: tuple[Any, ...],
+        generation: int,
+        entry: _CachedPeriodStatistics,
+    ) -> None:
+        """Cache statistics read since generation."""
+        with self._lock:
+            if not self._writers and generation == self._generation:
+                self._entries[key] = entry
+
+    @contextlib.contextmanager
+    def write(self) -> Generator[None, None, None]:
+        """Drop the entries changed in the block when it exits."""
+        with self._lock:
+            self._writers += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._writers -= 1
+                self._generation += 1
+                if not self._writers:
+                    self._apply_changes()
+
+    def changed(
+        self,
+        table: type[StatisticsBase] | None,
+        metadata_ids: set[int] | None,
+        start_ts: float,
+        end_ts: float | None = None,
+    ) -> None:
+        """Record a change to statistics rows starting from start_ts to end_ts.
+
+        A table or metadata_ids of None changes all tables or all metadata_ids.
+        Outside a write block the change is applied immediately.
+        """
+        with self._lock:
+            self._changes.append(
+                (table, metadata_ids, start_ts, start_ts if end_ts is None else end_ts)
+            )
+            if not self._writers:
+                self._generation += 1
+                self._apply_changes()
+
+    def changed_metadata(self) -> None:
+        """Record a change to statistics metadata, which drops all entries."""
+        self.changed(None, None, -math.inf, math.inf)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def _apply_changes(self) -> None:
+        """Drop the entries affected by the recorded changes."""
+        changes = self._changes
+        self._changes = []
+        entries = self._entries
+        for key, entry in list(entries.items()):
+            if any(entry.changed_by(*change) for change in changes):
+                del entries[key]
+
+
+def _get_state_units(
+    hass: HomeAssistant, statistic_ids: Iterable[str]
+) -> dict[str, str | None]:
+    """Return the units of the states of statistics."""
+    return {
+        statistic_id: state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if (state := hass.states.get(statistic_id))
+        else None
+        for statistic_id in statistic_ids
+    }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -438,7 +606,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
     # Commit every 12 hours of data
     commit_interval = 60 / period_size * 12
 
-    with session_scope(
+    with get_statistics_period_cache(instance.hass).write(), session_scope(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
@@ -470,7 +638,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     The actual calculation is delegated to the platforms.
     """
     # Return if we already have 5-minute statistics for the requested period
-    with session_scope(
+    with get_statistics_period_cache(instance.hass).write(), session_scope(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
@@ -556,9 +724,20 @@ def _compile_statistics(
         ):
             new_short_term_stats.append(new_stat)
 
+    period_cache = get_statistics_period_cache(instance.hass)
+    if updated_metadata_ids:
+        period_cache.changed(
+            StatisticsShortTerm, updated_metadata_ids, start.timestamp()
+        )
+    if modified_statistic_ids:
+        period_cache.changed_metadata()
+
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        period_cache.changed(Statistics, None, start.replace(minute=0).timestamp())
+
+    compile_state_intervals(instance, session, start)
 
     session.add(StatisticsRuns(start=start))
 
@@ -703,8 +882,10 @@ def get_metadata(
 
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
-    with session_scope(session=instance.get_session()) as session:
+    period_cache = get_statistics_period_cache(instance.hass)
+    with period_cache.write(), session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+        period_cache.changed_metadata()
 
 
 def update_statistics_metadata(
@@ -715,19 +896,24 @@ def update_statistics_metadata(
 ) -> None:
     """Update statistics metadata for a statistic_id."""
     statistics_meta_manager = instance.statistics_meta_manager
+    period_cache = get_statistics_period_cache(instance.hass)
     if new_unit_of_measurement is not UNDEFINED:
-        with session_scope(session=instance.get_session()) as session:
+        with period_cache.write(), session_scope(
+            session=instance.get_session()
+        ) as session:
             statistics_meta_manager.update_unit_of_measurement(
                 session, statistic_id, new_unit_of_measurement
             )
+            period_cache.changed_metadata()
     if new_statistic_id is not UNDEFINED and new_statistic_id is not None:
-        with session_scope(
+        with period_cache.write(), session_scope(
             session=instance.get_session(),
             exception_filter=_filter_unique_constraint_integrity_error(instance),
         ) as session:
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+            period_cache.changed_metadata()
 
 
 async def async_list_statistic_ids(
@@ -856,65 +1042,6 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
-def _reduce_statistics(
-    stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
-    period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
-    _want_mean = "mean" in types
-    _want_min = "min" in types
-    _want_max = "max" in types
-    _want_last_reset = "last_reset" in types
-    _want_state = "state" in types
-    _want_sum = "sum" in types
-    for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
-
-    return result
-
-
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -952,17 +1079,6 @@ def reduce_day_ts_factory() -> (
     return _same_day_ts, _day_start_end_ts_cached
 
 
-def _reduce_statistics_per_day(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
-
-
 def reduce_week_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -1002,17 +1118,6 @@ def reduce_week_ts_factory() -> (
     return _same_week_ts, _week_start_end_ts_cached
 
 
-def _reduce_statistics_per_week(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
-
-
 def _find_month_end_time(timestamp: datetime) -> datetime:
     """Return the end of the month (midnight at the first day of the next month)."""
     # We add 4 days to the end to make sure we are in the next month
@@ -1059,17 +1164,236 @@ def reduce_month_ts_factory() -> (
     return _same_month_ts, _month_start_end_ts_cached
 
 
-def _reduce_statistics_per_month(
-    stats: dict[str, list[StatisticsRow]],
+_PERIOD_START_END_FACTORIES: dict[
+    str,
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
+def _period_boundaries(
+    first_ts: float,
+    last_ts: float,
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> list[float]:
+    """Return the start of each period from first_ts to last_ts and the last end."""
+    boundaries = [period_start_end(first_ts)[0]]
+    while boundaries[-1] <= last_ts:
+        boundaries.append(period_start_end(boundaries[-1])[1])
+    return boundaries
+
+
+def _period_index_expr(
+    start_ts: InstrumentedAttribute[float | None],
+    boundaries: list[float],
+    low: int,
+    high: int,
+) -> ColumnElement[Any]:
+    """Return an expression for the index of the period a row starts in.
+
+    The periods from boundaries[low] to boundaries[high] are searched with
+    a balanced tree of comparisons. Since the boundaries are calculated in
+    the local time zone by the period factories, the periods are the same
+    for all database engines.
+    """
+    if high - low == 1:
+        return literal_column(str(low))
+    middle = (low + high) // 2
+    return case(
+        (
+            start_ts < literal_column(repr(boundaries[middle])),
+            _period_index_expr(start_ts, boundaries, low, middle),
+        ),
+        else_=_period_index_expr(start_ts, boundaries, middle, high),
+    )
+
+
+def _filter_statistics_during_period(
+    stmt: Select,
+    table: type[StatisticsBase],
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+) -> Select:
+    """Filter a query to the statistics during a period."""
+    stmt = stmt.where(table.start_ts >= start_time.timestamp())
+    if end_time is not None:
+        stmt = stmt.where(table.start_ts < end_time.timestamp())
+    if metadata_ids:
+        stmt = stmt.where(table.metadata_id.in_(metadata_ids))
+    return stmt
+
+
+def _generate_reduced_statistics_during_period_stmt(
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    boundaries: list[float],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Select:
+    """Prepare a database query for hourly statistics reduced to periods.
+
+    The mean, min and max are aggregated per period, while the last_reset,
+    state and sum are taken from the last statistics of the period.
+    """
+    table = Statistics
+    row_columns: list[Any] = [
+        table.metadata_id,
+        _period_index_expr(table.start_ts, boundaries, 0, len(boundaries) - 1).label(
+            "period"
+        ),
+        table.start_ts,
+    ]
+    for stat_type, column in (
+        ("mean", table.mean),
+        ("min", table.min),
+        ("max", table.max),
+    ):
+        if stat_type in types:
+            row_columns.append(column)
+    rows = _filter_statistics_during_period(
+        select(*row_columns), table, start_time, end_time, metadata_ids
+    ).subquery()
+
+    period_columns: list[Any] = [
+        rows.c.metadata_id,
+        rows.c.period,
+        func.max(rows.c.start_ts).label("last_start_ts"),
+    ]
+    if "mean" in types:
+        period_columns.append(func.avg(rows.c.mean).label("mean"))
+    if "min" in types:
+        period_columns.append(func.min(rows.c.min).label("min"))
+    if "max" in types:
+        period_columns.append(func.max(rows.c.max).label("max"))
+    periods = (
+        select(*period_columns).group_by(rows.c.metadata_id, rows.c.period).subquery()
+    )
+
+    last_columns = [
+        column
+        for stat_type, column in (
+            ("last_reset", table.last_reset_ts),
+            ("state", table.state),
+            ("sum", table.sum),
+        )
+        if stat_type in types
+    ]
+    stmt = select(periods, *last_columns)
+    if last_columns:
+        stmt = stmt.join(
+            table,
+            and_(
+                table.metadata_id == periods.c.metadata_id,
+                table.start_ts == periods.c.last_start_ts,
+            ),
+        )
+    return stmt.order_by(periods.c.metadata_id, periods.c.period)
+
+
+def _reduce_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: str,
+    units: dict[str, str] | None,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
+    """Reduce hourly statistics to days, weeks or months in the database.
+
+    The results are the same as reducing the hourly statistics in Python,
+    except for rounding of the mean.
+    """
+    first_ts, last_ts = session.execute(
+        _filter_statistics_during_period(
+            select(func.min(Statistics.start_ts), func.max(Statistics.start_ts)),
+            Statistics,
+            start_time,
+            end_time,
+            metadata_ids,
+        )
+    ).one()
+    if first_ts is None:
+        return {}
+    _, period_start_end = _PERIOD_START_END_FACTORIES[period]()
+    boundaries = _period_boundaries(first_ts, last_ts, period_start_end)
+    stats = session.execute(
+        _generate_reduced_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, boundaries, types
+        )
+    ).all()
+    return _reduced_statistics_to_dict(
+        hass, stats, statistic_ids, metadata, boundaries, units, types
     )
 
 
+def _reduced_statistics_to_dict(
+    hass: HomeAssistant,
+    stats: Sequence[Row[Any]],
+    statistic_ids: set[str] | None,
+    _metadata: dict[str, tuple[int, StatisticMetaData]],
+    boundaries: list[float],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Convert statistics reduced to periods into a JSON friendly data structure."""
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    metadata = dict(_metadata.values())
+    stats_by_meta_id = {
+        meta_id: list(group)
+        for meta_id, group in groupby(stats, attrgetter("metadata_id"))
+    }
+    # Set all statistic IDs to empty lists in result set to maintain the order
+    if statistic_ids is not None:
+        seen_statistic_ids = {
+            metadata[meta_id]["statistic_id"] for meta_id in stats_by_meta_id
+        }
+        for stat_id in statistic_ids:
+            if stat_id in seen_statistic_ids:
+                result[stat_id] = []
+
+    value_types = [
+        stat_type
+        for stat_type in ("mean", "min", "max", "state", "sum")
+        if stat_type in types
+    ]
+    want_last_reset = "last_reset" in types
+    for meta_id, stats_list in stats_by_meta_id.items():
+        metadata_by_id = metadata[meta_id]
+        statistic_id = metadata_by_id["statistic_id"]
+        state_unit = unit = metadata_by_id["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        convert = _get_statistic_to_display_unit_converter(unit, state_unit, units)
+        ent_results_append = result[statistic_id].append
+        for db_state in stats_list:
+            row = cast(
+                StatisticsRow,
+                {
+                    "start": boundaries[db_state.period],
+                    "end": boundaries[db_state.period + 1],
+                },
+            )
+            for stat_type in value_types:
+                value = getattr(db_state, stat_type)
+                row[stat_type] = convert(value) if convert else value  # type: ignore[literal-required]
+            if want_last_reset:
+                row["last_reset"] = db_state.last_reset_ts
+            ent_results_append(row)
+
+    return result
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1395,6 +1719,25 @@ def statistic_during_period(
 
     result: dict[str, Any] = {}
 
+    # Statistics of periods which have not ended depend on the current time,
+    # so only the statistics of periods which have ended are cached
+    period_cache = get_statistics_period_cache(hass)
+    cache_key: tuple[Any, ...] | None = None
+    cache_end_ts = math.inf
+    if end_time is not None and end_time <= dt_util.utcnow():
+        cache_end_ts = end_time.timestamp()
+        cache_key = (
+            "statistic_during_period",
+            start_time,
+            end_time,
+            statistic_id,
+            frozenset(types),
+            None if units is None else frozenset(units.items()),
+        )
+        if (cached := period_cache.get_statistics(hass, cache_key)) is not None:
+            return dict(cached)
+    generation = period_cache.generation
+
     with session_scope(hass=hass, read_only=True) as session:
         # Fetch metadata for the given statistic_id
         if not (
@@ -1520,9 +1863,23 @@ def statistic_during_period(
         state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
     convert = _get_statistic_to_display_unit_converter(unit, state_unit, units)
 
-    if not convert:
-        return result
-    return {key: convert(value) for key, value in result.items()}
+    if convert:
+        result = {key: convert(value) for key, value in result.items()}
+    if cache_key is not None:
+        period_cache.set_statistics(
+            cache_key,
+            generation,
+            _CachedPeriodStatistics(
+                dict(result),
+                (Statistics, StatisticsShortTerm),
+                {metadata_id},
+                # The oldest statistics decide which table is read from
+                -math.inf,
+                cache_end_ts,
+                _get_state_units(hass, (statistic_id,)),
+            ),
+        )
+    return result
 
 
 _type_column_mapping = {
@@ -1644,6 +2001,23 @@ def _statistics_during_period_with_session(
         # This is for backwards compatibility to avoid a breaking change
         # for custom integrations that call this method.
         statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
+    period_cache = get_statistics_period_cache(hass)
+    cache_key = (
+        "statistics_during_period",
+        start_time,
+        end_time,
+        None if statistic_ids is None else frozenset(statistic_ids),
+        period,
+        None if units is None else frozenset(units.items()),
+        frozenset(_types),
+        dt_util.DEFAULT_TIME_ZONE,
+    )
+    if (cached := period_cache.get_statistics(hass, cache_key)) is not None:
+        return {
+            statistic_id: [row.copy() for row in rows]
+            for statistic_id, rows in cached.items()
+        }
+    generation = period_cache.generation
     # Fetch metadata for the given (or all) statistic_ids
     metadata = get_instance(hass).statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
@@ -1695,43 +2069,68 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
-        hass,
-        session,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        start_time,
-        units,
-        types,
-    )
-
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
-
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
-
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+    result: dict[str, list[StatisticsRow]] = {}
+    if period in ("day", "week", "month"):
+        # Hourly statistics are reduced to the period in the database,
+        # so only one row per period is read
+        result = _reduce_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period,
+            units,
+            types,
+        )
+    elif stats := cast(
+        Sequence[Row],
+        execute_stmt_lambda_element(
+            session,
+            _generate_statistics_during_period_stmt(
+                start_time, end_time, metadata_ids, table, types
+            ),
+            orm_rows=False,
+        ),
+    ):
+        result = _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            units,
+            types,
+        )
 
-    if "change" in _types:
+    if result and "change" in _types:
         _augment_result_with_change(
             hass, session, start_time, units, _types, table, metadata, result
         )
 
+    period_cache.set_statistics(
+        cache_key,
+        generation,
+        _CachedPeriodStatistics(
+            {
+                statistic_id: [row.copy() for row in rows]
+                for statistic_id, rows in result.items()
+            },
+            (table,),
+            None
+            if statistic_ids is None
+            else {metadata_id for metadata_id, _ in metadata.values()},
+            # The change is calculated from the sum before the period
+            -math.inf if "change" in _types else start_time.timestamp(),
+            math.inf if end_time is None else end_time.timestamp(),
+            _get_state_units(hass, metadata),
+        ),
+    )
     # Return statistics combined with metadata
     return result
 
@@ -2295,14 +2694,18 @@ def _import_statistics_with_session(
     old_metadata_dict = statistics_meta_manager.get_many(
         session, statistic_ids={metadata["statistic_id"]}
     )
-    _, metadata_id = statistics_meta_manager.update_or_add(
+    modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    period_cache = get_statistics_period_cache(instance.hass)
+    if modified_statistic_id is not None:
+        period_cache.changed_metadata()
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        period_cache.changed(table, {metadata_id}, stat["start"].timestamp())
 
     if table != StatisticsShortTerm:
         return True
@@ -2317,6 +2720,12 @@ def _import_statistics_with_session(
     return True
 
 
+@singleton(DATA_STATISTICS_PERIOD_CACHE)
+def get_statistics_period_cache(hass: HomeAssistant) -> StatisticsPeriodCache:
+    """Get the cache for statistics read for periods."""
+    return StatisticsPeriodCache()
+
+
 @singleton(DATA_SHORT_TERM_STATISTICS_RUN_CACHE)
 def get_short_term_statistics_run_cache(
     hass: HomeAssistant,
@@ -2384,7 +2793,7 @@ def import_statistics(
 ) -> bool:
     """Process an import_statistics job."""
 
-    with session_scope(
+    with get_statistics_period_cache(instance.hass).write(), session_scope(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
@@ -2403,7 +2812,8 @@ def adjust_statistics(
 ) -> bool:
     """Process an add_statistics job."""
 
-    with session_scope(session=instance.get_session()) as session:
+    period_cache = get_statistics_period_cache(instance.hass)
+    with period_cache.write(), session_scope(session=instance.get_session()) as session:
         metadata = instance.statistics_meta_manager.get_many(
             session, statistic_ids={statistic_id}
         )
@@ -2431,6 +2841,12 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        period_cache.changed(
+            None,
+            {metadata[statistic_id][0]},
+            start_time.replace(minute=0).timestamp(),
+            math.inf,
+        )
 
     return True
 
@@ -2466,7 +2882,8 @@ def change_statistics_unit(
 ) -> None:
     """Change statistics unit for a statistic_id."""
     statistics_meta_manager = instance.statistics_meta_manager
-    with session_scope(session=instance.get_session()) as session:
+    period_cache = get_statistics_period_cache(instance.hass)
+    with period_cache.write(), session_scope(session=instance.get_session()) as session:
         metadata = statistics_meta_manager.get(session, statistic_id)
 
         # Guard against the statistics being removed or updated before the
@@ -2499,6 +2916,7 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+        period_cache.changed_metadata()
 
 
 @callback
@@ -54,6 +54,19 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_cache_info(instance: Recorder) -> dict[str, Any]:
+    """Get the hit ratios of the id caches."""
+    cache_info: dict[str, Any] = {}
+    for key, manager in (
+        ("state_attributes_cache_hit_ratio", instance.state_attributes_manager),
+        ("event_data_cache_hit_ratio", instance.event_data_manager),
+    ):
+        if (hit_ratio := manager.cache_stats()["hit_ratio"]) is not None:
+            cache_info[key] = f"{hit_ratio:.1%}"
+    return cache_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -71,4 +84,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | _async_get_cache_info(instance)
@@ -1,7 +1,8 @@
 """Managers for each table."""
 
 from collections.abc import MutableMapping
-from typing import TYPE_CHECKING, Generic, TypeVar
+import sys
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from lru import LRU  # pylint: disable=no-name-in-module
 
@@ -73,3 +74,110 @@ class BaseLRUTableManager(BaseTableManager[_DataT]):
         lru: LRU = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+# The number of cache lookups between adjustments of the LRU size
+ADAPT_LOOKUPS = 4096
+# Grow the LRU when more lookups than this miss in a window
+ADAPT_MISS_RATIO = 0.05
+# Estimated overhead of an LRU node and the cached id in bytes
+_LRU_ENTRY_OVERHEAD = 96
+
+
+class BaseAdaptiveLRUTableManager(BaseLRUTableManager[_DataT]):
+    """Base class for LRU table managers that size the LRU by its hit ratio."""
+
+    def __init__(self, recorder: "Recorder", lru_size: int, max_memory: int) -> None:
+        """Initialize the adaptive LRU table manager.
+
+        The hits and misses of the cache are counted and the LRU
+        grows while too many lookups miss, as long as the estimated
+        memory used by the cached data stays below max_memory bytes.
+        """
+        super().__init__(recorder, lru_size)
+        self._id_map = LRU(lru_size, callback=self._evicted)
+        self._max_memory = max_memory
+        # The size of the cached data, kept when data is cached or evicted
+        self._data_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._window_hits = 0
+        self._window_misses = 0
+
+    def _cache(self, data: str, data_id: int) -> None:
+        """Cache the id of data.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        if data not in id_map:
+            self._data_bytes += sys.getsizeof(data)
+        id_map[data] = data_id
+
+    def _evict(self, data: str) -> None:
+        """Evict data from the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._id_map.pop(data, None) is not None:
+            self._data_bytes -= sys.getsizeof(data)
+
+    def _evicted(self, data: str, data_id: int) -> None:
+        """Account for data the LRU evicted."""
+        self._data_bytes -= sys.getsizeof(data)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._data_bytes = 0
+
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve data to the id without accessing the underlying database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (data_id := self._id_map.get(data)) is None:
+            self._window_misses += 1
+        else:
+            self._window_hits += 1
+        if self._window_hits + self._window_misses >= ADAPT_LOOKUPS:
+            self._adapt_lru_size()
+        return data_id
+
+    def _adapt_lru_size(self) -> None:
+        """Adjust the LRU size to the hit ratio and memory of the last lookups."""
+        hits = self._window_hits
+        misses = self._window_misses
+        self.hits += hits
+        self.misses += misses
+        self._window_hits = self._window_misses = 0
+        lru: LRU = self._id_map
+        if not (cached := len(lru)):
+            return
+        size = lru.get_size()
+        entry_bytes = self._data_bytes // cached + _LRU_ENTRY_OVERHEAD
+        max_size = max(self._max_memory // entry_bytes, 1)
+        if size > max_size:
+            lru.set_size(max_size)
+        elif misses > (hits + misses) * ADAPT_MISS_RATIO and cached >= size:
+            lru.set_size(min(size * 2, max_size))
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return the hit ratio and size of the cache."""
+        hits = self.hits + self._window_hits
+        misses = self.misses + self._window_misses
+        lru: LRU = self._id_map
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits or misses else None,
+            "size": len(lru),
+            "max_size": lru.get_size(),
+        }
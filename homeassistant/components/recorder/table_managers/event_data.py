@@ -5,15 +5,17 @@ from collections.abc import Iterable
 import logging
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
+from ..bulk_insert import PendingRow
 from ..db_schema import EventData
-from ..queries import get_shared_event_datas
+from ..queries import find_recent_shared_event_datas, get_shared_event_datas
 from ..util import chunked, execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseAdaptiveLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -21,15 +23,18 @@ if TYPE_CHECKING:
 
 CACHE_SIZE = 2048
 
+# The estimated memory in bytes the cache may grow to when it misses too often
+MAX_CACHE_MEMORY = 8 * 1024 * 1024
+
 _LOGGER = logging.getLogger(__name__)
 
 
-class EventDataManager(BaseLRUTableManager[EventData]):
+class EventDataManager(BaseAdaptiveLRUTableManager[PendingRow]):
     """Manage the EventData table."""
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, MAX_CACHE_MEMORY)
         self.active = True  # always active
 
     def serialize_from_event(self, event: Event) -> bytes | None:
@@ -55,6 +60,18 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def load_recent(self, session: Session) -> None:
+        """Load the shared_data to data_ids mapping of the most recent events into memory.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        lru: LRU = self._id_map
+        for data_id, shared_data in session.execute(
+            find_recent_shared_event_datas(lru.get_size())
+        ):
+            self._cache(shared_data, data_id)
+
     def get(self, shared_data: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_datas to the data_id.
 
@@ -98,20 +115,17 @@ class EventDataManager(BaseLRUTableManager[EventData]):
                 for data_id, shared_data in execute_stmt_lambda_element(
                     session, get_shared_event_datas(hashs_chunk), orm_rows=False
                 ):
-                    results[shared_data] = self._id_map[shared_data] = cast(
-                        int, data_id
-                    )
+                    results[shared_data] = data_id
+                    self._cache(shared_data, data_id)
 
         return results
 
-    def add_pending(self, db_event_data: EventData) -> None:
+    def add_pending(self, shared_data: str, db_event_data: PendingRow) -> None:
         """Add a pending EventData that will be committed at the next interval.
 
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        assert db_event_data.shared_data is not None
-        shared_data: str = db_event_data.shared_data
         self._pending[shared_data] = db_event_data
 
     def post_commit_pending(self) -> None:
@@ -121,7 +135,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         recorder thread.
         """
         for shared_data, db_event_data in self._pending.items():
-            self._id_map[shared_data] = db_event_data.data_id
+            self._cache(shared_data, cast(int, db_event_data.row_id))
         self._pending.clear()
 
     def evict_purged(self, data_ids: set[int]) -> None:
@@ -136,4 +150,4 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         }
         # Evict any purged data from the cache
         for purged_data_id in data_ids.intersection(event_data_ids_reversed):
-            id_map.pop(event_data_ids_reversed[purged_data_id], None)
+            self._evict(event_data_ids_reversed[purged_data_id])
@@ -9,7 +9,7 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event
 
-from ..db_schema import EventTypes
+from ..bulk_insert import PendingRow
 from ..queries import find_event_type_ids
 from ..tasks import RefreshEventTypesTask
 from ..util import chunked, execute_stmt_lambda_element
@@ -22,7 +22,7 @@ if TYPE_CHECKING:
 CACHE_SIZE = 2048
 
 
-class EventTypeManager(BaseLRUTableManager[EventTypes]):
+class EventTypeManager(BaseLRUTableManager[PendingRow]):
     """Manage the EventTypes table."""
 
     def __init__(self, recorder: Recorder) -> None:
@@ -101,14 +101,12 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
 
         return results
 
-    def add_pending(self, db_event_type: EventTypes) -> None:
+    def add_pending(self, event_type: str, db_event_type: PendingRow) -> None:
         """Add a pending EventTypes that will be committed at the next interval.
 
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        assert db_event_type.event_type is not None
-        event_type: str = db_event_type.event_type
         self._pending[event_type] = db_event_type
 
     def post_commit_pending(self) -> None:
@@ -118,7 +116,7 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
         recorder thread.
         """
         for event_type, db_event_types in self._pending.items():
-            self._id_map[event_type] = db_event_types.event_type_id
+            self._id_map[event_type] = cast(int, db_event_types.row_id)
             self.clear_non_existent(event_type)
         self._pending.clear()
 
@@ -5,16 +5,18 @@ from collections.abc import Iterable
 import logging
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
+from ..bulk_insert import PendingRow
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import find_recent_shared_attributes, get_shared_attributes
 from ..util import chunked, execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseAdaptiveLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -27,15 +29,18 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The estimated memory in bytes the cache may grow to when it misses too often
+MAX_CACHE_MEMORY = 16 * 1024 * 1024
+
 _LOGGER = logging.getLogger(__name__)
 
 
-class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
+class StateAttributesManager(BaseAdaptiveLRUTableManager[PendingRow]):
     """Manage the StateAttributes table."""
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, MAX_CACHE_MEMORY)
         self.active = True  # always active
         self._entity_sources = entity_sources(recorder.hass)
 
@@ -68,6 +73,18 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def load_recent(self, session: Session) -> None:
+        """Load the shared_attrs to attributes_ids mapping of the most recent states into memory.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        lru: LRU = self._id_map
+        for attributes_id, shared_attrs in session.execute(
+            find_recent_shared_attributes(lru.get_size())
+        ):
+            self._cache(shared_attrs, attributes_id)
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
@@ -111,20 +128,17 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 for attributes_id, shared_attrs in execute_stmt_lambda_element(
                     session, get_shared_attributes(hashs_chunk), orm_rows=False
                 ):
-                    results[shared_attrs] = self._id_map[shared_attrs] = cast(
-                        int, attributes_id
-                    )
+                    results[shared_attrs] = attributes_id
+                    self._cache(shared_attrs, attributes_id)
 
         return results
 
-    def add_pending(self, db_state_attributes: StateAttributes) -> None:
+    def add_pending(self, shared_attrs: str, db_state_attributes: PendingRow) -> None:
         """Add a pending StateAttributes that will be committed at the next interval.
 
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        assert db_state_attributes.shared_attrs is not None
-        shared_attrs: str = db_state_attributes.shared_attrs
         self._pending[shared_attrs] = db_state_attributes
 
     def post_commit_pending(self) -> None:
@@ -134,7 +148,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         for shared_attrs, db_state_attributes in self._pending.items():
-            self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            self._cache(shared_attrs, cast(int, db_state_attributes.row_id))
         self._pending.clear()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
@@ -152,4 +166,4 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         for purged_attributes_id in attributes_ids.intersection(
             state_attributes_ids_reversed
         ):
-            id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+            self._evict(state_attributes_ids_reversed[purged_attributes_id])
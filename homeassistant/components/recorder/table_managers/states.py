@@ -1,7 +1,9 @@
 """Support managing States."""
 from __future__ import annotations
 
-from ..db_schema import States
+from typing import cast
+
+from ..bulk_insert import PendingRow
 
 
 class StatesManager:
@@ -9,10 +11,10 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, PendingRow] = {}
         self._last_committed_id: dict[str, int] = {}
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> PendingRow | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -33,7 +35,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: PendingRow) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -50,7 +52,7 @@ class StatesManager:
         recorder thread.
         """
         for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+            self._last_committed_id[entity_id] = cast(int, db_states.row_id)
         self._pending.clear()
 
     def reset(self) -> None:
@@ -80,6 +82,16 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_ids_up_to(self, max_state_id: int) -> None:
+        """Evict committed states with a state_id up to max_state_id.
+
+        This is used when a whole range of states is purged at once.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id, state_id in list(last_committed_ids.items()):
+            if state_id <= max_state_id:
+                del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -8,6 +8,7 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event
 
+from ..bulk_insert import PendingRow
 from ..db_schema import StatesMeta
 from ..queries import find_all_states_metadata_ids, find_states_metadata_ids
 from ..util import chunked, execute_stmt_lambda_element
@@ -19,7 +20,7 @@ if TYPE_CHECKING:
 CACHE_SIZE = 8192
 
 
-class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
+class StatesMetaManager(BaseLRUTableManager[PendingRow]):
     """Manage the StatesMeta table."""
 
     def __init__(self, recorder: Recorder) -> None:
@@ -115,14 +116,12 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
 
         return results
 
-    def add_pending(self, db_states_meta: StatesMeta) -> None:
+    def add_pending(self, entity_id: str, db_states_meta: PendingRow) -> None:
         """Add a pending StatesMeta that will be committed at the next interval.
 
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        assert db_states_meta.entity_id is not None
-        entity_id: str = db_states_meta.entity_id
         self._pending[entity_id] = db_states_meta
 
     def post_commit_pending(self) -> None:
@@ -132,7 +131,7 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         recorder thread.
         """
         for entity_id, db_states_meta in self._pending.items():
-            self._id_map[entity_id] = db_states_meta.metadata_id
+            self._id_map[entity_id] = cast(int, db_states_meta.row_id)
         self._pending.clear()
 
     def evict_purged(self, entity_ids: Iterable[str]) -> None:
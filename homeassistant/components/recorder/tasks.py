@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.core import Event
 from homeassistant.helpers.typing import UndefinedType
 
-from . import entity_registry, purge, statistics
+from . import entity_registry, partitions, purge, statistics
 from .const import DOMAIN
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
@@ -468,6 +468,22 @@ class EventIdMigrationTask(RecorderTask):
         instance._cleanup_legacy_states_event_ids()  # pylint: disable=[protected-access]
 
 
+@dataclass(slots=True)
+class PartitionTablesTask(RecorderTask):
+    """An object to insert into the recorder queue to maintain partitioned tables.
+
+    The tables are converted into partitioned ones first when the
+    partition_tables option is set.
+    """
+
+    def run(self, instance: Recorder) -> None:
+        """Partition the tables and create their partitions for the next days."""
+        with session_scope(session=instance.get_session()) as session:
+            if instance.partition_tables:
+                partitions.partition_tables(session)
+            partitions.create_partitions_ahead(session)
+
+
 @dataclass(slots=True)
 class RefreshEventTypesTask(RecorderTask):
     """An object to insert into the recorder queue to refresh event types."""
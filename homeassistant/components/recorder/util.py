@@ -53,6 +53,7 @@ from .models import (
     UnsupportedDialect,
     process_timestamp,
 )
+from .partitions import create_partitions_ahead, supports_partitions
 
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import Cursor as SQLiteCursor
@@ -695,6 +696,10 @@ def periodic_db_cleanups(instance: Recorder) -> None:
         with instance.engine.connect() as connection:
             connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE);"))
             connection.execute(text("PRAGMA OPTIMIZE;"))
+    elif supports_partitions(instance):
+        # Create the partitions before the rows for them arrive
+        with session_scope(session=instance.get_session()) as session:
+            create_partitions_ahead(session)
 
 
 @contextmanager
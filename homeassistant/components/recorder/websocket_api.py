@@ -30,6 +30,7 @@ from homeassistant.util.unit_conversion import (
     VolumeConverter,
 )
 
+from .const import DBPriority
 from .models import StatisticPeriod
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
@@ -142,6 +143,7 @@ async def ws_get_statistic_during_period(
             msg["statistic_id"],
             msg.get("types"),
             msg.get("units"),
+            priority=DBPriority.INTERACTIVE,
         )
     )
 
@@ -212,6 +214,7 @@ async def ws_handle_get_statistics_during_period(
             msg.get("period"),
             msg.get("units"),
             types,
+            priority=DBPriority.INTERACTIVE,
         )
     )
 
@@ -262,6 +265,7 @@ async def ws_handle_list_statistic_ids(
             hass,
             msg["id"],
             msg.get("statistic_type"),
+            priority=DBPriority.INTERACTIVE,
         )
     )
 
@@ -294,6 +298,7 @@ async def ws_validate_statistics(
     statistic_ids = await instance.async_add_executor_job(
         validate_statistics,
         hass,
+        priority=DBPriority.INTERACTIVE,
     )
     connection.send_result(msg["id"], statistic_ids)
 
@@ -412,7 +417,10 @@ async def ws_adjust_sum_statistics(
 
     instance = get_instance(hass)
     metadatas = await instance.async_add_executor_job(
-        list_statistic_ids, hass, {msg["statistic_id"]}
+        list_statistic_ids,
+        hass,
+        {msg["statistic_id"]},
+        priority=DBPriority.INTERACTIVE,
     )
     if not metadatas:
         connection.send_error(msg["id"], "unknown_statistic_id", "Unknown statistic ID")
@@ -500,12 +508,16 @@ def ws_info(
     migration_is_live = async_migration_is_live(hass)
     recording = instance.recording if instance else False
     thread_alive = instance.is_alive() if instance else False
+    purge_progress = instance.purge_progress if instance else None
+    queue_wait = instance.async_db_executor_wait_stats() if instance else {}
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": instance.max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "purge_progress": purge_progress.as_dict() if purge_progress else None,
+        "queue_wait": queue_wait,
         "recording": recording,
         "thread_running": thread_alive,
     }
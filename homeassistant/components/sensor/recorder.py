@@ -2,9 +2,8 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable
 import datetime
-import itertools
 import logging
 import math
 from typing import Any
@@ -24,6 +23,9 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
@@ -78,8 +80,30 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
+class _FloatStates:
+    """The numeric states of an entity as parallel columns."""
+
+    __slots__ = ("values", "states", "timestamps", "attributes")
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.values: list[float] = []
+        self.states: list[str] = []
+        self.timestamps: list[float] = []
+        self.attributes: list[dict[str, Any]] = []
+
+    def append(
+        self, value: float, state: str, timestamp: float, attributes: dict[str, Any]
+    ) -> None:
+        """Append a state."""
+        self.values.append(value)
+        self.states.append(state)
+        self.timestamps.append(timestamp)
+        self.attributes.append(attributes)
+
+
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    values: list[float], timestamps: list[float], start_ts: float, end_ts: float
 ) -> float:
     """Calculate a time weighted average.
 
@@ -88,21 +112,20 @@ def _time_weighted_average(
     Note: there's no interpolation of values between state changes.
     """
     old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    old_start_time: float | None = None
     accumulated = 0.0
 
-    for fstate, state in fstates:
+    for fstate, timestamp in zip(values, timestamps):
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
+        start_time = start_ts if timestamp < start_ts else timestamp
         if old_start_time is None:
             # Adjust start time, if there was no last known state
-            start = start_time
+            start_ts = start_time
         else:
-            duration = start_time - old_start_time
             # Accumulate the value, weighted by duration until next state change
             assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
+            accumulated += old_fstate * (start_time - old_start_time)
 
         old_fstate = fstate
         old_start_time = start_time
@@ -110,10 +133,9 @@ def _time_weighted_average(
     if old_fstate is not None:
         # Accumulate the value, weighted by duration until end of the period
         assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+        accumulated += old_fstate * (end_ts - old_start_time)
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = end_ts - start_ts
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -125,9 +147,12 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
-def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
+def _get_units(float_states: _FloatStates) -> set[str | None]:
     """Return a set of all units."""
-    return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
+    return {
+        attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        for attributes in float_states.attributes
+    }
 
 
 def _equivalent_units(units: set[str | None]) -> bool:
@@ -156,27 +181,29 @@ def _float_or_none(state: str) -> float | None:
         return None
 
 
-def _entity_history_to_float_and_state(
-    entity_history: Iterable[State],
-) -> list[tuple[float, State]]:
-    """Return a list of (float, state) tuples for the given entity."""
-    return [
-        (fstate, state)
-        for state in entity_history
-        if (fstate := _float_or_none(state.state)) is not None
-    ]
+def _entity_columns_to_float_states(columns: dict[str, list[Any]]) -> _FloatStates:
+    """Return the numeric states in the state columns of an entity."""
+    float_states = _FloatStates()
+    for state, timestamp, attributes in zip(
+        columns[COMPRESSED_STATE_STATE],
+        columns[COMPRESSED_STATE_LAST_UPDATED],
+        columns[COMPRESSED_STATE_ATTRIBUTES],
+    ):
+        if (fstate := _float_or_none(state)) is not None:
+            float_states.append(fstate, state, timestamp, attributes)
+    return float_states
 
 
 def _normalize_states(
     hass: HomeAssistant,
     old_metadatas: dict[str, tuple[int, StatisticMetaData]],
-    fstates: list[tuple[float, State]],
+    float_states: _FloatStates,
     entity_id: str,
-) -> tuple[str | None, list[tuple[float, State]]]:
+) -> tuple[str | None, _FloatStates | None]:
     """Normalize units."""
     state_unit: str | None = None
     statistics_unit: str | None
-    state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    state_unit = float_states.attributes[0].get(ATTR_UNIT_OF_MEASUREMENT)
     old_metadata = old_metadatas[entity_id][1] if entity_id in old_metadatas else None
     if not old_metadata:
         # We've not seen this sensor before, the first valid state determines the unit
@@ -189,7 +216,7 @@ def _normalize_states(
     if statistics_unit not in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER:
         # The unit used by this sensor doesn't support unit conversion
 
-        all_units = _get_units(fstates)
+        all_units = _get_units(float_states)
         if not _equivalent_units(all_units):
             if WARN_UNSTABLE_UNIT not in hass.data:
                 hass.data[WARN_UNSTABLE_UNIT] = set()
@@ -212,17 +239,27 @@ def _normalize_states(
                     extra,
                     LINK_DEV_STATISTICS,
                 )
-            return None, []
-        state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-        return state_unit, fstates
+            return None, None
+        return state_unit, float_states
 
     converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
-    valid_fstates: list[tuple[float, State]] = []
+    if statistics_unit in converter.VALID_UNITS and _get_units(float_states) == {
+        statistics_unit
+    }:
+        # All states already have the unit of the statistics
+        return statistics_unit, float_states
+
+    valid_float_states = _FloatStates()
     convert: Callable[[float], float]
     last_unit: str | None | object = object()
 
-    for fstate, state in fstates:
-        state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    for fstate, state, timestamp, attributes in zip(
+        float_states.values,
+        float_states.states,
+        float_states.timestamps,
+        float_states.attributes,
+    ):
+        state_unit = attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         # Exclude states with unsupported unit from statistics
         if state_unit not in converter.VALID_UNITS:
             if WARN_UNSUPPORTED_UNIT not in hass.data:
@@ -249,9 +286,11 @@ def _normalize_states(
             convert = converter.converter_factory(state_unit, statistics_unit)
             last_unit = state_unit
 
-        valid_fstates.append((convert(fstate), state))
+        valid_float_states.append(convert(fstate), state, timestamp, attributes)
 
-    return statistics_unit, valid_fstates
+    if not valid_float_states.values:
+        return statistics_unit, None
+    return statistics_unit, valid_float_states
 
 
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
@@ -388,9 +427,9 @@ def compile_statistics(  # noqa: C901
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: MutableMapping[str, list[State]] = {}
+    history_columns: dict[str, dict[str, list[Any]]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
+        history_columns = history.get_significant_state_columns_with_session(
             hass,
             session,
             start - datetime.timedelta.resolution,
@@ -404,23 +443,29 @@ def compile_statistics(  # noqa: C901
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        history_columns.update(
+            history.get_significant_state_columns_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+            )
         )
-        history_list = {**history_list, **_history_list}
 
-    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    entities_with_float_states: dict[str, _FloatStates] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
-        # If there are no recent state changes, the sensor's state may already be pruned
-        # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
-            continue
-        if not (float_states := _entity_history_to_float_and_state(entity_history)):
+        if not (entity_columns := history_columns.get(entity_id)):
+            # If there are no recent state changes, the sensor's state may already
+            # be pruned from the recorder. Get the state from the state machine instead.
+            entity_columns = {
+                COMPRESSED_STATE_STATE: [_state.state],
+                COMPRESSED_STATE_LAST_UPDATED: [_state.last_updated.timestamp()],
+                COMPRESSED_STATE_ATTRIBUTES: [_state.attributes],
+            }
+        float_states = _entity_columns_to_float_states(entity_columns)
+        if not float_states.values:
             continue
         entities_with_float_states[entity_id] = float_states
 
@@ -431,7 +476,7 @@ def compile_statistics(  # noqa: C901
     old_metadatas = statistics.get_metadata_with_session(
         get_instance(hass), session, statistic_ids=set(entities_with_float_states)
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[tuple[str, str | None, str, _FloatStates]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
@@ -443,7 +488,7 @@ def compile_statistics(  # noqa: C901
             maybe_float_states,
             entity_id,
         )
-        if not valid_float_states:
+        if valid_float_states is None:
             continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
         to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
@@ -497,22 +542,17 @@ def compile_statistics(  # noqa: C901
         # Make calculations
         stat: StatisticData = {"start": start}
         if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
-                )
-            )
+            stat["max"] = max(valid_float_states.values)
         if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
-                )
-            )
+            stat["min"] = min(valid_float_states.values)
 
         if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            stat["mean"] = _time_weighted_average(
+                valid_float_states.values,
+                valid_float_states.timestamps,
+                start.timestamp(),
+                end.timestamp(),
+            )
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -530,13 +570,18 @@ def compile_statistics(  # noqa: C901
                 new_state = old_state = last_stat.get("state")
                 _sum = last_stat.get("sum") or 0.0
 
-            for fstate, state in valid_float_states:
+            for fstate, state, timestamp, attributes in zip(
+                valid_float_states.values,
+                valid_float_states.states,
+                valid_float_states.timestamps,
+                valid_float_states.attributes,
+            ):
                 reset = False
                 if (
                     state_class != SensorStateClass.TOTAL_INCREASING
                     and (
                         last_reset := _last_reset_as_utc_isoformat(
-                            state.attributes.get("last_reset"), entity_id
+                            attributes.get("last_reset"), entity_id
                         )
                     )
                     != old_last_reset
@@ -571,8 +616,24 @@ def compile_statistics(  # noqa: C901
                     )
                 elif state_class == SensorStateClass.TOTAL_INCREASING:
                     try:
-                        if old_state is None or reset_detected(
-                            hass, entity_id, fstate, new_state, state
+                        # A State is only needed to check and log a decrease
+                        if old_state is None or (
+                            (
+                                fstate < 0
+                                or (new_state is not None and fstate < new_state)
+                            )
+                            and reset_detected(
+                                hass,
+                                entity_id,
+                                fstate,
+                                new_state,
+                                State(
+                                    entity_id,
+                                    state,
+                                    attributes,
+                                    last_updated=dt_util.utc_from_timestamp(timestamp),
+                                ),
+                            )
                         ):
                             reset = True
                             _LOGGER.info(
@@ -584,7 +645,7 @@ def compile_statistics(  # noqa: C901
                                 entity_id,
                                 new_state,
                                 fstate,
-                                state.last_updated.isoformat(),
+                                dt_util.utc_from_timestamp(timestamp).isoformat(),
                             )
                     except HomeAssistantError:
                         continue
@@ -52,7 +52,9 @@ from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
+from .conflation import StateDiffConflator
 from .connection import ActiveConnection
+from .entity_subscriptions import async_get_entity_subscription_hub
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -306,56 +308,64 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("resumable", default=False): bool,
+        vol.Optional("resume_from"): int,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    A resumable subscription includes the sequence of the latest state
+    change in each message. After a reconnect, the client can pass it as
+    resume_from to only get the state changes it missed.
+    """
     entity_ids = set(msg.get("entity_ids", []))
+    hub = async_get_entity_subscription_hub(hass)
+    resume_from: int | None = msg.get("resume_from")
+    sequence: Callable[[], int] | None = None
+    if msg["resumable"] or resume_from is not None:
+        sequence = hub.async_get_sequence
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            msg["id"],
-        ),
-        run_immediately=True,
+    missed_events = (
+        None
+        if resume_from is None
+        else hub.async_missed_events(resume_from, entity_ids, connection.user)
     )
-    connection.send_result(msg["id"])
+    states = (
+        _async_get_allowed_states(hass, connection) if missed_events is None else []
+    )
+    conflator = StateDiffConflator(hass, connection, msg["id"], sequence)
+    unsubscribe = hub.async_subscribe(conflator, entity_ids, connection.user)
+
+    @callback
+    def _remove_listeners() -> None:
+        """Remove the state changed listeners."""
+        unsubscribe()
+        conflator.async_cancel()
+
+    connection.subscriptions[msg["id"]] = _remove_listeners
+    if resume_from is None:
+        connection.send_result(msg["id"])
+    else:
+        connection.send_result(msg["id"], {"resumed": missed_events is not None})
+
+    if missed_events is not None:
+        connection.send_message(
+            messages.message_with_sequence(
+                messages.state_diff_batch_message(msg["id"], missed_events),
+                hub.sequence,
+            )
+        )
+        return
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
@@ -369,7 +379,9 @@ def handle_subscribe_entities(
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+        _send_handle_entities_init_response(
+            connection, msg["id"], serialized_states, sequence
+        )
         return
 
     serialized_states = []
@@ -384,16 +396,22 @@ def handle_subscribe_entities(
                 ),
             )
 
-    _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+    _send_handle_entities_init_response(
+        connection, msg["id"], serialized_states, sequence
+    )
 
 
 def _send_handle_entities_init_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[str]
+    connection: ActiveConnection,
+    msg_id: int,
+    serialized_states: list[str],
+    sequence: Callable[[], int] | None = None,
 ) -> None:
     """Send handle entities init response."""
-    connection.send_message(
-        f'{{"id":{msg_id},"type":"event","event":{{"a":{{{",".join(serialized_states)}}}}}}}'
-    )
+    message = f'{{"id":{msg_id},"type":"event","event":{{"a":{{{",".join(serialized_states)}}}}}}}'
+    if sequence is not None:
+        message = messages.message_with_sequence(message, sequence())
+    connection.send_message(message)
 
 
 async def _async_get_all_descriptions_json(hass: HomeAssistant) -> str:
@@ -804,7 +822,19 @@ def handle_supported_features(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle setting supported features."""
-    connection.set_supported_features(msg["features"])
+    features = msg["features"]
+    window_bits = features.get(const.FEATURE_COMPRESS_MESSAGES, 0)
+    if window_bits and not (
+        const.COMPRESS_MIN_WINDOW_BITS <= window_bits <= const.COMPRESS_MAX_WINDOW_BITS
+    ):
+        connection.send_error(
+            msg["id"],
+            const.ERR_INVALID_FORMAT,
+            f"The {const.FEATURE_COMPRESS_MESSAGES} window bits must be between"
+            f" {const.COMPRESS_MIN_WINDOW_BITS} and {const.COMPRESS_MAX_WINDOW_BITS}",
+        )
+        return
+    connection.set_supported_features(features)
     connection.send_result(msg["id"])
 
 
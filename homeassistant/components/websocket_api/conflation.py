@@ -0,0 +1,136 @@
+"""Merge the state diffs of a subscription while the client is behind."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import datetime as dt
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from . import messages
+from .connection import ActiveConnection
+from .const import CONFLATE_INTERVAL, PENDING_MSG_CONFLATE
+
+
+class StateDiffConflator:
+    """Send the state changes of a subscription as state diffs.
+
+    While more than PENDING_MSG_CONFLATE messages wait to be sent to the
+    client, the changes are held per entity instead. Every CONFLATE_INTERVAL
+    the held changes are sent as one message with a single diff per entity,
+    from the state the client knows to the latest state. Changes superseded
+    in the meantime are never serialized.
+
+    When sequence is set, each message includes the sequence of the latest
+    state change the client got, so it can resume the subscription.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_connection",
+        "_msg_id",
+        "_sequence",
+        "_held",
+        "_unsub_flush",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: ActiveConnection,
+        msg_id: int,
+        sequence: Callable[[], int] | None = None,
+    ) -> None:
+        """Initialize the conflator."""
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._sequence = sequence
+        # The first and the latest state_changed event held for each entity
+        self._held: dict[str, tuple[Event, Event]] = {}
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    @property
+    def _holding(self) -> bool:
+        """Return if state changes must be held instead of sent."""
+        # Once a change is held, all changes are held until the next flush
+        # so the client never gets a change before an older one.
+        return (
+            bool(self._held)
+            or self._connection.pending_messages() > PENDING_MSG_CONFLATE
+        )
+
+    @callback
+    def async_send(self, event: Event) -> None:
+        """Send or hold a state_changed event."""
+        if self._holding:
+            self._async_hold((event,))
+            return
+        self._async_send_message(
+            messages.cached_state_diff_message(self._msg_id, event)
+        )
+
+    @callback
+    def async_send_batch(self, events: list[Event]) -> None:
+        """Send or hold state_changed events as one message."""
+        if self._holding:
+            self._async_hold(events)
+            return
+        self._async_send_message(
+            messages.state_diff_batch_message(self._msg_id, events)
+        )
+
+    @callback
+    def async_send_cached_batch(self, event: Event) -> None:
+        """Send or hold a state_changed_batch event shared by all subscribers."""
+        if self._holding:
+            self._async_hold(event.data["events"])
+            return
+        self._async_send_message(
+            messages.cached_state_diff_batch_message(self._msg_id, event)
+        )
+
+    @callback
+    def _async_send_message(self, message: str) -> None:
+        """Send a state diff message."""
+        if self._sequence is not None:
+            message = messages.message_with_sequence(message, self._sequence())
+        self._connection.send_message(message)
+
+    @callback
+    def _async_hold(self, events: Iterable[Event]) -> None:
+        """Hold state_changed events until the next flush."""
+        held = self._held
+        for event in events:
+            entity_id: str = event.data["entity_id"]
+            if (first_and_latest := held.get(entity_id)) is None:
+                held[entity_id] = (event, event)
+            else:
+                held[entity_id] = (first_and_latest[0], event)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, CONFLATE_INTERVAL, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: dt.datetime) -> None:
+        """Send the held state changes as one message."""
+        self._unsub_flush = None
+        held = self._held
+        self._held = {}
+        events: list[Event] = []
+        for first, latest in held.values():
+            events.append(first)
+            if latest is not first:
+                events.append(latest)
+        self._async_send_message(
+            messages.state_diff_batch_message(self._msg_id, events)
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the held state changes when the subscription ends."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._held.clear()
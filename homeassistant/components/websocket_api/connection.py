@@ -30,6 +30,11 @@ MessageHandler = Callable[[HomeAssistant, "ActiveConnection", dict[str, Any]], N
 BinaryHandler = Callable[[HomeAssistant, "ActiveConnection", bytes], None]
 
 
+def _no_pending_messages() -> int:
+    """Return no pending messages for connections without a message queue."""
+    return 0
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -42,6 +47,8 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "compress_window_bits",
+        "pending_messages",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -64,6 +71,9 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.compress_window_bits = 0
+        # Returns the number of messages waiting to be sent to the client
+        self.pending_messages: Callable[[], int] = _no_pending_messages
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema]] = self.hass.data[
             const.DOMAIN
@@ -79,6 +89,9 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.compress_window_bits = int(
+            features.get(const.FEATURE_COMPRESS_MESSAGES, 0)
+        )
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
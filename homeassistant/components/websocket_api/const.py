@@ -25,6 +25,12 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Subscriptions merge their state diffs while more messages are pending
+PENDING_MSG_CONFLATE: Final = 256
+# Seconds between sending the merged state diffs
+CONFLATE_INTERVAL: Final = 1
+# The number of recent state changes subscribe_entities can resume from
+RESUME_JOURNAL_SIZE: Final = 8192
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -49,3 +55,8 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Deflate messages for clients that can not negotiate permessage-deflate
+# during the handshake. The value is the window size in bits.
+FEATURE_COMPRESS_MESSAGES = "compress_messages"
+COMPRESS_MIN_WINDOW_BITS: Final = 9
+COMPRESS_MAX_WINDOW_BITS: Final = 15
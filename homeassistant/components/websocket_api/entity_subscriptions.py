@@ -0,0 +1,265 @@
+"""Deliver state changes to the subscribe_entities subscriptions."""
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+import time
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_CHANGED_BATCH
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .conflation import StateDiffConflator
+from .const import RESUME_JOURNAL_SIZE
+
+DATA_ENTITY_SUBSCRIPTION_HUB = "websocket_api_entity_subscription_hub"
+
+
+class _EntityFilter:
+    """Filter state changes by entity_ids and the permissions of a user."""
+
+    __slots__ = ("entity_ids", "user", "_permissions", "_access_all")
+
+    def __init__(self, entity_ids: set[str], user: User) -> None:
+        """Initialize the filter."""
+        self.entity_ids = entity_ids
+        self.user = user
+        self._permissions: AbstractPermissions | None = None
+        self._access_all = False
+
+    @callback
+    def access_all(self) -> bool:
+        """Return if the user can read all entities."""
+        # The permissions of the user are replaced when they change,
+        # so they only have to be checked again when that happens.
+        if (permissions := self.user.permissions) is not self._permissions:
+            self._permissions = permissions
+            self._access_all = permissions.access_all_entities(POLICY_READ)
+        return self._access_all
+
+    @callback
+    def permits(self, entity_id: str) -> bool:
+        """Return if the user can read an entity."""
+        return self.access_all() or self.user.permissions.check_entity(
+            entity_id, POLICY_READ
+        )
+
+    @callback
+    def wants(self, event: Event) -> bool:
+        """Return if the subscription wants a state_changed event."""
+        entity_id: str = event.data["entity_id"]
+        return (not self.entity_ids or entity_id in self.entity_ids) and self.permits(
+            entity_id
+        )
+
+
+class _EntitySubscription(_EntityFilter):
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = ("conflator",)
+
+    def __init__(
+        self, conflator: StateDiffConflator, entity_ids: set[str], user: User
+    ) -> None:
+        """Initialize the subscription."""
+        super().__init__(entity_ids, user)
+        self.conflator = conflator
+
+
+class EntitySubscriptionHub:
+    """Deliver state changes to the subscriptions interested in them.
+
+    A single pair of bus listeners serves all subscriptions. Subscriptions
+    to specific entities are indexed by entity_id, so a state change only
+    reaches the subscriptions to all entities and to the changed entity.
+
+    The recent state changes are kept in a journal numbered by a sequence,
+    so a client that reconnects can resume its subscription from the last
+    sequence it received. The journal keeps recording after the last
+    client disconnected, until none of the disconnected clients can resume
+    anymore. Then the bus listeners are removed until the next subscription.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_all",
+        "_by_entity_id",
+        "_unsub_listeners",
+        "_journal",
+        "_idle_since",
+        "sequence",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        # Subscriptions are stored in tuples that are replaced on change
+        # so delivery never iterates a collection that changes under it.
+        self._all: tuple[_EntitySubscription, ...] = ()
+        self._by_entity_id: dict[str, tuple[_EntitySubscription, ...]] = {}
+        self._unsub_listeners: list[CALLBACK_TYPE] = []
+        self._journal: deque[Event] = deque(maxlen=RESUME_JOURNAL_SIZE)
+        # The sequence when the last subscription ended
+        self._idle_since: int | None = None
+        # The sequence of the latest state change in the journal. It starts
+        # at the current time in microseconds, so the sequence of a restarted
+        # instance is always ahead of the sequence clients got before.
+        self.sequence = int(time.time() * 1_000_000)
+
+    @callback
+    def async_subscribe(
+        self, conflator: StateDiffConflator, entity_ids: set[str], user: User
+    ) -> CALLBACK_TYPE:
+        """Subscribe to the state changes of entities or all entities."""
+        subscription = _EntitySubscription(conflator, entity_ids, user)
+        by_entity_id = self._by_entity_id
+        if entity_ids:
+            for entity_id in entity_ids:
+                by_entity_id[entity_id] = (
+                    *by_entity_id.get(entity_id, ()),
+                    subscription,
+                )
+        else:
+            self._all = (*self._all, subscription)
+        self._idle_since = None
+        if not self._unsub_listeners:
+            self._async_listen()
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Unsubscribe from the state changes."""
+            if entity_ids:
+                for entity_id in entity_ids:
+                    if subscriptions := tuple(
+                        other
+                        for other in by_entity_id[entity_id]
+                        if other is not subscription
+                    ):
+                        by_entity_id[entity_id] = subscriptions
+                    else:
+                        del by_entity_id[entity_id]
+            else:
+                self._all = tuple(
+                    other for other in self._all if other is not subscription
+                )
+            if not self._all and not by_entity_id:
+                self._idle_since = self.sequence
+
+        return _async_unsubscribe
+
+    @callback
+    def async_get_sequence(self) -> int:
+        """Return the sequence of the latest state change."""
+        return self.sequence
+
+    @callback
+    def async_missed_events(
+        self, since: int, entity_ids: set[str], user: User
+    ) -> list[Event] | None:
+        """Return the state changes after since that a subscription wants.
+
+        Returns None when the journal no longer has all of them.
+        """
+        journal = self._journal
+        missed = self.sequence - since
+        if not self._unsub_listeners or missed < 0 or missed > len(journal):
+            return None
+        entity_filter = _EntityFilter(entity_ids, user)
+        return [
+            event
+            for event in islice(journal, len(journal) - missed, None)
+            if entity_filter.wants(event)
+        ]
+
+    @callback
+    def _async_listen(self) -> None:
+        """Listen for state changes."""
+        # The state changes while not listening were not recorded,
+        # so no client can resume from a sequence before now
+        self.sequence += 1
+        bus = self._hass.bus
+        self._unsub_listeners = [
+            bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+            ),
+            bus.async_listen(
+                EVENT_STATE_CHANGED_BATCH,
+                self._async_state_changed_batch,
+                run_immediately=True,
+            ),
+        ]
+
+    @callback
+    def _async_unlisten(self) -> None:
+        """Stop listening for state changes."""
+        for unsub in self._unsub_listeners:
+            unsub()
+        self._unsub_listeners = []
+        self._idle_since = None
+        self._journal.clear()
+
+    @callback
+    def _async_check_idle(self) -> None:
+        """Stop listening once no disconnected client can resume."""
+        if (
+            self._idle_since is not None
+            and self.sequence - self._idle_since > RESUME_JOURNAL_SIZE
+        ):
+            self._async_unlisten()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Record and deliver a state_changed event."""
+        self._journal.append(event)
+        self.sequence += 1
+        if self._idle_since is not None:
+            self._async_check_idle()
+            return
+        entity_id: str = event.data["entity_id"]
+        for subscription in self._all:
+            if subscription.permits(entity_id):
+                subscription.conflator.async_send(event)
+        for subscription in self._by_entity_id.get(entity_id, ()):
+            if subscription.permits(entity_id):
+                subscription.conflator.async_send(event)
+
+    @callback
+    def _async_state_changed_batch(self, event: Event) -> None:
+        """Record and deliver a state_changed_batch event."""
+        state_events: list[Event] = event.data["events"]
+        self._journal.extend(state_events)
+        self.sequence += len(state_events)
+        if self._idle_since is not None:
+            self._async_check_idle()
+            return
+        for subscription in self._all:
+            if subscription.access_all():
+                # The message is serialized once for all these subscriptions
+                subscription.conflator.async_send_cached_batch(event)
+            elif permitted := [
+                state_event
+                for state_event in state_events
+                if subscription.permits(state_event.data["entity_id"])
+            ]:
+                subscription.conflator.async_send_batch(permitted)
+
+        if not (by_entity_id := self._by_entity_id):
+            return
+        subscription_events: dict[_EntitySubscription, list[Event]] = {}
+        for state_event in state_events:
+            entity_id: str = state_event.data["entity_id"]
+            for subscription in by_entity_id.get(entity_id, ()):
+                if subscription.permits(entity_id):
+                    subscription_events.setdefault(subscription, []).append(state_event)
+        for subscription, events in subscription_events.items():
+            subscription.conflator.async_send_batch(events)
+
+
+@callback
+def async_get_entity_subscription_hub(hass: HomeAssistant) -> EntitySubscriptionHub:
+    """Return the entity subscription hub."""
+    if (hub := hass.data.get(DATA_ENTITY_SUBSCRIPTION_HUB)) is None:
+        hub = hass.data[DATA_ENTITY_SUBSCRIPTION_HUB] = EntitySubscriptionHub(hass)
+    return hub
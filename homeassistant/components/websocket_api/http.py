@@ -7,6 +7,7 @@ from collections.abc import Callable
 import datetime as dt
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 
@@ -122,6 +123,11 @@ class WebSocketHandler:
         logger = self._logger
         wsock = self._wsock
         send_str = wsock.send_str
+        send_bytes = wsock.send_bytes
+        # Messages are already compressed if the client negotiated
+        # permessage-deflate during the handshake
+        handshake_compress = wsock.compress
+        compressor: zlib._Compress | None = None
         loop = self._hass.loop
         debug = logger.debug
         is_enabled_for = logger.isEnabledFor
@@ -140,29 +146,48 @@ class WebSocketHandler:
 
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
+                connection = self._connection
 
                 if (
                     not messages_remaining
-                    or not (connection := self._connection)
+                    or not connection
                     or not connection.can_coalesce
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
+                else:
+                    messages: list[str] = [message]
+                    while messages_remaining:
+                        # A None message is used to signal the end of the connection
+                        if (message := message_queue.popleft()) is None:
+                            return
+                        messages.append(message)
+                        messages_remaining -= 1
+
+                    message = f'[{",".join(messages)}]'
+                    if debug_enabled:
+                        debug("%s: Sending %s", self.description, message)
+
+                if (
+                    handshake_compress
+                    or not connection
+                    or not connection.compress_window_bits
+                ):
                     await send_str(message)
                     continue
 
-                messages: list[str] = [message]
-                while messages_remaining:
-                    # A None message is used to signal the end of the connection
-                    if (message := message_queue.popleft()) is None:
-                        return
-                    messages.append(message)
-                    messages_remaining -= 1
-
-                coalesced_messages = f'[{",".join(messages)}]'
-                if debug_enabled:
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_str(coalesced_messages)
+                # The messages are one raw deflate stream so each message
+                # can refer to the data of the messages sent before it.
+                if compressor is None:
+                    compressor = zlib.compressobj(
+                        zlib.Z_BEST_SPEED,
+                        zlib.DEFLATED,
+                        -connection.compress_window_bits,
+                    )
+                await send_bytes(
+                    compressor.compress(message.encode())
+                    + compressor.flush(zlib.Z_SYNC_FLUSH)
+                )
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -323,6 +348,7 @@ class WebSocketHandler:
                 debug("%s: Received %s", self.description, auth_msg_data)
             connection = await auth.async_handle(auth_msg_data)
             self._connection = connection
+            connection.pending_messages = self._message_queue.__len__
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
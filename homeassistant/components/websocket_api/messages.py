@@ -1,6 +1,7 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, Final, cast
@@ -129,6 +130,69 @@ def _partial_cached_state_diff_message(event: Event) -> str:
     )
 
 
+def cached_state_diff_batch_message(iden: int, event: Event) -> str:
+    """Return an event message with the state diffs of a state_changed_batch event.
+
+    Serialize to json once per message.
+    """
+    return f'{_partial_cached_state_diff_batch_message(event)[:-1]},"id":{iden}}}'
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_diff_batch_message(event: Event) -> str:
+    """Cache and serialize the batch event to json.
+
+    The message is constructed without the id which
+    will be appended in cached_state_diff_batch_message
+    """
+    return (
+        _message_to_json_or_none(
+            {"type": "event", "event": _state_diff_events(event.data["events"])}
+        )
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
+def state_diff_batch_message(iden: int, events: Iterable[Event]) -> str:
+    """Return an event message with the merged state diffs of state_changed events."""
+    return message_to_json(event_message(iden, _state_diff_events(events)))
+
+
+def message_with_sequence(message: str, sequence: int) -> str:
+    """Add the sequence of the latest state change to a JSON message."""
+    return f'{message[:-1]},"seq":{sequence}}}'
+
+
+def _state_diff_events(events: Iterable[Event]) -> dict:
+    """Convert many state_changed events to one minimal version.
+
+    An entity that changed more than once is diffed from
+    its first old state to its last new state.
+    """
+    changes: dict[str, tuple[State | None, State | None]] = {}
+    for event in events:
+        entity_id = event.data["entity_id"]
+        if (change := changes.get(entity_id)) is None:
+            changes[entity_id] = (event.data["old_state"], event.data["new_state"])
+        else:
+            changes[entity_id] = (change[0], event.data["new_state"])
+
+    merged: dict[str, Any] = {}
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                merged.setdefault(ENTITY_EVENT_REMOVE, []).append(entity_id)
+        elif old_state is None:
+            merged.setdefault(ENTITY_EVENT_ADD, {})[
+                entity_id
+            ] = new_state.as_compressed_state
+        else:
+            merged.setdefault(ENTITY_EVENT_CHANGE, {}).update(
+                _state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE]
+            )
+    return merged
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -48,6 +48,7 @@ from . import block_async_io, util
 from .backports.functools import cached_property
 from .const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
@@ -66,6 +67,7 @@ from .const import (
     EVENT_SERVICE_REGISTERED,
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     LENGTH_METERS,
     MATCH_ALL,
     MAX_LENGTH_EVENT_EVENT_TYPE,
@@ -88,6 +90,7 @@ from .util.async_ import (
     run_callback_threadsafe,
     shutdown_run_callback_threadsafe,
 )
+from .util.job_stats import JobStats
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
@@ -372,6 +375,8 @@ class HomeAssistant:
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
         self._stop_future: concurrent.futures.Future[None] | None = None
+        # If not None, the time jobs spend running in the event loop is recorded
+        self.job_stats: JobStats | None = None
 
     @property
     def is_running(self) -> bool:
@@ -567,11 +572,22 @@ class HomeAssistant:
                 hassjob.target = cast(
                     Callable[..., Coroutine[Any, Any, _R]], hassjob.target
                 )
-            task = self.loop.create_task(hassjob.target(*args), name=hassjob.name)
+            if (job_stats := self.job_stats) is None:
+                task = self.loop.create_task(hassjob.target(*args), name=hassjob.name)
+            else:
+                task = self.loop.create_task(
+                    job_stats.run_coroutine(
+                        hassjob.name, hassjob.target, hassjob.target(*args)
+                    ),
+                    name=hassjob.name,
+                )
         elif hassjob.job_type == HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob.target = cast(Callable[..., _R], hassjob.target)
-            self.loop.call_soon(hassjob.target, *args)
+            if (job_stats := self.job_stats) is None:
+                self.loop.call_soon(hassjob.target, *args)
+            else:
+                self.loop.call_soon(job_stats.run, hassjob.name, hassjob.target, *args)
             return None
         else:
             if TYPE_CHECKING:
@@ -670,7 +686,10 @@ class HomeAssistant:
         if hassjob.job_type == HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob.target = cast(Callable[..., _R], hassjob.target)
-            hassjob.target(*args)
+            if (job_stats := self.job_stats) is None:
+                hassjob.target(*args)
+            else:
+                job_stats.run(hassjob.name, hassjob.target, *args)
             return None
 
         return self.async_add_hass_job(hassjob, *args)
@@ -1029,12 +1048,18 @@ _FilterableJobType = tuple[
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = ("_listeners", "_keyed_listeners", "_match_all_listeners", "_hass")
 
     def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize a new event bus."""
-        self._listeners: dict[str, list[_FilterableJobType]] = {}
-        self._match_all_listeners: list[_FilterableJobType] = []
+        """Initialize a new event bus.
+
+        Listener collections are tuples that are replaced whenever a
+        listener is added or removed so they can be iterated while
+        firing an event without making a copy.
+        """
+        self._listeners: dict[str, tuple[_FilterableJobType, ...]] = {}
+        self._keyed_listeners: dict[str, dict[str, tuple[_FilterableJobType, ...]]] = {}
+        self._match_all_listeners: tuple[_FilterableJobType, ...] = ()
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
 
@@ -1042,9 +1067,20 @@ class EventBus:
     def async_listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners.
 
+        A listener job that is registered for many keys is counted once.
+
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(
+                {
+                    id(filterable_job)
+                    for key_listeners in keyed_listeners.values()
+                    for filterable_job in key_listeners
+                }
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1081,21 +1117,40 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-        match_all_listeners = self._match_all_listeners
+        listeners = self._listeners.get(event_type)
+        key_listeners: tuple[_FilterableJobType, ...] | None = None
+        if (
+            event_data
+            and (keyed_listeners := self._keyed_listeners.get(event_type))
+            # Events can have a list of entity_ids, listeners are keyed by one
+            and isinstance(entity_id := event_data.get(ATTR_ENTITY_ID), str)
+        ):
+            key_listeners = keyed_listeners.get(entity_id)
+        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+        match_all_listeners = (
+            self._match_all_listeners if event_type != EVENT_HOMEASSISTANT_CLOSE else ()
+        )
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners and not match_all_listeners:
-            return
+        if match_all_listeners:
+            self._async_run_listeners(event, match_all_listeners)
+        if listeners:
+            self._async_run_listeners(event, listeners)
+        if key_listeners:
+            self._async_run_listeners(event, key_listeners)
 
-        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+    @callback
+    def _async_run_listeners(
+        self, event: Event, listeners: tuple[_FilterableJobType, ...]
+    ) -> None:
+        """Run or schedule listeners for an event.
 
+        This method must be run in the event loop.
+        """
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -1106,7 +1161,10 @@ class EventBus:
                     continue
             if run_immediately:
                 try:
-                    job.target(event)
+                    if (job_stats := self._hass.job_stats) is None:
+                        job.target(event)
+                    else:
+                        job_stats.run(job.name, job.target, event)
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception("Error running job: %s", job)
             else:
@@ -1139,6 +1197,7 @@ class EventBus:
         listener: Callable[[Event], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[Event], bool] | None = None,
         run_immediately: bool = False,
+        key: str | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1153,6 +1212,11 @@ class EventBus:
         right away instead of using call_soon. Only use this if
         the callback results in scheduling another task.
 
+        If key is passed, the listener is indexed by key and only
+        runs for events where the entity_id in the event data matches
+        key. Firing an event only looks up the listeners for its key,
+        which avoids running a filter for every listener.
+
         This method must be run in the event loop.
         """
         job_type: HassJobType | None = None
@@ -1162,24 +1226,50 @@ class EventBus:
             if not is_callback_check_partial(listener):
                 raise HomeAssistantError(f"Event listener {listener} is not a callback")
             job_type = HassJobType.Callback
-        return self._async_listen_filterable_job(
-            event_type,
-            (
-                HassJob(listener, f"listen {event_type}", job_type=job_type),
-                event_filter,
-                run_immediately,
-            ),
+        filterable_job: _FilterableJobType = (
+            HassJob(listener, f"listen {event_type}", job_type=job_type),
+            event_filter,
+            run_immediately,
         )
+        if key is None:
+            return self._async_listen_filterable_job(event_type, filterable_job)
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require a specific event type")
+        return self._async_listen_keyed_filterable_job(event_type, key, filterable_job)
 
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
     ) -> CALLBACK_TYPE:
-        self._listeners.setdefault(event_type, []).append(filterable_job)
+        listeners = self._listeners.get(event_type, ())
+        self._async_set_listeners(event_type, (*listeners, filterable_job))
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def _async_listen_keyed_filterable_job(
+        self, event_type: str, key: str, filterable_job: _FilterableJobType
+    ) -> CALLBACK_TYPE:
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+        keyed_listeners[key] = (*keyed_listeners.get(key, ()), filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, key, filterable_job
+        )
+
+    @callback
+    def _async_set_listeners(
+        self, event_type: str, listeners: tuple[_FilterableJobType, ...]
+    ) -> None:
+        """Replace the listeners of a specific event_type."""
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = listeners
+        elif not listeners:
+            # delete event_type if there are no listeners left
+            del self._listeners[event_type]
+            return
+        self._listeners[event_type] = listeners
+
     def listen_once(
         self,
         event_type: str,
@@ -1260,17 +1350,44 @@ class EventBus:
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(filterable_job)
-
-            # delete event_type list if empty
-            if not self._listeners[event_type] and event_type != MATCH_ALL:
-                self._listeners.pop(event_type)
+            listeners = self._listeners[event_type]
+            index = listeners.index(filterable_job)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+        self._async_set_listeners(
+            event_type, listeners[:index] + listeners[index + 1 :]
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self, event_type: str, key: str, filterable_job: _FilterableJobType
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            listeners = keyed_listeners[key]
+            index = listeners.index(filterable_job)
+        except (KeyError, ValueError):
+            # KeyError is key event_type or key listener did not exist
+            # ValueError if listener did not exist within key
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+        if listeners := listeners[:index] + listeners[index + 1 :]:
+            keyed_listeners[key] = listeners
+            return
+        del keyed_listeners[key]
+        if not keyed_listeners:
+            del self._keyed_listeners[event_type]
 
 
 class State:
@@ -1310,7 +1427,12 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # A read only dict is shared, it can not change under the state
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1705,7 +1827,10 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            old_attributes = old_state.attributes
+            if same_attr := old_attributes == attributes:
+                # Share the attributes of the old state with the new state
+                attributes = old_attributes
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
@@ -1750,6 +1875,155 @@ class StateMachine:
             time_fired=now,
         )
 
+    @callback
+    def async_set_many(
+        self,
+        updates: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        state_info: Mapping[str, StateInfo] | None = None,
+    ) -> None:
+        """Set the state of many entities, add entities that do not exist.
+
+        Each update is a tuple of entity_id, new_state and attributes. All
+        changed states share one context and one last_updated timestamp.
+        The state info of the entities can be passed by entity_id.
+
+        Every state of the batch is validated before the state machine is
+        updated, so an invalid entity_id or state leaves it unchanged. The
+        state machine is updated for the whole batch before any event
+        is fired. A state_changed event is fired per changed state.
+
+        This method must be run in the event loop.
+        """
+        if (
+            changes := self._async_apply_many(
+                updates, force_update, context, state_info
+            )
+        ) is None:
+            return
+        events_data, now, context = changes
+        bus_async_fire = self._bus.async_fire
+        for event_data in events_data:
+            bus_async_fire(
+                EVENT_STATE_CHANGED,
+                event_data,
+                EventOrigin.local,
+                context,
+                time_fired=now,
+            )
+
+    @callback
+    def _async_set_many_coalesced(
+        self,
+        updates: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        state_info: Mapping[str, StateInfo] | None = None,
+    ) -> None:
+        """Set the state of many entities and fire a single event.
+
+        Like async_set_many, but a single state_changed_batch event with the
+        state_changed events in its data is fired instead. Only listeners
+        of EVENT_STATE_CHANGED_BATCH see those changes, the listeners of
+        EVENT_STATE_CHANGED are not called. It is private until all the
+        state_changed listeners handle batches.
+
+        This method must be run in the event loop.
+        """
+        if (
+            changes := self._async_apply_many(
+                updates, force_update, context, state_info
+            )
+        ) is None:
+            return
+        events_data, now, context = changes
+        self._bus.async_fire(
+            EVENT_STATE_CHANGED_BATCH,
+            {
+                "events": [
+                    Event(
+                        EVENT_STATE_CHANGED,
+                        event_data,
+                        EventOrigin.local,
+                        now,
+                        context,
+                    )
+                    for event_data in events_data
+                ]
+            },
+            EventOrigin.local,
+            context,
+            time_fired=now,
+        )
+
+    @callback
+    def _async_apply_many(
+        self,
+        updates: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool,
+        context: Context | None,
+        state_info: Mapping[str, StateInfo] | None,
+    ) -> tuple[list[dict[str, Any]], datetime.datetime, Context] | None:
+        """Update the state machine with a batch of states.
+
+        Returns the data of the state_changed events with the timestamp and
+        context of the batch, or None when no state changed.
+        """
+        if context is None:
+            # See async_set for why the timestamp is converted to a datetime
+            timestamp = time.time()
+            now = dt_util.utc_from_timestamp(timestamp)
+            context = Context(id=ulid_at_time(timestamp))
+        else:
+            now = dt_util.utcnow()
+
+        states_data = self._states_data
+        # States of the batch by entity_id, so a later update of the same
+        # entity follows the earlier one instead of the current state
+        pending: dict[str, State] = {}
+        events_data: list[dict[str, Any]] = []
+        for entity_id, new_state, attributes in updates:
+            entity_id = entity_id.lower()
+            new_state = str(new_state)
+            attributes = attributes or {}
+            old_state = pending.get(entity_id) or states_data.get(entity_id)
+            if old_state is None:
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not force_update
+                old_attributes = old_state.attributes
+                if old_attributes == attributes:
+                    if same_state:
+                        continue
+                    attributes = old_attributes
+                last_changed = old_state.last_changed if same_state else None
+
+            state = State(
+                entity_id,
+                new_state,
+                attributes,
+                last_changed,
+                now,
+                context,
+                old_state is None,
+                state_info.get(entity_id) if state_info else None,
+            )
+            pending[entity_id] = state
+            events_data.append(
+                {"entity_id": entity_id, "old_state": old_state, "new_state": state}
+            )
+
+        if not events_data:
+            return None
+
+        states = self._states
+        for event_data in events_data:
+            if (old_state := event_data["old_state"]) is not None:
+                old_state.expire()
+            states[event_data["entity_id"]] = event_data["new_state"]
+        return events_data, now, context
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -398,25 +398,30 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         """Add an item."""
         data = self.data
         if key in data:
-            old_entry = data[key]
-            for connection in old_entry.connections:
-                del self._connections[connection]
-            for identifier in old_entry.identifiers:
-                del self._identifiers[identifier]
+            self._unindex_entry(key, data[key], entry)
         data[key] = entry
+        self._index_entry(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._unindex_entry(key, self[key])
+        super().__delitem__(key)
+
+    def _index_entry(self, key: str, entry: _EntryTypeT) -> None:
+        """Add an entry to the indexes."""
         for connection in entry.connections:
             self._connections[connection] = entry
         for identifier in entry.identifiers:
             self._identifiers[identifier] = entry
 
-    def __delitem__(self, key: str) -> None:
-        """Remove an item."""
-        entry = self[key]
+    def _unindex_entry(
+        self, key: str, entry: _EntryTypeT, new_entry: _EntryTypeT | None = None
+    ) -> None:
+        """Remove an entry from the indexes."""
         for connection in entry.connections:
             del self._connections[connection]
         for identifier in entry.identifiers:
             del self._identifiers[identifier]
-        super().__delitem__(key)
 
     def get_entry(
         self,
@@ -436,10 +441,75 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Maintains two additional indexes:
+    - area_id -> device ids
+    - config_entry_id -> device ids
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        # The device ids are the keys of dicts to keep them in insertion order
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
+
+    def _index_entry(self, key: str, entry: DeviceEntry) -> None:
+        """Add an entry to the indexes."""
+        super()._index_entry(key, entry)
+        if entry.area_id is not None:
+            self._area_id_index.setdefault(entry.area_id, {})[key] = True
+        for config_entry_id in entry.config_entries:
+            self._config_entry_id_index.setdefault(config_entry_id, {})[key] = True
+
+    def _unindex_entry(
+        self, key: str, entry: DeviceEntry, new_entry: DeviceEntry | None = None
+    ) -> None:
+        """Remove an entry from the indexes.
+
+        When the entry is replaced by new_entry, keys whose indexed value has
+        not changed are left in place so the index keeps its order.
+        """
+        super()._unindex_entry(key, entry, new_entry)
+        if entry.area_id is not None and (
+            new_entry is None or new_entry.area_id != entry.area_id
+        ):
+            _unindex_key(self._area_id_index, entry.area_id, key)
+        for config_entry_id in entry.config_entries:
+            if new_entry is None or config_entry_id not in new_entry.config_entries:
+                _unindex_key(self._config_entry_id_index, config_entry_id, key)
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
+def _unindex_key(
+    index: dict[str, dict[str, Literal[True]]], value: str, key: str
+) -> None:
+    """Remove a key from the keys an index holds for a value."""
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
 
@@ -785,7 +855,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -888,7 +958,7 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in self.devices.get_devices_for_config_entry_id(config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
@@ -929,9 +999,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in self.devices.get_devices_for_area_id(area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -950,7 +1019,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -958,11 +1027,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -10,6 +10,7 @@ from enum import Enum, auto
 import functools as ft
 import logging
 import math
+from operator import is_
 import sys
 from timeit import default_timer as timer
 from typing import (
@@ -295,6 +296,10 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _platform_state = EntityPlatformState.NOT_ADDED
 
+    # If state writes are coalesced by the entity platform, set after the
+    # first state is written when the entity is added
+    _coalesce_state_writes = False
+
     # Attributes to exclude from recording, only set by base components, e.g. light
     _entity_component_unrecorded_attributes: frozenset[str] = frozenset()
     # Additional integration specific attributes to exclude from recording, set by
@@ -335,12 +340,24 @@ class Entity(ABC):
     _attr_unique_id: str | None = None
     _attr_unit_of_measurement: str | None
 
+    # The friendly name and what it was computed from, see _async_friendly_name
+    __friendly_name_cache: tuple[tuple[Any, ...], str | None] | None = None
+    # If the friendly name is only computed by the Entity implementation
+    __cache_friendly_name = True
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """Initialize an Entity subclass."""
         super().__init_subclass__(**kwargs)
         cls.__combined_unrecorded_attributes = (
             cls._entity_component_unrecorded_attributes | cls._unrecorded_attributes
         )
+        cls.__cache_friendly_name = (
+            cls.name is Entity.name
+            and cls.has_entity_name is Entity.has_entity_name
+            and cls.use_device_name is Entity.use_device_name
+            and cls._friendly_name_internal is Entity._friendly_name_internal
+            and cls._name_internal is Entity._name_internal
+        )
 
     @property
     def should_poll(self) -> bool:
@@ -740,6 +757,10 @@ class Entity(ABC):
                 f"No entity id specified for entity {self.name}"
             )
 
+        if self._coalesce_state_writes:
+            self.platform.async_schedule_state_write(self._async_write_ha_state)
+            return
+
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
@@ -772,6 +793,35 @@ class Entity(ABC):
             return device_name
         return f"{device_name} {name}" if device_name else name
 
+    def _async_friendly_name(self) -> str | None:
+        """Return the friendly name.
+
+        The friendly name computed by the Entity implementation only changes
+        with the name related _attr_ values, the entity description and the
+        device entry, it is cached until one of them changes. The translations
+        it is computed from are already cached for the lifetime of the entity.
+
+        The values are compared by identity, the device registry replaces the
+        device entry when it is updated.
+        """
+        if not self.__cache_friendly_name:
+            return self._friendly_name_internal()
+        get = self.__dict__.get
+        key = (
+            self.device_entry,
+            get("_attr_name", UNDEFINED),
+            get("_attr_has_entity_name", UNDEFINED),
+            get("_attr_device_class", UNDEFINED),
+            get("entity_description", UNDEFINED),
+        )
+        if (cache := self.__friendly_name_cache) is not None and all(
+            map(is_, key, cache[0])
+        ):
+            return cache[1]
+        name = self._friendly_name_internal()
+        self.__friendly_name_cache = (key, name)
+        return name
+
     @callback
     def _async_generate_attributes(self) -> tuple[str, dict[str, Any]]:
         """Calculate state string and attribute mapping."""
@@ -806,9 +856,7 @@ class Entity(ABC):
         if (icon := (entry and entry.icon) or self.icon) is not None:
             attr[ATTR_ICON] = icon
 
-        if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
+        if (name := (entry and entry.name) or self._async_friendly_name()) is not None:
             attr[ATTR_FRIENDLY_NAME] = name
 
         if (supported_features := self.supported_features) is not None:
@@ -1021,6 +1069,7 @@ class Entity(ABC):
         await self.async_internal_added_to_hass()
         await self.async_added_to_hass()
         self.async_write_ha_state()
+        self._coalesce_state_writes = self.platform.coalesce_state_writes
 
     async def async_remove(self, *, force_remove: bool = False) -> None:
         """Remove entity from Home Assistant.
@@ -1040,6 +1089,7 @@ class Entity(ABC):
             )
 
         self._platform_state = EntityPlatformState.REMOVED
+        self._coalesce_state_writes = False
 
         self._call_on_remove_callbacks()
 
@@ -2,11 +2,15 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
+import time
 from typing import TYPE_CHECKING, Any, Protocol
+import zlib
 
 import voluptuous as vol
 
@@ -21,6 +25,8 @@ from homeassistant.core import (
     DOMAIN as HOMEASSISTANT_DOMAIN,
     CoreState,
     EntityServiceResponse,
+    HassJob,
+    HassJobType,
     HomeAssistant,
     ServiceCall,
     SupportsResponse,
@@ -56,8 +62,27 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_POLLING_SCHEDULER = "entity_platform_polling_scheduler"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# The first poll of a platform is moved ahead by up to this part of its interval
+POLL_JITTER = 0.5
+# The limits of the number of platforms that poll at the same time
+POLL_CONCURRENCY_MIN = 4
+POLL_CONCURRENCY_MAX = 32
+# The weight of the latest poll in the average poll duration
+POLL_DURATION_SMOOTHING = 0.2
+# The weight of the average poll duration in the baseline when it is higher
+POLL_BASELINE_DRIFT = 0.01
+# A poll is slow if its average duration is this factor and this many seconds
+# above its baseline
+POLL_SLOWDOWN_FACTOR = 2
+POLL_SLOWDOWN_MIN = 0.1
+# The limit is only lowered when this many platforms and this share of the
+# polling platforms are slow at the same time
+POLL_SLOW_PLATFORMS_MIN = 2
+POLL_SLOW_PLATFORMS_SHARE = 0.5
+
 _LOGGER = getLogger(__name__)
 
 
@@ -136,9 +161,21 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # If the last poll is still waiting for the polling scheduler
+        self._poll_waiting = False
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        self.polling_stats = PollingStats()
+
+        # Coalesce the state writes of an entity within a loop iteration
+        # into a single write of its final state
+        self.coalesce_state_writes: bool = getattr(
+            platform, "COALESCE_STATE_WRITES", False
+        )
+        self.coalesced_state_writes = 0
+        self._pending_state_writes: dict[CALLBACK_TYPE, None] = {}
+        self._write_pending_states_handle: asyncio.Handle | None = None
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -193,6 +230,30 @@ class EntityPlatform:
 
         return self.parallel_updates
 
+    @callback
+    def async_schedule_state_write(self, write_state: CALLBACK_TYPE) -> None:
+        """Schedule a state write of an entity in the next loop iteration.
+
+        A write that is already scheduled absorbs the new one.
+        """
+        if write_state in self._pending_state_writes:
+            self.coalesced_state_writes += 1
+            return
+        self._pending_state_writes[write_state] = None
+        if self._write_pending_states_handle is None:
+            self._write_pending_states_handle = self.hass.loop.call_soon(
+                self._async_write_pending_states
+            )
+
+    @callback
+    def _async_write_pending_states(self) -> None:
+        """Write the scheduled entity states."""
+        self._write_pending_states_handle = None
+        pending_state_writes = self._pending_state_writes
+        self._pending_state_writes = {}
+        for write_state in pending_state_writes:
+            write_state()
+
     async def async_setup(
         self,
         platform_config: ConfigType,
@@ -529,11 +590,18 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
+        # The platforms of a config entry share its connection, polling them
+        # together lets them share the data their entities fetch.
+        if self.config_entry:
+            polling_key = self.config_entry.entry_id
+        else:
+            polling_key = self.platform_name
+        self._async_unsub_polling = _async_get_polling_scheduler(self.hass).async_track(
             self._update_entity_states,
             self.scan_interval,
-            name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
+            polling_key,
+            f"EntityPlatform poll {self.domain}.{self.platform_name}",
+            self.polling_stats,
         )
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
@@ -857,6 +925,7 @@ class EntityPlatform:
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
+            self.polling_stats.overruns += 1
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
                 self.platform_name,
@@ -864,25 +933,249 @@ class EntityPlatform:
                 self.scan_interval,
             )
             return
+        if self._poll_waiting:
+            # The last poll did not get its turn yet, it polls for this one
+            self.polling_stats.wait_overruns += 1
+            return
 
+        # Only entities updated in the executor take a turn of the limit,
+        # polls that only wait for the network do not load the executor
+        limited = any(
+            hasattr(entity, "update") and not hasattr(entity, "async_update")
+            for entity in self.entities.values()
+            if entity.should_poll
+        )
+        self._poll_waiting = True
+        try:
+            await _async_get_polling_scheduler(self.hass).async_poll(
+                self._async_poll_entities, self.polling_stats, limited
+            )
+        finally:
+            self._poll_waiting = False
+
+    async def _async_poll_entities(self) -> None:
+        """Update the states of all the polling entities."""
+        assert self._process_updates is not None
+        self._poll_waiting = False
         async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
+            await self._async_update_polling_entities()
+
+    async def _async_update_polling_entities(self) -> None:
+        """Update the states of the polling entities."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
+
+        if tasks := [
+            entity.async_update_ha_state(True)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
+
+
+@dataclass(slots=True, eq=False)
+class PollingStats:
+    """Statistics of the polls of an entity platform."""
+
+    polls: int = 0
+    # Polls skipped because the previous poll was still running
+    overruns: int = 0
+    # Polls that waited for their turn, and polls skipped because the
+    # previous poll was still waiting for its turn
+    waits: int = 0
+    wait_overruns: int = 0
+    last_wait: float = 0.0
+    max_wait: float = 0.0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    # The smoothed duration and the lowest it usually is
+    average_duration: float = 0.0
+    baseline_duration: float = 0.0
+
+
+class PollingScheduler:
+    """Schedule and limit the polls of all entity platforms.
+
+    The first poll of a platform is moved ahead by a deterministic part of
+    its scan interval, so the platforms set up at the same time do not all
+    poll at the same moment. Platforms polled with the same key keep polling
+    together.
+
+    The number of platforms that poll at the same time is limited. The limit
+    is lowered when the polls of many platforms take much longer than usual
+    at the same time, which happens when the executor is congested. A single
+    slow platform does not lower it. It is raised again while polls are
+    waiting for it. Polls that do not use the executor are not limited.
+
+    The entities of a platform are polled together, so the platforms that
+    share a connection between their entities and the parallel updates of a
+    platform keep working as before.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self.concurrency = POLL_CONCURRENCY_MAX
+        self._polling = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        # The stats of the tracked platforms and of those that are slow
+        self._tracked: set[PollingStats] = set()
+        self._slow: set[PollingStats] = set()
+
+    @callback
+    def async_track(
+        self,
+        poll: Callable[[datetime], Coroutine[Any, Any, None]],
+        interval: timedelta,
+        key: str,
+        name: str,
+        stats: PollingStats,
+    ) -> CALLBACK_TYPE:
+        """Call poll at every interval, return a callback to stop.
+
+        The first call is moved ahead by a part of the interval derived from key.
+        """
+        hass = self.hass
+        self._tracked.add(stats)
+        jitter = POLL_JITTER * zlib.crc32(key.encode()) / 2**32
+        poll_job = HassJob(poll, name)
+        cancel: CALLBACK_TYPE
+
+        @callback
+        def _async_first_poll(now: datetime) -> None:
+            """Poll for the first time and start polling at the interval."""
+            nonlocal cancel
+            cancel = async_track_time_interval(hass, poll, interval, name=name)
+            hass.async_run_hass_job(poll_job, now)
+
+        cancel = async_call_later(
+            hass,
+            interval.total_seconds() * (1 - jitter),
+            HassJob(_async_first_poll, name, job_type=HassJobType.Callback),
+        )
+
+        @callback
+        def _async_cancel() -> None:
+            """Stop polling."""
+            cancel()
+            self._tracked.discard(stats)
+            self._slow.discard(stats)
+
+        return _async_cancel
+
+    async def async_poll(
+        self,
+        poll: Callable[[], Awaitable[None]],
+        stats: PollingStats,
+        limited: bool = True,
+    ) -> None:
+        """Poll when the limit allows it and record how long it took.
+
+        The time waiting for a turn is recorded apart from the poll duration.
+        """
+        if not limited:
+            start = time.monotonic()
+            try:
+                await poll()
+            finally:
+                self._async_record(stats, time.monotonic() - start, False)
+            return
+
+        wait_start = time.monotonic()
+        if self._polling >= self.concurrency:
+            stats.waits += 1
+        while self._polling >= self.concurrency:
+            waiter = self.hass.loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if not waiter.cancelled():
+                    # Pass on the turn this poll was woken up for
+                    self._async_wake_next()
+                raise
+
+        self._polling += 1
+        start = time.monotonic()
+        stats.last_wait = start - wait_start
+        stats.max_wait = max(stats.max_wait, stats.last_wait)
+        try:
+            await poll()
+        finally:
+            self._polling -= 1
+            self._async_record(stats, time.monotonic() - start)
+            if self._polling < self.concurrency:
+                self._async_wake_next()
+
+    @callback
+    def _async_wake_next(self) -> None:
+        """Wake up the next waiting poll."""
+        waiters = self._waiters
+        while waiters:
+            if not (waiter := waiters.popleft()).done():
+                waiter.set_result(None)
                 return
 
-            if tasks := [
-                entity.async_update_ha_state(True)
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+    @callback
+    def _async_record(
+        self, stats: PollingStats, duration: float, limited: bool = True
+    ) -> None:
+        """Record the duration of a poll and adapt the limit to it.
+
+        Polls that are not limited do not change the limit.
+        """
+        stats.polls += 1
+        stats.last_duration = duration
+        stats.max_duration = max(stats.max_duration, duration)
+        if stats.polls == 1:
+            stats.average_duration = stats.baseline_duration = duration
+            return
+
+        stats.average_duration += (
+            duration - stats.average_duration
+        ) * POLL_DURATION_SMOOTHING
+        if stats.average_duration < stats.baseline_duration:
+            stats.baseline_duration = stats.average_duration
+        else:
+            # Let the baseline follow platforms that became slower for good
+            stats.baseline_duration += (
+                stats.average_duration - stats.baseline_duration
+            ) * POLL_BASELINE_DRIFT
+
+        slow = stats.average_duration > max(
+            stats.baseline_duration * POLL_SLOWDOWN_FACTOR,
+            stats.baseline_duration + POLL_SLOWDOWN_MIN,
+        )
+        if not slow or not limited:
+            self._slow.discard(stats)
+            if not limited:
+                return
+        elif stats in self._tracked:
+            self._slow.add(stats)
+
+        if len(self._slow) >= max(
+            POLL_SLOW_PLATFORMS_MIN, len(self._tracked) * POLL_SLOW_PLATFORMS_SHARE
+        ):
+            self.concurrency = max(POLL_CONCURRENCY_MIN, self.concurrency - 1)
+        elif not slow and self._waiters and self.concurrency < POLL_CONCURRENCY_MAX:
+            self.concurrency += 1
+            self._async_wake_next()
+
+
+@callback
+def _async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    if (scheduler := hass.data.get(DATA_POLLING_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_POLLING_SCHEDULER] = PollingScheduler(hass)
+    return scheduler
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
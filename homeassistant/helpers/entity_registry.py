@@ -436,9 +436,12 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains five additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - device_id -> entity_ids
+    - area_id -> entity_ids
+    - config_entry_id -> entity_ids
     """
 
     def __init__(self) -> None:
@@ -446,6 +449,10 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        # The entity_ids are the keys of dicts to keep them in insertion order
+        self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -455,19 +462,55 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         """Add an item."""
         data = self.data
         if key in data:
-            old_entry = data[key]
-            del self._entry_ids[old_entry.id]
-            del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            self._unindex_entry(key, data[key], entry)
         data[key] = entry
-        self._entry_ids[entry.id] = entry
-        self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._index_entry(key, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
-        entry = self[key]
+        self._unindex_entry(key, self[key])
+        super().__delitem__(key)
+
+    def _index_entry(self, key: str, entry: RegistryEntry) -> None:
+        """Add an entry to the indexes."""
+        self._entry_ids[entry.id] = entry
+        self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for index, value in (
+            (self._device_id_index, entry.device_id),
+            (self._area_id_index, entry.area_id),
+            (self._config_entry_id_index, entry.config_entry_id),
+        ):
+            if value is not None:
+                index.setdefault(value, {})[key] = True
+
+    def _unindex_entry(
+        self, key: str, entry: RegistryEntry, new_entry: RegistryEntry | None = None
+    ) -> None:
+        """Remove an entry from the indexes.
+
+        When the entry is replaced by new_entry, keys whose indexed value has
+        not changed are left in place so the index keeps its order.
+        """
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
-        super().__delitem__(key)
+        for index, value, new_value in (
+            (
+                self._device_id_index,
+                entry.device_id,
+                new_entry and new_entry.device_id,
+            ),
+            (self._area_id_index, entry.area_id, new_entry and new_entry.area_id),
+            (
+                self._config_entry_id_index,
+                entry.config_entry_id,
+                new_entry and new_entry.config_entry_id,
+            ),
+        ):
+            if value is not None and value != new_value:
+                keys = index[value]
+                del keys[key]
+                if not keys:
+                    del index[value]
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
@@ -477,6 +520,31 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device."""
+        data = self.data
+        return [
+            entry
+            for key in self._device_id_index.get(device_id, ())
+            if not (entry := data[key]).disabled_by or include_disabled_entities
+        ]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -1158,12 +1226,8 @@ class EntityRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry_id == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry_id):
+            self.async_remove(entry.entity_id)
         for key, deleted_entity in list(self.deleted_entities.items()):
             if config_entry_id != deleted_entity.config_entry_id:
                 continue
@@ -1192,9 +1256,8 @@ class EntityRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self.async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self.async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -1215,12 +1278,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    return registry.entities.get_entries_for_device_id(
+        device_id, include_disabled_entities
+    )
 
 
 @callback
@@ -1228,7 +1288,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -1236,11 +1296,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
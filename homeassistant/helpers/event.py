@@ -17,6 +17,7 @@ import attr
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -50,6 +51,8 @@ from .typing import EventType, TemplateVarsType
 
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
 TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
+TRACK_STATE_CHANGE_BATCH_LISTENER = "track_state_change_batch_listener"
+TRACK_STATE_CHANGE_DISPATCHER = "track_state_change_dispatcher"
 
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
@@ -135,6 +138,12 @@ class EventStateChangedData(TypedDict):
     new_state: State | None
 
 
+class EventStateChangedBatchData(TypedDict):
+    """EventStateChangedBatch data."""
+
+    events: list[EventType[EventStateChangedData]]
+
+
 def threaded_listener_factory(
     async_factory: Callable[Concatenate[HomeAssistant, _P], Any]
 ) -> Callable[Concatenate[HomeAssistant, _P], CALLBACK_TYPE]:
@@ -250,8 +259,8 @@ def async_track_state_change(
         # entity_id.
         return async_track_state_change_event(hass, entity_ids, state_change_listener)
 
-    return hass.bus.async_listen(
-        EVENT_STATE_CHANGED, state_change_dispatcher, event_filter=state_change_filter  # type: ignore[arg-type]
+    return _async_listen_state_changed(
+        hass, state_change_dispatcher, event_filter=state_change_filter
     )
 
 
@@ -301,13 +310,52 @@ def _async_dispatch_entity_id_event(
 
 
 @callback
-def _async_state_change_filter(
+def _async_dispatch_entity_id_batch_event(
     hass: HomeAssistant,
     callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["entity_id"] in callbacks
+    event: EventType[EventStateChangedBatchData],
+) -> None:
+    """Dispatch each state change in a batch to listeners."""
+    for state_event in event.data["events"]:
+        _async_dispatch_entity_id_event(hass, callbacks, state_event)
+
+
+@callback
+def _async_listen_state_changed(
+    hass: HomeAssistant,
+    action: Callable[[EventType[EventStateChangedData]], Any],
+    event_filter: Callable[[EventType[EventStateChangedData]], bool] | None = None,
+    run_immediately: bool = False,
+) -> CALLBACK_TYPE:
+    """Listen for all state changes, including coalesced state changes."""
+    job = HassJob(action, f"listen {EVENT_STATE_CHANGED_BATCH}")
+
+    @callback
+    def _async_dispatch_batch(event: EventType[EventStateChangedBatchData]) -> None:
+        """Dispatch each state change in a batch to the action."""
+        for state_event in event.data["events"]:
+            if event_filter is None or event_filter(state_event):
+                hass.async_run_hass_job(job, state_event)
+
+    remove_listener = hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        action,  # type: ignore[arg-type]
+        event_filter=event_filter,  # type: ignore[arg-type]
+        run_immediately=run_immediately,
+    )
+    remove_batch_listener = hass.bus.async_listen(
+        EVENT_STATE_CHANGED_BATCH,
+        _async_dispatch_batch,  # type: ignore[arg-type]
+        run_immediately=run_immediately,
+    )
+
+    @callback
+    def _remove_listeners() -> None:
+        """Remove the state changed listeners."""
+        remove_listener()
+        remove_batch_listener()
+
+    return _remove_listeners
 
 
 @bind_hass
@@ -316,19 +364,83 @@ def _async_track_state_change_event(
     entity_ids: str | Iterable[str],
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
-    """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        hass,
-        entity_ids,
-        TRACK_STATE_CHANGE_CALLBACKS,
-        TRACK_STATE_CHANGE_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_entity_id_event,
-        _async_state_change_filter,
-        action,
+    """async_track_state_change_event without lowercasing.
+
+    The event bus indexes the dispatcher by entity_id so state
+    changes for entities nobody tracks never reach the dispatcher.
+    """
+    if not entity_ids:
+        return _remove_empty_listener
+
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+
+    hass_data = hass.data
+
+    callbacks: dict[
+        str, list[HassJob[[EventType[EventStateChangedData]], Any]]
+    ] | None = hass_data.get(TRACK_STATE_CHANGE_CALLBACKS)
+    if not callbacks:
+        callbacks = hass_data[TRACK_STATE_CHANGE_CALLBACKS] = {}
+        hass_data[TRACK_STATE_CHANGE_LISTENER] = {}
+        hass_data[TRACK_STATE_CHANGE_BATCH_LISTENER] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED_BATCH,
+            ft.partial(_async_dispatch_entity_id_batch_event, hass, callbacks),
+        )
+        # One dispatcher job is keyed by every tracked entity_id,
+        # so the bus counts it as a single listener
+        hass_data[TRACK_STATE_CHANGE_DISPATCHER] = (
+            HassJob(
+                ft.partial(_async_dispatch_entity_id_event, hass, callbacks),
+                f"listen {EVENT_STATE_CHANGED}",
+            ),
+            None,
+            False,
+        )
+
+    listeners: dict[str, CALLBACK_TYPE] = hass_data[TRACK_STATE_CHANGE_LISTENER]
+    dispatcher_job = hass_data[TRACK_STATE_CHANGE_DISPATCHER]
+
+    job = HassJob(action, f"track {EVENT_STATE_CHANGED} event {entity_ids}")
+
+    for entity_id in entity_ids:
+        callback_list = callbacks.get(entity_id)
+        if callback_list:
+            callback_list.append(job)
+            continue
+        callbacks[entity_id] = [job]
+        # pylint: disable-next=protected-access
+        listeners[entity_id] = hass.bus._async_listen_keyed_filterable_job(
+            EVENT_STATE_CHANGED, entity_id, dispatcher_job
+        )
+
+    return ft.partial(
+        _remove_state_change_listener, hass, entity_ids, job, callbacks, listeners
     )
 
 
+@callback
+def _remove_state_change_listener(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str],
+    job: HassJob[[EventType[EventStateChangedData]], Any],
+    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
+    listeners: dict[str, CALLBACK_TYPE],
+) -> None:
+    """Remove state change listener."""
+    for entity_id in entity_ids:
+        callbacks[entity_id].remove(job)
+        if len(callbacks[entity_id]) == 0:
+            del callbacks[entity_id]
+            listeners.pop(entity_id)()
+
+    if not callbacks:
+        del hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+        del hass.data[TRACK_STATE_CHANGE_LISTENER]
+        del hass.data[TRACK_STATE_CHANGE_DISPATCHER]
+        hass.data.pop(TRACK_STATE_CHANGE_BATCH_LISTENER)()
+
+
 @callback
 def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
@@ -393,11 +505,18 @@ def _async_track_event(
         callbacks = hass_data[callbacks_key] = {}
 
     if listeners_key not in hass_data:
-        hass_data[listeners_key] = hass.bus.async_listen(
-            event_type,
-            ft.partial(dispatcher_callable, hass, callbacks),
-            event_filter=ft.partial(filter_callable, hass, callbacks),
-        )
+        if event_type == EVENT_STATE_CHANGED:
+            hass_data[listeners_key] = _async_listen_state_changed(
+                hass,
+                ft.partial(dispatcher_callable, hass, callbacks),
+                event_filter=ft.partial(filter_callable, hass, callbacks),
+            )
+        else:
+            hass_data[listeners_key] = hass.bus.async_listen(
+                event_type,
+                ft.partial(dispatcher_callable, hass, callbacks),
+                event_filter=ft.partial(filter_callable, hass, callbacks),
+            )
 
     job = HassJob(action, f"track {event_type} event {keys}")
 
@@ -760,8 +879,8 @@ class _TrackStateChangeFiltered:
 
     @callback
     def _setup_all_listener(self) -> None:
-        self._listeners[_ALL_LISTENER] = self.hass.bus.async_listen(
-            EVENT_STATE_CHANGED, self._action  # type: ignore[arg-type]
+        self._listeners[_ALL_LISTENER] = _async_listen_state_changed(
+            self.hass, self._action
         )
 
 
@@ -911,6 +1030,7 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._aggregate_listeners: dict[Template, Callable[[], None] | None] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -964,6 +1084,9 @@ class TrackTemplateResultInfo:
                 else:
                     log_fn(logging.ERROR, str(info.exception))
 
+        for template, info in self._info.items():
+            self._setup_aggregate_listener(template, info)
+
         self._track_state_changes = async_track_state_change_filtered(
             self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
         )
@@ -1017,6 +1140,40 @@ class TrackTemplateResultInfo:
         for template, info in self._info.items():
             self._setup_time_listener(template, info.has_time)
 
+    @callback
+    def _setup_aggregate_listener(self, template: Template, info: RenderInfo) -> None:
+        """Keep the result of a template that counts or sums states up to date.
+
+        Templates like ``states.light | selectattr('state', 'eq', 'on') | list
+        | count`` re-render on every state change of their domain. Their
+        result is instead updated for each state change, so a re-render no
+        longer iterates all states.
+        """
+        if template in self._aggregate_listeners or not (
+            info.domains or info.all_states
+        ):
+            return
+        if (aggregate := template.async_start_aggregate()) is None:
+            self._aggregate_listeners[template] = None
+            return
+
+        @callback
+        def _async_update_aggregate(event: EventType[EventStateChangedData]) -> None:
+            aggregate.async_update(event.data["entity_id"])
+
+        # Run immediately so the aggregate is up to date when the
+        # state change reaches the listeners that re-render the template
+        remove_listener = _async_listen_state_changed(
+            self.hass, _async_update_aggregate, run_immediately=True
+        )
+
+        @callback
+        def _async_remove_aggregate_listener() -> None:
+            remove_listener()
+            template.async_stop_aggregate()
+
+        self._aggregate_listeners[template] = _async_remove_aggregate_listener
+
     @callback
     def async_remove(self) -> None:
         """Cancel the listener."""
@@ -1025,6 +1182,10 @@ class TrackTemplateResultInfo:
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
+        for remove_aggregate_listener in self._aggregate_listeners.values():
+            if remove_aggregate_listener is not None:
+                remove_aggregate_listener()
+        self._aggregate_listeners.clear()
 
     @callback
     def async_refresh(self) -> None:
@@ -1078,6 +1239,7 @@ class TrackTemplateResultInfo:
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        self._setup_aggregate_listener(template, info)
 
         try:
             result: str | TemplateError = info.result()
@@ -1334,8 +1496,8 @@ def async_track_same_state(
     async_remove_state_for_listener = async_call_later(hass, period, state_for_listener)
 
     if entity_ids == MATCH_ALL:
-        async_remove_state_for_cancel = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, state_for_cancel_listener  # type: ignore[arg-type]
+        async_remove_state_for_cancel = _async_listen_state_changed(
+            hass, state_for_cancel_listener
         )
     else:
         async_remove_state_for_cancel = async_track_state_change_event(
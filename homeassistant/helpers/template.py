@@ -8,6 +8,7 @@ import collections.abc
 from collections.abc import Callable, Collection, Generator, Iterable, MutableMapping
 from contextlib import AbstractContextManager, suppress
 from contextvars import ContextVar
+from copy import copy
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
 import json
@@ -36,7 +37,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import meta, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -58,6 +59,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -80,6 +82,13 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .template_compiler import (
+    FallbackToJinja,
+    FastRender,
+    StateAggregate,
+    compile_fast_render,
+    compile_state_aggregate,
+)
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -92,6 +101,7 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_RENDER_CACHE = "template.render_cache"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -145,6 +155,10 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+# The number of template renders shared between templates with the same source
+RENDER_CACHE_SIZE = 1024
+_SHAREABLE_RESULT_TYPES = {str, int, float, bool, type(None)}
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
 CACHED_TEMPLATE_LRU: MutableMapping[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
@@ -342,6 +356,7 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "_entities_read",
     )
 
     def __init__(self, template: Template) -> None:
@@ -360,6 +375,8 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # Entities whose state was read, even if none of its properties were
+        self._entities_read: set[str] = set()
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -455,6 +472,9 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_fast_render",
+        "_free_names",
+        "_aggregate",
         "_exc_info",
         "_limited",
         "_strict",
@@ -471,6 +491,9 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_render: FastRender | None = None
+        self._free_names: frozenset[str] = frozenset()
+        self._aggregate: StateAggregate | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -566,7 +589,9 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            render_result = _render_fast_with_context(
+                self.template, compiled, self._aggregate or self._fast_render, kwargs
+            )
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -690,6 +715,14 @@ class Template:
             render_info._freeze_static()
             return render_info
 
+        render_cache_key = self._render_cache_key(variables, log_fn, kwargs)
+        if render_cache_key is not None and (
+            shared_render_info := _async_get_shared_render(
+                self.hass, render_cache_key, self
+            )
+        ):
+            return shared_render_info
+
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(
@@ -701,8 +734,77 @@ class Template:
             _render_info.reset(token)
 
         render_info._freeze()
+        # The first render compiles the template, so check the key again
+        if (
+            render_cache_key := self._render_cache_key(variables, log_fn, kwargs)
+        ) is not None:
+            _async_share_render(self.hass, render_cache_key, render_info)
         return render_info
 
+    def _render_cache_key(
+        self,
+        variables: TemplateVarsType,
+        log_fn: Callable[[int, str], None] | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[str, bool, bool] | None:
+        """Return the key a render is shared by, or None if it can not be shared.
+
+        Only renders of compiled templates are shared, as they can only read
+        states, the registries and the variables they were rendered with.
+        """
+        if (
+            self._fast_render is None
+            or log_fn is not None
+            or self._log_fn is not None
+            or kwargs
+            or (variables and not self._free_names.isdisjoint(variables))
+        ):
+            return None
+        return (self.template, bool(self._limited), bool(self._strict))
+
+    @callback
+    def async_start_aggregate(self) -> StateAggregate | None:
+        """Keep the result of a template that counts or sums states up to date.
+
+        Returns None if the template does not aggregate states or its result
+        is already kept up to date. The caller must pass all state changes
+        to the aggregate, and stop it with async_stop_aggregate.
+        """
+        if (
+            self._aggregate is not None
+            or self._compiled is None
+            or self._limited
+            or self.hass is None
+        ):
+            return None
+        if (aggregate := compile_state_aggregate(self._env, self.template)) is None:
+            return None
+        hass = self.hass
+        collect: Callable[[], None]
+        if aggregate.domain is None:
+            collect = AllStates(hass)._collect_all  # pylint: disable=protected-access
+        elif aggregate.domain in _RESERVED_NAMES or not valid_domain(aggregate.domain):
+            return None
+        else:
+            domain_states = DomainStates(hass, aggregate.domain)
+            collect = domain_states._collect_domain  # pylint: disable=protected-access
+
+        def _get_state(entity_id: str) -> TemplateState | None:
+            if (state := hass.states.get(entity_id)) is None:
+                return None
+            return _template_state_no_collect(hass, state)
+
+        aggregate.async_start(
+            _state_generator(hass, aggregate.domain), _get_state, collect
+        )
+        self._aggregate = aggregate
+        return aggregate
+
+    @callback
+    def async_stop_aggregate(self) -> None:
+        """Stop keeping the result of the template up to date."""
+        self._aggregate = None
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -745,7 +847,9 @@ class Template:
             variables["value_json"] = json_loads(value)
 
         try:
-            return _render_with_context(self.template, compiled, **variables).strip()
+            return _render_fast_with_context(
+                self.template, compiled, self._fast_render, variables
+            ).strip()
         except jinja2.TemplateError as ex:
             if error_value is _SENTINEL:
                 _LOGGER.error(
@@ -786,6 +890,10 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        ast = env.parse(self.template)
+        if (fast_render := compile_fast_render(env, ast)) is not None:
+            self._free_names = frozenset(meta.find_undeclared_variables(ast))
+        self._fast_render = fast_render
 
         return self._compiled
 
@@ -1134,6 +1242,8 @@ def _get_template_state_from_state(
         # access to the state properties in the state wrapper.
         _collect_state(hass, entity_id)
         return None
+    if (render_info := _render_info.get()) is not None:
+        render_info._entities_read.add(entity_id)  # pylint: disable=protected-access
     return _template_state(hass, state)
 
 
@@ -2243,6 +2353,99 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+@callback
+def _async_get_shared_render(
+    hass: HomeAssistant, key: tuple[str, bool, bool], template: Template
+) -> RenderInfo | None:
+    """Return the render of a template with the same source if still valid.
+
+    States are immutable and replaced when they change, so a render is valid
+    while the entities it read still have the same state objects and the
+    registries did not change.
+    """
+    if (render_cache := hass.data.get(_RENDER_CACHE)) is None or (
+        shared := render_cache.get(key)
+    ) is None:
+        return None
+    render_info: RenderInfo = shared[0]
+    get_state = hass.states.get
+    for entity_id, state in shared[1]:
+        if get_state(entity_id) is not state:
+            return None
+    render_info = copy(render_info)
+    render_info.template = template
+    return render_info
+
+
+@callback
+def _async_share_render(
+    hass: HomeAssistant, key: tuple[str, bool, bool], render_info: RenderInfo
+) -> None:
+    """Share a render with the templates with the same source."""
+    # pylint: disable=protected-access
+    if (
+        render_info.exception
+        or render_info.has_time
+        or render_info.all_states
+        or render_info.all_states_lifecycle
+        or render_info.domains
+        or render_info.domains_lifecycle
+        or type(render_info._result) not in _SHAREABLE_RESULT_TYPES
+    ):
+        return
+    if (render_cache := hass.data.get(_RENDER_CACHE)) is None:
+        render_cache = hass.data[_RENDER_CACHE] = _async_create_render_cache(hass)
+    get_state = hass.states.get
+    entity_ids = render_info._entities_read.union(render_info.entities)
+    render_cache[key] = (
+        render_info,
+        tuple((entity_id, get_state(entity_id)) for entity_id in entity_ids),
+    )
+
+
+@callback
+def _async_create_render_cache(hass: HomeAssistant) -> MutableMapping[Any, Any]:
+    """Create the cache of shared renders.
+
+    Renders can depend on the registries, like a rounded sensor state on
+    the display precision of its entity, so the cache is cleared when any
+    of them changes.
+    """
+    render_cache: MutableMapping[Any, Any] = LRU(RENDER_CACHE_SIZE)
+
+    @callback
+    def _async_clear_render_cache(_: Event) -> None:
+        """Clear the shared renders."""
+        render_cache.clear()
+
+    for event_type in (
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(
+            event_type, _async_clear_render_cache, run_immediately=True
+        )
+    return render_cache
+
+
+def _render_fast_with_context(
+    template_str: str,
+    template: jinja2.Template,
+    fast_render: FastRender | None,
+    variables: dict[str, Any],
+) -> str:
+    """Render a template without Jinja if it was compiled to a fast render."""
+    if fast_render is None:
+        return _render_with_context(template_str, template, **variables)
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        try:
+            return fast_render(variables)
+        except FallbackToJinja:
+            return template.render(**variables)
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
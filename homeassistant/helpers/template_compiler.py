@@ -0,0 +1,691 @@
+"""Compile simple templates to Python functions that bypass the Jinja runtime.
+
+Most templates are a single expression reading a few states, like
+``{{ states('sensor.power') | float(0) * 2 }}``. Rendering such a template
+through Jinja creates a render context, resolves every name through it and
+runs the sandbox checks for every call and filter.
+
+This module compiles the Jinja syntax tree of these templates to nested
+Python closures that call the same template functions and filters directly.
+The functions are looked up once, when the template is compiled. Attribute
+and item access still go through the sandbox of the environment.
+
+Templates that use anything else are not compiled and always render
+through Jinja. A compiled template that runs into an undefined value
+raises FallbackToJinja, so the caller renders it through Jinja instead.
+
+Templates that count or sum the states of a domain, like
+``{{ states.light | selectattr('state', 'eq', 'on') | list | count }}``,
+can also be compiled to a StateAggregate. It keeps the value of every state
+and updates its result for each state change, instead of iterating all
+states of the domain on every render.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+import inspect
+import operator
+from typing import Any
+
+import jinja2
+from jinja2 import nodes
+from jinja2.filters import make_attrgetter
+from jinja2.runtime import Undefined
+from jinja2.utils import _PassArg
+
+# Functions bound to hass that ignore the Jinja context they are passed
+_HASS_FUNCTIONS = {
+    "has_value",
+    "is_state",
+    "is_state_attr",
+    "now",
+    "state_attr",
+    "utcnow",
+}
+
+_GLOBALS = {
+    *_HASS_FUNCTIONS,
+    "bool",
+    "float",
+    "int",
+    "max",
+    "min",
+    "states",
+}
+
+_FILTERS = {
+    "abs",
+    "bool",
+    "float",
+    "has_value",
+    "int",
+    "is_number",
+    "lower",
+    "multiply",
+    "round",
+    "state_attr",
+    "states",
+    "string",
+    "upper",
+}
+
+_BINARY_OPERATORS: dict[type[nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+    nodes.Mod: operator.mod,
+    nodes.Pow: operator.pow,
+}
+
+_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "in": lambda value, container: value in container,
+    "notin": lambda value, container: value not in container,
+}
+
+_NOT_CONSTANT = (nodes.Call, nodes.Filter, nodes.Test, nodes.Name)
+
+_AGGREGATE_TERMINALS = {"count", "length", "sum"}
+
+# Returned by a step of a state aggregate for a state that is filtered out
+_EXCLUDED = object()
+
+Variables = Mapping[str, Any]
+FastRender = Callable[[Variables], str]
+_Expression = Callable[[Variables], Any]
+_Output = Callable[[Variables, list[str]], None]
+_Step = Callable[[Any], Any]
+
+
+class FallbackToJinja(Exception):
+    """Raised when a compiled template must render through Jinja."""
+
+
+class _Unsupported(Exception):
+    """Raised when a template can not be compiled."""
+
+
+def compile_fast_render(
+    env: jinja2.Environment, source: str | nodes.Template
+) -> FastRender | None:
+    """Compile a template to a function that renders it to a string.
+
+    Returns None when the template uses anything that is not supported.
+    """
+    try:
+        template = env.parse(source) if isinstance(source, str) else source
+        return _Compiler(env).compile_template(template)
+    except (_Unsupported, jinja2.TemplateSyntaxError):
+        return None
+
+
+def _constant(value: Any) -> _Expression:
+    """Return an expression that always has the same value."""
+    return lambda _: value
+
+
+class _Compiler:
+    """Compile the nodes of a template."""
+
+    def __init__(self, env: jinja2.Environment) -> None:
+        """Initialize the compiler."""
+        self._env = env
+        self._eval_ctx = nodes.EvalContext(env)
+
+    def compile_template(self, template: nodes.Template) -> FastRender:
+        """Compile the body of a template."""
+        body = self._statements(template.body)
+
+        def _render(variables: Variables) -> str:
+            parts: list[str] = []
+            body(variables, parts)
+            return "".join(parts)
+
+        return _render
+
+    def _statements(self, statements: list[nodes.Node]) -> _Output:
+        """Compile a list of statements."""
+        outputs = [self._statement(statement) for statement in statements]
+        if len(outputs) == 1:
+            return outputs[0]
+
+        def _output(variables: Variables, parts: list[str]) -> None:
+            for output in outputs:
+                output(variables, parts)
+
+        return _output
+
+    def _statement(self, statement: nodes.Node) -> _Output:
+        """Compile a statement."""
+        if isinstance(statement, nodes.Output):
+            return self._output(statement)
+        if isinstance(statement, nodes.If):
+            return self._if(statement)
+        raise _Unsupported
+
+    def _output(self, output: nodes.Output) -> _Output:
+        """Compile an output statement."""
+        expressions: list[_Expression] = []
+        for node in output.nodes:
+            if isinstance(node, nodes.TemplateData):
+                expressions.append(_constant(node.data))
+            else:
+                expressions.append(self._expression(node))
+
+        def _write(variables: Variables, parts: list[str]) -> None:
+            for expression in expressions:
+                parts.append(str(expression(variables)))
+
+        return _write
+
+    def _if(self, statement: nodes.If) -> _Output:
+        """Compile an if statement with its elif and else branches."""
+        branches = [
+            (self._expression(branch.test), self._statements(branch.body))
+            for branch in (statement, *statement.elif_)
+        ]
+        else_ = self._statements(statement.else_) if statement.else_ else None
+
+        def _write(variables: Variables, parts: list[str]) -> None:
+            for test, body in branches:
+                if test(variables):
+                    body(variables, parts)
+                    return
+            if else_ is not None:
+                else_(variables, parts)
+
+        return _write
+
+    def _expression(self, node: nodes.Node) -> _Expression:
+        """Compile an expression."""
+        if not isinstance(node, nodes.Expr):
+            raise _Unsupported
+        # Fold constant expressions, but never call functions or filters
+        # ahead of time as their results change with the states.
+        if not isinstance(node, _NOT_CONSTANT) and not any(
+            node.find_all(_NOT_CONSTANT)
+        ):
+            try:
+                value = node.as_const(self._eval_ctx)
+            except nodes.Impossible:
+                pass
+            else:
+                return _constant(value)
+
+        if isinstance(node, nodes.Name):
+            return self._name(node)
+        if isinstance(node, nodes.Getattr):
+            return self._getattr(node)
+        if isinstance(node, nodes.Getitem):
+            return self._getitem(node)
+        if isinstance(node, nodes.Call):
+            return self._call(node)
+        if isinstance(node, nodes.Filter):
+            return self._filter(node)
+        if isinstance(node, nodes.BinExpr):
+            return self._binary(node)
+        if isinstance(node, nodes.Compare):
+            return self._compare(node)
+        if isinstance(node, (nodes.Neg, nodes.Pos, nodes.Not)):
+            return self._unary(node)
+        if isinstance(node, nodes.CondExpr):
+            return self._condition(node)
+        if isinstance(node, nodes.Concat):
+            return self._concat(node)
+        if isinstance(node, (nodes.List, nodes.Tuple)):
+            return self._sequence(node)
+        raise _Unsupported
+
+    def _name(self, node: nodes.Name) -> _Expression:
+        """Compile the lookup of a variable or a global."""
+        name = node.name
+        env_globals = self._env.globals
+
+        def _lookup(variables: Variables) -> Any:
+            if name in variables:
+                return variables[name]
+            if name in env_globals:
+                return env_globals[name]
+            raise FallbackToJinja
+
+        return _lookup
+
+    def _getattr(self, node: nodes.Getattr) -> _Expression:
+        """Compile an attribute lookup through the sandbox."""
+        obj = self._expression(node.node)
+        attribute = node.attr
+        env_getattr = self._env.getattr
+
+        def _lookup(variables: Variables) -> Any:
+            if isinstance(value := env_getattr(obj(variables), attribute), Undefined):
+                raise FallbackToJinja
+            return value
+
+        return _lookup
+
+    def _getitem(self, node: nodes.Getitem) -> _Expression:
+        """Compile an item lookup through the sandbox."""
+        if isinstance(node.arg, nodes.Slice):
+            raise _Unsupported
+        obj = self._expression(node.node)
+        item = self._expression(node.arg)
+        env_getitem = self._env.getitem
+
+        def _lookup(variables: Variables) -> Any:
+            if isinstance(
+                value := env_getitem(obj(variables), item(variables)), Undefined
+            ):
+                raise FallbackToJinja
+            return value
+
+        return _lookup
+
+    def _call(self, node: nodes.Call) -> _Expression:
+        """Compile a call of a global function."""
+        if (
+            not isinstance(node.node, nodes.Name)
+            or (name := node.node.name) not in _GLOBALS
+            or name not in self._env.globals
+        ):
+            raise _Unsupported
+        function = self._callable(name, self._env.globals[name])
+        args, kwargs = self._arguments(node)
+
+        def _call(variables: Variables) -> Any:
+            if name in variables:
+                # The global is shadowed by a variable
+                raise FallbackToJinja
+            return function(
+                *(arg(variables) for arg in args),
+                **{key: kwarg(variables) for key, kwarg in kwargs.items()},
+            )
+
+        return _call
+
+    def _filter(self, node: nodes.Filter) -> _Expression:
+        """Compile a filter."""
+        if (
+            node.node is None
+            or (name := node.name) not in _FILTERS
+            or name not in self._env.filters
+        ):
+            raise _Unsupported
+        function = self._callable(name, self._env.filters[name])
+        value = self._expression(node.node)
+        args, kwargs = self._arguments(node)
+
+        def _filter(variables: Variables) -> Any:
+            return function(
+                value(variables),
+                *(arg(variables) for arg in args),
+                **{key: kwarg(variables) for key, kwarg in kwargs.items()},
+            )
+
+        return _filter
+
+    def _callable(self, name: str, function: Any) -> Callable[..., Any]:
+        """Return a function that can be called without the Jinja runtime."""
+        # Look the marker up statically, the states global answers any attribute
+        pass_arg = inspect.getattr_static(function, "jinja_pass_arg", None)
+        if not isinstance(pass_arg, _PassArg):
+            return function  # type: ignore[no-any-return]
+        if pass_arg.name == "context" and name in _HASS_FUNCTIONS:
+            return lambda *args, **kwargs: function(None, *args, **kwargs)
+        if pass_arg.name == "environment":
+            env = self._env
+            return lambda *args, **kwargs: function(env, *args, **kwargs)
+        raise _Unsupported
+
+    def _arguments(
+        self, node: nodes.Call | nodes.Filter
+    ) -> tuple[list[_Expression], dict[str, _Expression]]:
+        """Compile the arguments of a call or filter."""
+        if node.dyn_args is not None or node.dyn_kwargs is not None:
+            raise _Unsupported
+        return [self._expression(arg) for arg in node.args], {
+            str(keyword.key): self._expression(keyword.value) for keyword in node.kwargs
+        }
+
+    def _binary(self, node: nodes.BinExpr) -> _Expression:
+        """Compile an arithmetic expression."""
+        if (binary_operator := _BINARY_OPERATORS.get(type(node))) is None:
+            # And and Or
+            return self._logical(node)
+        apply = binary_operator
+        left = self._expression(node.left)
+        right = self._expression(node.right)
+        return lambda variables: apply(left(variables), right(variables))
+
+    def _logical(self, node: nodes.BinExpr) -> _Expression:
+        """Compile an and or or expression."""
+        left = self._expression(node.left)
+        right = self._expression(node.right)
+        if isinstance(node, nodes.And):
+            return lambda variables: left(variables) and right(variables)
+        if isinstance(node, nodes.Or):
+            return lambda variables: left(variables) or right(variables)
+        raise _Unsupported
+
+    def _compare(self, node: nodes.Compare) -> _Expression:
+        """Compile a chain of comparisons."""
+        first = self._expression(node.expr)
+        operands = [
+            (_COMPARE_OPERATORS[operand.op], self._expression(operand.expr))
+            for operand in node.ops
+        ]
+
+        def _compare(variables: Variables) -> bool:
+            left = first(variables)
+            for compare_operator, expression in operands:
+                right = expression(variables)
+                if not compare_operator(left, right):
+                    return False
+                left = right
+            return True
+
+        return _compare
+
+    def _unary(self, node: nodes.UnaryExpr) -> _Expression:
+        """Compile a unary expression."""
+        operand = self._expression(node.node)
+        if isinstance(node, nodes.Not):
+            return lambda variables: not operand(variables)
+        if isinstance(node, nodes.Neg):
+            return lambda variables: -operand(variables)
+        return lambda variables: +operand(variables)
+
+    def _condition(self, node: nodes.CondExpr) -> _Expression:
+        """Compile an inline if expression."""
+        test = self._expression(node.test)
+        true_value = self._expression(node.expr1)
+        false_value = self._expression(node.expr2) if node.expr2 else None
+
+        def _condition(variables: Variables) -> Any:
+            if test(variables):
+                return true_value(variables)
+            if false_value is None:
+                # Without else the result is undefined
+                raise FallbackToJinja
+            return false_value(variables)
+
+        return _condition
+
+    def _concat(self, node: nodes.Concat) -> _Expression:
+        """Compile a string concatenation with ~."""
+        expressions = [self._expression(expression) for expression in node.nodes]
+        return lambda variables: "".join(
+            str(expression(variables)) for expression in expressions
+        )
+
+    def _sequence(self, node: nodes.List | nodes.Tuple) -> _Expression:
+        """Compile a list or tuple."""
+        items = [self._expression(item) for item in node.items]
+        factory: Callable[[Any], Any] = list if isinstance(node, nodes.List) else tuple
+        return lambda variables: factory(item(variables) for item in items)
+
+
+def compile_state_aggregate(
+    env: jinja2.Environment, source: str
+) -> StateAggregate | None:
+    """Compile a template that counts or sums the states of a domain.
+
+    Returns None when the template is not a supported aggregate.
+    """
+    try:
+        return _AggregateCompiler(env).compile_template(env.parse(source))
+    except (_Unsupported, jinja2.TemplateSyntaxError):
+        return None
+
+
+class StateAggregate:
+    """Keep the result of a template that aggregates states up to date.
+
+    The value every state contributes is kept by entity_id, so a state
+    change updates the result without iterating the other states. The
+    aggregate renders like the template, and raises FallbackToJinja when
+    it can not, for example after the value of a state raised an error.
+    """
+
+    __slots__ = (
+        "domain",
+        "valid",
+        "_prefix",
+        "_suffix",
+        "_steps",
+        "_sum",
+        "_values",
+        "_total",
+        "_get_state",
+        "_collect",
+    )
+
+    def __init__(
+        self,
+        domain: str | None,
+        prefix: str,
+        suffix: str,
+        steps: list[_Step],
+        terminal: str,
+    ) -> None:
+        """Initialize the aggregate."""
+        self.domain = domain
+        self.valid = False
+        self._prefix = prefix
+        self._suffix = suffix
+        self._steps = steps
+        self._sum = terminal == "sum"
+        self._values: dict[str, Any] = {}
+        self._total = 0
+        self._get_state: Callable[[str], Any] | None = None
+        self._collect: Callable[[], None] | None = None
+
+    def async_start(
+        self,
+        states: Iterable[Any],
+        get_state: Callable[[str], Any],
+        collect: Callable[[], None],
+    ) -> None:
+        """Start from the current states.
+
+        get_state returns the current state of an entity_id, and collect
+        records that the template iterated the states of the domain.
+        """
+        self._get_state = get_state
+        self._collect = collect
+        self.valid = True
+        for state in states:
+            self._async_set(state.entity_id, state)
+            if not self.valid:
+                return
+
+    def wants(self, entity_id: str) -> bool:
+        """Return if the state of an entity is aggregated."""
+        return self.domain is None or (
+            entity_id.startswith(self.domain)
+            and entity_id[len(self.domain) : len(self.domain) + 1] == "."
+        )
+
+    def async_update(self, entity_id: str) -> None:
+        """Update the result with the current state of an entity."""
+        if self.valid and self.wants(entity_id):
+            assert self._get_state is not None
+            self._async_set(entity_id, self._get_state(entity_id))
+
+    def _async_set(self, entity_id: str, state: Any) -> None:
+        """Replace the value an entity contributes."""
+        value: Any = _EXCLUDED
+        if state is not None:
+            try:
+                value = state
+                for step in self._steps:
+                    if (value := step(value)) is _EXCLUDED:
+                        break
+            except Exception:  # pylint: disable=broad-except
+                # Rendering the template raises the error, leave it to Jinja
+                self.valid = False
+                return
+            # Summing floats in a different order can change the result
+            if self._sum and value is not _EXCLUDED and not isinstance(value, int):
+                self.valid = False
+                return
+
+        values = self._values
+        if (old_value := values.pop(entity_id, _EXCLUDED)) is not _EXCLUDED:
+            self._total -= old_value if self._sum else 1
+        if value is not _EXCLUDED:
+            values[entity_id] = value
+            self._total += value if self._sum else 1
+
+    def __call__(self, variables: Variables) -> str:
+        """Render the result of the template."""
+        if not self.valid or "states" in variables:
+            raise FallbackToJinja
+        assert self._collect is not None
+        self._collect()
+        return f"{self._prefix}{self._total}{self._suffix}"
+
+
+class _AggregateCompiler:
+    """Compile a template that aggregates states to a StateAggregate."""
+
+    def __init__(self, env: jinja2.Environment) -> None:
+        """Initialize the compiler."""
+        self._env = env
+        self._eval_ctx = nodes.EvalContext(env)
+
+    def compile_template(self, template: nodes.Template) -> StateAggregate:
+        """Compile a template that outputs a single aggregate."""
+        if len(template.body) != 1 or not isinstance(
+            output := template.body[0], nodes.Output
+        ):
+            raise _Unsupported
+        expressions = [
+            node for node in output.nodes if not isinstance(node, nodes.TemplateData)
+        ]
+        if len(expressions) != 1:
+            raise _Unsupported
+        index = output.nodes.index(expressions[0])
+        prefix, suffix = (
+            "".join(node.data for node in part if isinstance(node, nodes.TemplateData))
+            for part in (output.nodes[:index], output.nodes[index + 1 :])
+        )
+
+        filters: list[nodes.Filter] = []
+        node = expressions[0]
+        while isinstance(node, nodes.Filter) and node.node is not None:
+            filters.insert(0, node)
+            node = node.node
+        if not filters or filters[-1].name not in _AGGREGATE_TERMINALS:
+            raise _Unsupported
+        terminal = filters.pop()
+        if terminal.name != "sum" and (not filters or filters[-1].name != "list"):
+            # The length of a generator is an error
+            raise _Unsupported
+
+        steps = [self._step(filter_) for filter_ in filters]
+        args, kwargs = self._arguments(terminal)
+        if args or set(kwargs) - ({"attribute"} if terminal.name == "sum" else set()):
+            raise _Unsupported
+        if "attribute" in kwargs:
+            steps.append(make_attrgetter(self._env, kwargs["attribute"]))
+
+        return StateAggregate(
+            self._domain(node),
+            prefix,
+            suffix,
+            [step for step in steps if step is not None],
+            terminal.name,
+        )
+
+    def _domain(self, node: nodes.Node) -> str | None:
+        """Return the domain the states are iterated of, or None for all."""
+        if isinstance(node, nodes.Name) and node.name == "states":
+            return None
+        domain: Any = None
+        if isinstance(node, nodes.Getattr):
+            domain = node.attr
+        elif isinstance(node, nodes.Getitem) and isinstance(node.arg, nodes.Const):
+            domain = node.arg.value
+        if (
+            not isinstance(node, (nodes.Getattr, nodes.Getitem))
+            or not isinstance(node.node, nodes.Name)
+            or node.node.name != "states"
+            or not isinstance(domain, str)
+            or "." in domain
+        ):
+            raise _Unsupported
+        return domain
+
+    def _step(self, node: nodes.Filter) -> _Step | None:
+        """Compile a filter applied to each state."""
+        args, kwargs = self._arguments(node)
+        env = self._env
+        name = node.name
+        if name == "list" and not args and not kwargs:
+            return None
+        if name in ("select", "reject", "selectattr", "rejectattr") and not kwargs:
+            getter: _Step | None = None
+            if name.endswith("attr"):
+                if not args:
+                    raise _Unsupported
+                getter = make_attrgetter(env, args.pop(0))
+            test: _Step = bool
+            if args:
+                test_name = args.pop(0)
+                self._check_pass_arg(env.tests.get(test_name))
+                test = lambda value: env.call_test(test_name, value, args)  # noqa: E731
+            keep = name.startswith("select")
+
+            def _select(value: Any) -> Any:
+                tested = value if getter is None else getter(value)
+                return value if bool(test(tested)) is keep else _EXCLUDED
+
+            return _select
+        if name == "map":
+            if not args and "attribute" in kwargs:
+                if set(kwargs) - {"attribute", "default"}:
+                    raise _Unsupported
+                return make_attrgetter(
+                    env, kwargs["attribute"], default=kwargs.get("default")
+                )
+            if not args:
+                raise _Unsupported
+            filter_name = args.pop(0)
+            self._check_pass_arg(env.filters.get(filter_name))
+            return lambda value: env.call_filter(filter_name, value, args, kwargs)
+        raise _Unsupported
+
+    def _arguments(self, node: nodes.Filter) -> tuple[list[Any], dict[str, Any]]:
+        """Return the constant arguments of a filter."""
+        if (
+            node.dyn_args is not None
+            or node.dyn_kwargs is not None
+            or any(
+                isinstance(arg, _NOT_CONSTANT) or any(arg.find_all(_NOT_CONSTANT))
+                for arg in (*node.args, *node.kwargs)
+            )
+        ):
+            raise _Unsupported
+        try:
+            return [arg.as_const(self._eval_ctx) for arg in node.args], {
+                str(keyword.key): keyword.value.as_const(self._eval_ctx)
+                for keyword in node.kwargs
+            }
+        except nodes.Impossible as err:
+            raise _Unsupported from err
+
+    @staticmethod
+    def _check_pass_arg(function: Any) -> None:
+        """Check a test or filter can be called without a Jinja context."""
+        if function is None:
+            raise _Unsupported
+        pass_arg = inspect.getattr_static(function, "jinja_pass_arg", None)
+        if isinstance(pass_arg, _PassArg) and pass_arg.name != "environment":
+            raise _Unsupported
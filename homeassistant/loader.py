@@ -12,6 +12,7 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
 import sys
 from types import ModuleType
@@ -25,6 +26,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -39,6 +41,7 @@ from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 if TYPE_CHECKING:
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
@@ -48,6 +51,9 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_INTEGRATION_CACHE = "integration_cache"
+INTEGRATION_CACHE_STORAGE_KEY = "core.integration_cache"
+INTEGRATION_CACHE_STORAGE_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -166,6 +172,34 @@ class Manifest(TypedDict, total=False):
     loggers: list[str]
 
 
+class CachedIntegration(TypedDict):
+    """An integration resolved on a previous start."""
+
+    pkg_path: str
+    file_path: str
+    manifest: Manifest
+    dependencies: list[str] | None
+    platforms: list[str] | None
+
+
+class IntegrationCacheData(TypedDict):
+    """Stored integration cache."""
+
+    ha_version: str
+    mtimes: dict[str, int]
+    integrations: dict[str, CachedIntegration]
+
+
+@dataclass(slots=True)
+class IntegrationCache:
+    """Integrations resolved on a previous start."""
+
+    store: Store[IntegrationCacheData]
+    mtimes: dict[str, int]
+    integrations: dict[str, CachedIntegration]
+    loaded: bool
+
+
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the necessary data structures."""
     _async_mount_config_dir(hass)
@@ -173,6 +207,99 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
 
 
+async def async_load_integration_cache(hass: HomeAssistant) -> None:
+    """Load the integrations resolved on the previous start.
+
+    The cache holds the manifests, the resolved dependencies and the platform
+    files of the integrations. It is only used when Home Assistant was not
+    updated and the custom components did not change since it was written.
+    """
+    if hass.config.recovery_mode or hass.config.safe_mode:
+        return
+
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store: Store[IntegrationCacheData] = Store(
+        hass, INTEGRATION_CACHE_STORAGE_VERSION, INTEGRATION_CACHE_STORAGE_KEY
+    )
+    data = await store.async_load()
+    custom_paths = _get_custom_components_paths()
+
+    if (
+        data is not None
+        and data["ha_version"] == __version__
+        and set(custom_paths).issubset(data["mtimes"])
+        and await hass.async_add_executor_job(_get_mtimes, data["mtimes"])
+        == data["mtimes"]
+    ):
+        hass.data[DATA_INTEGRATION_CACHE] = IntegrationCache(
+            store, data["mtimes"], data["integrations"], True
+        )
+        return
+
+    # The times are taken before the custom components are scanned, so a
+    # change during the scan invalidates the cache on the next start.
+    mtimes = await hass.async_add_executor_job(
+        _get_custom_components_mtimes, custom_paths
+    )
+    hass.data[DATA_INTEGRATION_CACHE] = IntegrationCache(store, mtimes, {}, False)
+
+
+async def async_save_integration_cache(hass: HomeAssistant) -> None:
+    """Save the integrations resolved during this start."""
+    integration_cache: IntegrationCache | None = hass.data.get(DATA_INTEGRATION_CACHE)
+    if integration_cache is None:
+        return
+
+    resolved: list[Integration] = [
+        int_or_fut
+        for int_or_fut in hass.data[DATA_INTEGRATIONS].values()
+        # Integration is never subclassed, so we can check for type
+        if type(int_or_fut) is Integration  # noqa: E721
+    ]
+    if isinstance(custom := hass.data.get(DATA_CUSTOM_COMPONENTS), dict):
+        resolved.extend(custom.values())
+
+    integrations = dict(integration_cache.integrations)
+    for integration in resolved:
+        integrations[integration.domain] = {
+            "pkg_path": integration.pkg_path,
+            "file_path": str(integration.file_path),
+            "manifest": integration.manifest,
+            "dependencies": sorted(integration._all_dependencies)
+            if integration._all_dependencies_resolved
+            and integration._all_dependencies is not None
+            else None,
+            "platforms": sorted(integration._platforms)
+            if integration._platforms is not None
+            else None,
+        }
+
+    if unlisted := [
+        domain for domain, cached in integrations.items() if cached["platforms"] is None
+    ]:
+        platforms = await hass.async_add_executor_job(
+            _list_platforms, [integrations[domain]["file_path"] for domain in unlisted]
+        )
+        for domain, domain_platforms in zip(unlisted, platforms):
+            cached = integrations[domain] = integrations[domain].copy()
+            cached["platforms"] = domain_platforms
+
+    if integration_cache.loaded and integrations == integration_cache.integrations:
+        return
+
+    integration_cache.integrations = integrations
+    integration_cache.loaded = True
+    await integration_cache.store.async_save(
+        {
+            "ha_version": __version__,
+            "mtimes": integration_cache.mtimes,
+            "integrations": integrations,
+        }
+    )
+
+
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     """Generate a manifest from a legacy module."""
     return {
@@ -184,6 +311,67 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+def _get_custom_components_paths() -> list[str]:
+    """Return the paths of the custom components package."""
+    try:
+        import custom_components  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return []
+    return list(custom_components.__path__)
+
+
+def _get_custom_components_mtimes(paths: list[str]) -> dict[str, int]:
+    """Return the modification times of the custom components.
+
+    Adding or removing an integration changes the time of the directory
+    holding it, adding or removing a platform the time of the integration
+    directory and editing a manifest the time of the manifest.
+    """
+    mtimes: dict[str, int] = {}
+    for path in paths:
+        mtimes[path] = os.stat(path).st_mtime_ns
+        for entry in pathlib.Path(path).iterdir():
+            if not entry.is_dir():
+                continue
+            mtimes[str(entry)] = entry.stat().st_mtime_ns
+            with suppress(OSError):
+                manifest_path = entry / "manifest.json"
+                mtimes[str(manifest_path)] = manifest_path.stat().st_mtime_ns
+    return mtimes
+
+
+def _get_mtimes(paths: Iterable[str]) -> dict[str, int]:
+    """Return the modification times of the paths that exist."""
+    mtimes: dict[str, int] = {}
+    for path in paths:
+        with suppress(OSError):
+            mtimes[path] = os.stat(path).st_mtime_ns
+    return mtimes
+
+
+def _list_platforms(paths: list[str]) -> list[list[str] | None]:
+    """Return the platform modules in the integration directories."""
+    platforms: list[list[str] | None] = []
+    for path in paths:
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            platforms.append(None)
+            continue
+        platforms.append(
+            sorted(
+                entry.name.removesuffix(".py")
+                for entry in entries
+                if entry.name != "__init__.py"
+                and (
+                    entry.name.endswith(".py")
+                    or (entry.name != "__pycache__" and entry.is_dir())
+                )
+            )
+        )
+    return platforms
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -196,6 +384,14 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
+    integration_cache: IntegrationCache | None = hass.data.get(DATA_INTEGRATION_CACHE)
+    if integration_cache is not None and integration_cache.loaded:
+        return {
+            domain: Integration.from_cache(hass, cached)
+            for domain, cached in integration_cache.integrations.items()
+            if not cached["manifest"]["is_built_in"]
+        }
+
     def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
         """Return all sub directories in a set of paths."""
         return [
@@ -621,6 +817,24 @@ class Integration:
 
         return None
 
+    @classmethod
+    def from_cache(cls, hass: HomeAssistant, cached: CachedIntegration) -> Integration:
+        """Create an integration resolved on a previous start."""
+        integration = cls(
+            hass,
+            cached["pkg_path"],
+            pathlib.Path(cached["file_path"]),
+            cached["manifest"],
+        )
+        if not integration.is_built_in:
+            _LOGGER.warning(CUSTOM_WARNING, integration.domain)
+        if (dependencies := cached["dependencies"]) is not None:
+            integration._all_dependencies = set(dependencies)
+            integration._all_dependencies_resolved = True
+        if (platforms := cached["platforms"]) is not None:
+            integration._platforms = frozenset(platforms)
+        return integration
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -642,6 +856,8 @@ class Integration:
             self._all_dependencies_resolved = True
             self._all_dependencies = set()
 
+        self._platforms: frozenset[str] | None = None
+
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
     @property
@@ -832,6 +1048,11 @@ class Integration:
         if full_name in cache:
             return cache[full_name]
 
+        if self._platforms is not None and platform_name not in self._platforms:
+            # The platform files are known, save the failing import
+            name = f"{self.pkg_path}.{platform_name}"
+            raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ImportError:
@@ -947,6 +1168,16 @@ async def async_get_integrations(
         if domain in needed:
             del needed[domain]
 
+    # Then the integrations resolved on the previous start
+    integration_cache: IntegrationCache | None = hass.data.get(DATA_INTEGRATION_CACHE)
+    if needed and integration_cache is not None and integration_cache.loaded:
+        for domain in list(needed):
+            cached = integration_cache.integrations.get(domain)
+            if cached is not None and cached["manifest"]["is_built_in"]:
+                integration = Integration.from_cache(hass, cached)
+                results[domain] = cache[domain] = integration
+                needed.pop(domain).set_result(None)
+
     # Now the rest use resolve_from_root
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
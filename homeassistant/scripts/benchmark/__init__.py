@@ -12,7 +12,7 @@ from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -314,6 +314,421 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_commit_states(hass):  # noqa: C901
+    """Commit 100k states with the ORM and with bulk inserts.
+
+    The states are committed 250 at a time for 250 entities, which is what
+    the recorder does with a one second commit interval at 250 state
+    changes per second.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_insert import (
+        PendingRow,
+        PendingRows,
+        state_row_from_event,
+    )
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    entity_count = 250
+    events = []
+    old_states = {}
+    for i in range(10**5):
+        entity_id = f"sensor.power_{i % entity_count}"
+        new_state = core.State(
+            entity_id,
+            str(i),
+            {"unit_of_measurement": "W", "friendly_name": f"Power {i % 5}"},
+        )
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+    commits = [
+        events[start : start + entity_count]
+        for start in range(0, len(events), entity_count)
+    ]
+
+    def _shared_attrs(event):
+        shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
+            event, {}, "sqlite"
+        )
+        return (
+            shared_attrs_bytes.decode("utf-8"),
+            StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes),
+        )
+
+    def _commit_with_orm(session):
+        metadata_ids, attributes_ids, committed_state_ids = {}, {}, {}
+        for commit in commits:
+            pending_meta, pending_attributes, pending_states = {}, {}, {}
+            for event in commit:
+                entity_id = event.data["entity_id"]
+                dbstate = States.from_event(event)
+                dbstate.entity_id = None
+                if old_state := pending_states.pop(entity_id, None):
+                    dbstate.old_state = old_state
+                elif old_state_id := committed_state_ids.pop(entity_id, None):
+                    dbstate.old_state_id = old_state_id
+                pending_states[entity_id] = dbstate
+                if states_meta := pending_meta.get(entity_id):
+                    dbstate.states_meta_rel = states_meta
+                elif metadata_id := metadata_ids.get(entity_id):
+                    dbstate.metadata_id = metadata_id
+                else:
+                    states_meta = pending_meta[entity_id] = StatesMeta(
+                        entity_id=entity_id
+                    )
+                    session.add(states_meta)
+                    dbstate.states_meta_rel = states_meta
+                shared_attrs, hash_ = _shared_attrs(event)
+                if state_attributes := pending_attributes.get(shared_attrs):
+                    dbstate.state_attributes = state_attributes
+                elif attributes_id := attributes_ids.get(shared_attrs):
+                    dbstate.attributes_id = attributes_id
+                else:
+                    state_attributes = pending_attributes[
+                        shared_attrs
+                    ] = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+                    session.add(state_attributes)
+                    dbstate.state_attributes = state_attributes
+                session.add(dbstate)
+            session.commit()
+            for entity_id, states_meta in pending_meta.items():
+                metadata_ids[entity_id] = states_meta.metadata_id
+            for shared_attrs, state_attributes in pending_attributes.items():
+                attributes_ids[shared_attrs] = state_attributes.attributes_id
+            for entity_id, dbstate in pending_states.items():
+                committed_state_ids[entity_id] = dbstate.state_id
+
+    def _commit_with_bulk_insert(session):
+        metadata_ids, attributes_ids, committed_state_ids = {}, {}, {}
+        pending_rows = PendingRows()
+        for commit in commits:
+            pending_meta, pending_attributes, pending_states = {}, {}, {}
+            for event in commit:
+                entity_id = event.data["entity_id"]
+                dbstate = state_row_from_event(event, False)
+                if old_state := pending_states.pop(entity_id, None):
+                    dbstate.set_ref("old_state_id", old_state)
+                elif old_state_id := committed_state_ids.pop(entity_id, None):
+                    dbstate.params["old_state_id"] = old_state_id
+                pending_states[entity_id] = dbstate
+                if states_meta := pending_meta.get(entity_id):
+                    dbstate.set_ref("metadata_id", states_meta)
+                elif metadata_id := metadata_ids.get(entity_id):
+                    dbstate.params["metadata_id"] = metadata_id
+                else:
+                    states_meta = pending_meta[entity_id] = PendingRow(
+                        {"entity_id": entity_id}
+                    )
+                    pending_rows.states_meta.append(states_meta)
+                    dbstate.set_ref("metadata_id", states_meta)
+                shared_attrs, hash_ = _shared_attrs(event)
+                if state_attributes := pending_attributes.get(shared_attrs):
+                    dbstate.set_ref("attributes_id", state_attributes)
+                elif attributes_id := attributes_ids.get(shared_attrs):
+                    dbstate.params["attributes_id"] = attributes_id
+                else:
+                    state_attributes = pending_attributes[shared_attrs] = PendingRow(
+                        {"shared_attrs": shared_attrs, "hash": hash_}
+                    )
+                    pending_rows.state_attributes.append(state_attributes)
+                    dbstate.set_ref("attributes_id", state_attributes)
+                pending_rows.states.append(dbstate)
+            pending_rows.insert(session.connection())
+            session.commit()
+            for entity_id, states_meta in pending_meta.items():
+                metadata_ids[entity_id] = states_meta.row_id
+            for shared_attrs, state_attributes in pending_attributes.items():
+                attributes_ids[shared_attrs] = state_attributes.row_id
+            for entity_id, dbstate in pending_states.items():
+                committed_state_ids[entity_id] = dbstate.row_id
+
+    def _run(commit_states):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine, expire_on_commit=False) as session:
+            start = timer()
+            commit_states(session)
+            return timer() - start
+
+    orm_runtime = await hass.async_add_executor_job(_run, _commit_with_orm)
+    bulk_runtime = await hass.async_add_executor_job(_run, _commit_with_bulk_insert)
+    print(f"ORM: {len(events) / orm_runtime:.0f} rows/s")
+    print(f"Bulk insert: {len(events) / bulk_runtime:.0f} rows/s")
+    return bulk_runtime
+
+
+@benchmark
+async def websocket_subscribe_entities(hass):
+    """Write 10k states with an increasing number of subscribed clients.
+
+    Half of the clients subscribe to all entities and the other half to
+    ten entities each, like dashboards that show a few cards.
+    """
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from homeassistant.auth.models import User
+    from homeassistant.components.websocket_api.conflation import StateDiffConflator
+    from homeassistant.components.websocket_api.entity_subscriptions import (
+        async_get_entity_subscription_hub,
+    )
+
+    entity_count = 500
+    writes = 10**4
+    hub = async_get_entity_subscription_hub(hass)
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    sent = 0
+
+    def send_message(message):
+        nonlocal sent
+        sent += 1
+
+    total_runtime = 0.0
+    for client_count in (1, 10, 40, 100):
+        unsubs = []
+        for client in range(client_count):
+            connection = SimpleNamespace(
+                send_message=send_message, pending_messages=lambda: 0
+            )
+            conflator = StateDiffConflator(hass, connection, 1)
+            entity_ids = (
+                {f"sensor.power_{(client + idx) % entity_count}" for idx in range(10)}
+                if client % 2
+                else set()
+            )
+            unsubs.append(hub.async_subscribe(conflator, entity_ids, user))
+
+        sent = 0
+        start = timer()
+        for idx in range(writes):
+            hass.states.async_set(f"sensor.power_{idx % entity_count}", str(idx))
+        runtime = timer() - start
+        total_runtime += runtime
+        print(
+            f"{client_count} clients: {runtime / writes * 10**6:.1f} µs per state"
+            f" write, {sent} messages"
+        )
+        for unsub in unsubs:
+            unsub()
+    return total_runtime
+
+
+@benchmark
+async def template_render(hass):
+    """Render typical template sensor templates 10k times each.
+
+    Every template is rendered with the compiled fast path and through Jinja.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    hass.states.async_set("sensor.power", "150.5", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.outside_temperature", "12.3")
+    hass.states.async_set("binary_sensor.door", "on")
+    templates = [
+        "{{ states('sensor.power') | float(0) * 2 }}",
+        "{{ (states('sensor.power') | float(0) / 1000) | round(2) }}",
+        "{{ states.sensor.outside_temperature.state | float(0) < 5 }}",
+        "{{ state_attr('sensor.power', 'unit_of_measurement') }}",
+        "{{ 'Open' if is_state('binary_sensor.door', 'on') else 'Closed' }}",
+        "{% if has_value('sensor.power') %}{{ states('sensor.power') | int(0) }}"
+        "{% else %}0{% endif %}",
+    ]
+    renders = 10**4
+
+    total_runtime = 0.0
+    for template_str in templates:
+        tpl = Template(template_str, hass)
+        tpl.async_render()
+        start = timer()
+        for _ in range(renders):
+            tpl.async_render()
+        runtime = timer() - start
+        total_runtime += runtime
+
+        tpl._fast_render = None  # pylint: disable=protected-access
+        start = timer()
+        for _ in range(renders):
+            tpl.async_render()
+        jinja_runtime = timer() - start
+        print(
+            f"{runtime / renders * 10**6:.1f} µs, Jinja"
+            f" {jinja_runtime / renders * 10**6:.1f} µs: {template_str}"
+        )
+    return total_runtime
+
+
+@benchmark
+async def statistics_reduce_monthly(hass):
+    """Reduce 3 years of hourly statistics of 10 sensors to months."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+
+    from homeassistant.components.recorder import statistics
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        Statistics,
+        StatisticsMeta,
+    )
+    from homeassistant.util import dt as dt_util
+
+    start_time = dt_util.as_utc(dt_util.parse_datetime("2020-01-01 00:00:00"))
+    end_time = dt_util.as_utc(dt_util.parse_datetime("2023-01-01 00:00:00"))
+    hours = int((end_time - start_time) / timedelta(hours=1))
+    types = {"max", "mean", "min", "state", "sum"}
+    metadata = {}
+    # The database is shared with the executor thread the reduction runs in
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for idx in range(10):
+            meta = {
+                "has_mean": True,
+                "has_sum": True,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": f"sensor.energy_{idx}",
+                "unit_of_measurement": "kWh",
+            }
+            db_meta = StatisticsMeta.from_meta(meta)
+            session.add(db_meta)
+            session.flush()
+            metadata[meta["statistic_id"]] = (db_meta.id, meta)
+            session.bulk_insert_mappings(
+                Statistics,
+                [
+                    {
+                        "metadata_id": db_meta.id,
+                        "start_ts": start_time.timestamp() + hour * 3600,
+                        "mean": hour % 50,
+                        "min": hour % 40,
+                        "max": hour % 60,
+                        "state": hour % 7,
+                        "sum": hour * 0.5,
+                    }
+                    for hour in range(hours)
+                ],
+            )
+        session.commit()
+    metadata_ids = [metadata_id for metadata_id, _ in metadata.values()]
+
+    def _reduce_in_database():
+        with Session(engine) as session:
+            return statistics._reduce_statistics_during_period(
+                hass,
+                session,
+                start_time,
+                end_time,
+                set(metadata),
+                metadata,
+                metadata_ids,
+                "month",
+                None,
+                types,
+            )
+
+    start = timer()
+    result = await hass.async_add_executor_job(_reduce_in_database)
+    runtime = timer() - start
+    assert len(result) == len(metadata)
+    return runtime
+
+
+@benchmark
+async def startup(hass):
+    """Start Home Assistant with and without the integration cache.
+
+    Reports the time until EVENT_HOMEASSISTANT_STARTED is fired.
+    """
+    # pylint: disable=import-outside-toplevel
+    import os
+    from pathlib import Path
+    import tempfile
+
+    from homeassistant import bootstrap, loader
+    from homeassistant.runner import RuntimeConfig
+
+    integrations = (
+        "automation",
+        "counter",
+        "group",
+        "input_boolean",
+        "input_button",
+        "input_datetime",
+        "input_number",
+        "input_select",
+        "input_text",
+        "schedule",
+        "scene",
+        "script",
+        "sun",
+        "template",
+        "timer",
+        "zone",
+    )
+
+    async def _start(config_dir):
+        start = timer()
+        started = asyncio.Event()
+        hass = await bootstrap.async_setup_hass(
+            RuntimeConfig(config_dir=config_dir, skip_pip=True)
+        )
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STARTED, lambda event: started.set()
+        )
+        await hass.async_start()
+        await started.wait()
+        runtime = timer() - start
+        await hass.async_stop()
+        return runtime
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        Path(config_dir, "configuration.yaml").write_text(
+            "homeassistant:\n  time_zone: UTC\n"
+            + "".join(f"{domain}:\n" for domain in integrations)
+        )
+        cache_path = Path(config_dir, ".storage", loader.INTEGRATION_CACHE_STORAGE_KEY)
+        # The first start imports the modules and writes the cache
+        await _start(config_dir)
+        runtimes = {"without": [], "with": []}
+        for _ in range(5):
+            os.remove(cache_path)
+            runtimes["without"].append(await _start(config_dir))
+            runtimes["with"].append(await _start(config_dir))
+
+    without_cache = min(runtimes["without"])
+    with_cache = min(runtimes["with"])
+    print(f"Started without the integration cache in {without_cache:.3f} s")
+    print(f"Started with the integration cache in {with_cache:.3f} s")
+    return with_cache
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
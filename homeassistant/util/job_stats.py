@@ -0,0 +1,198 @@
+"""Collect timing statistics for jobs run in the event loop."""
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine, Generator
+import functools
+from time import perf_counter
+from typing import Any, Final, Generic, TypeVar
+
+_R = TypeVar("_R")
+
+# Bucket n of the histogram holds durations below 2**n microseconds
+# and at least 2**(n-1) microseconds. The last bucket holds everything
+# slower, which is about 8.4 seconds with 24 buckets.
+HISTOGRAM_BUCKETS: Final = 24
+_LAST_BUCKET: Final = HISTOGRAM_BUCKETS - 1
+
+# Jobs recorded after this many distinct jobs are combined into one entry
+DEFAULT_MAX_JOBS: Final = 2048
+OTHER_JOBS: Final = "other"
+_OTHER_JOBS_KEY: Final = (OTHER_JOBS, None, "")
+
+_COMPONENTS_PREFIX: Final = "homeassistant.components."
+_CUSTOM_COMPONENTS_PREFIX: Final = "custom_components."
+
+
+class JobTiming:
+    """Timing statistics of a single job."""
+
+    __slots__ = ("name", "target", "integration", "calls", "total", "max", "histogram")
+
+    def __init__(
+        self, name: str, integration: str | None, target: str | None = None
+    ) -> None:
+        """Initialize the timing statistics."""
+        self.name = name
+        self.target = target
+        self.integration = integration
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, duration: float) -> None:
+        """Record one run of the job."""
+        self.calls += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        bucket = int(duration * 1_000_000).bit_length()
+        self.histogram[bucket if bucket < _LAST_BUCKET else _LAST_BUCKET] += 1
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket holding a percentile in seconds."""
+        if not self.calls:
+            return 0.0
+        threshold = self.calls * percent / 100
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= threshold and bucket != _LAST_BUCKET:
+                return min((1 << bucket) / 1_000_000, self.max)
+        # The last bucket has no upper bound
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            "name": self.name,
+            "target": self.target,
+            "integration": self.integration,
+            "calls": self.calls,
+            "total": self.total,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+        }
+
+
+class JobStats:
+    """Collect the time jobs spend running in the event loop.
+
+    Every job run is recorded into a fixed-size histogram per job
+    name and target. Generic names such as the one of every bus listener
+    for an event type are shared by many integrations, so the target
+    keeps their jobs apart. Coroutines are timed per step so time spent
+    awaiting is not counted.
+    """
+
+    __slots__ = ("_timings", "_max_jobs", "started")
+
+    def __init__(self, max_jobs: int = DEFAULT_MAX_JOBS) -> None:
+        """Initialize the job statistics."""
+        self._timings: dict[tuple[str | None, str | None, str], JobTiming] = {}
+        self._max_jobs = max_jobs
+        self.started = perf_counter()
+
+    def _timing(self, name: str | None, target: Callable[..., Any]) -> JobTiming:
+        """Return the timing statistics of a job."""
+        func = _unwrap_target(target)
+        module: str | None = getattr(func, "__module__", None)
+        qualname: str = getattr(func, "__qualname__", None) or type(func).__qualname__
+        key = (name, module, qualname)
+        if (timing := self._timings.get(key)) is None:
+            if len(self._timings) >= self._max_jobs:
+                if (timing := self._timings.get(_OTHER_JOBS_KEY)) is None:
+                    timing = self._timings[_OTHER_JOBS_KEY] = JobTiming(
+                        OTHER_JOBS, _module_integration(module)
+                    )
+                return timing
+            target_name = f"{module}.{qualname}"
+            timing = self._timings[key] = JobTiming(
+                name or target_name, _module_integration(module), target_name
+            )
+        return timing
+
+    def run(self, name: str | None, target: Callable[..., _R], *args: Any) -> _R:
+        """Run a job and record the time it took."""
+        start = perf_counter()
+        try:
+            return target(*args)
+        finally:
+            self._timing(name, target).record(perf_counter() - start)
+
+    async def run_coroutine(
+        self,
+        name: str | None,
+        target: Callable[..., Any],
+        coro: Coroutine[Any, Any, _R],
+    ) -> _R:
+        """Run a coroutine and record the time its steps took."""
+        return await _TimedCoroutine(coro, self._timing(name, target))
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the statistics sorted by total time."""
+        return [
+            timing.as_dict()
+            for timing in sorted(
+                self._timings.values(), key=lambda timing: timing.total, reverse=True
+            )
+        ]
+
+
+class _TimedCoroutine(Generic[_R]):
+    """Drive a coroutine and record the time spent in each step."""
+
+    __slots__ = ("_coro", "_timing")
+
+    def __init__(self, coro: Coroutine[Any, Any, _R], timing: JobTiming) -> None:
+        """Initialize the timed coroutine."""
+        self._coro = coro
+        self._timing = timing
+
+    def __await__(self) -> Generator[Any, None, _R]:
+        """Step the coroutine and pass what it yields to the task."""
+        coro = self._coro
+        elapsed = 0.0
+        send_value: Any = None
+        error: BaseException | None = None
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    if error is None:
+                        yielded = coro.send(send_value)
+                    else:
+                        yielded = coro.throw(error)
+                except StopIteration as err:
+                    return err.value  # type: ignore[no-any-return]
+                finally:
+                    elapsed += perf_counter() - start
+                send_value = error = None
+                try:
+                    send_value = yield yielded
+                except GeneratorExit:
+                    coro.close()
+                    raise
+                except BaseException as err:  # pylint: disable=broad-except
+                    error = err
+        finally:
+            self._timing.record(elapsed)
+
+
+def _unwrap_target(target: Callable[..., Any]) -> Callable[..., Any]:
+    """Return the function wrapped by partials."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    return target
+
+
+def _module_integration(module: str | None) -> str | None:
+    """Return the integration a module belongs to."""
+    if module is None:
+        return None
+    if module.startswith(_COMPONENTS_PREFIX):
+        return module.split(".")[2]
+    if module.startswith(_CUSTOM_COMPONENTS_PREFIX):
+        return module.split(".")[1]
+    return None
@@ -1,7 +1,10 @@
 """The tests the History component websocket_api."""
 import asyncio
+from collections.abc import Iterator
 from datetime import timedelta
-from unittest.mock import patch
+import threading
+from typing import Any
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -18,6 +21,7 @@ from tests.common import async_fire_time_changed
 from tests.components.recorder.common import (
     async_recorder_block_till_done,
     async_wait_recording_done,
+    do_adhoc_statistics,
 )
 from tests.typing import WebSocketGenerator
 
@@ -37,6 +41,72 @@ def test_setup() -> None:
     # Verification occurs in the fixture
 
 
+async def test_history_during_period_resolution(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period returns the downsampled states."""
+    start = dt_util.utc_from_timestamp(
+        dt_util.utcnow().timestamp() // 3600 * 3600 - 3600
+    )
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for minutes, state in ((1, "on"), (2, "off"), (8, "on")):
+        with freeze_time(start + timedelta(minutes=minutes)):
+            hass.states.async_set("binary_sensor.door", state)
+    await async_wait_recording_done(hass)
+    for minutes in range(0, 60, 5):
+        do_adhoc_statistics(hass, start=start + timedelta(minutes=minutes))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["binary_sensor.door"],
+            "resolution": "5minute",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "binary_sensor.door": [
+            {"s": "off", "lu": start.timestamp()},
+            {"s": "on", "lu": (start + timedelta(minutes=5)).timestamp()},
+        ]
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["binary_sensor.door"],
+            "resolution": "hour",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "binary_sensor.door": [{"s": "on", "lu": start.timestamp()}]
+    }
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["binary_sensor.door"],
+            "resolution": "day",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -523,6 +593,134 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream with columnar states."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    sensor_one_last_updated_2 = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "off", attributes={"any": "changed"})
+    sensor_two_last_updated = hass.states.get("sensor.two").last_updated
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": True,
+            "no_attributes": False,
+            "minimal_response": True,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": sensor_two_last_updated.timestamp(),
+            "start_time": now.timestamp(),
+            "states": {
+                "sensor.one": {
+                    "a": [{"any": "attr"}, None],
+                    "lu": [
+                        sensor_one_last_updated.timestamp(),
+                        sensor_one_last_updated_2.timestamp(),
+                    ],
+                    "s": ["on", "off"],
+                },
+                "sensor.two": {
+                    "a": [{"any": "changed"}],
+                    "lu": [sensor_two_last_updated.timestamp()],
+                    "s": ["off"],
+                },
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+
+async def test_history_stream_live_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream with history and live data as columns."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": sensor_one_last_updated.timestamp(),
+            "start_time": now.timestamp(),
+            "states": {
+                "sensor.one": {
+                    "a": [{}],
+                    "lc": [None],
+                    "lu": [sensor_one_last_updated.timestamp()],
+                    "s": ["on"],
+                },
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"diff": "attr"})
+    hass.states.async_set("sensor.one", "off", attributes={"diff": "attr"})
+    await async_recorder_block_till_done(hass)
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+
+    response = await client.receive_json()
+    assert response["event"]["states"]["sensor.one"]["s"] == ["on", "off"]
+    assert (
+        response["event"]["states"]["sensor.one"]["lu"][-1]
+        == sensor_one_last_updated.timestamp()
+    )
+    assert response["event"]["states"]["sensor.one"]["lc"][-1] is None
+    assert "a" not in response["event"]["states"]["sensor.one"]
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1908,3 +2106,42 @@ async def test_history_stream_historical_only_with_start_time_state_past(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_stream_columnar_stops_when_cancelled(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test streaming columns stops once the client unsubscribed."""
+    cancelled = threading.Event()
+    connection = Mock()
+    now = dt_util.utcnow()
+
+    def _stream_significant_states(*args: Any) -> Iterator[dict[str, Any]]:
+        for last_updated in (1.0, 2.0, 3.0):
+            yield {"sensor.one": {"s": ["on"], "lu": [last_updated]}}
+            # The client unsubscribes while the next chunk is read
+            cancelled.set()
+
+    with patch(
+        "homeassistant.components.recorder.history.stream_significant_states",
+        _stream_significant_states,
+    ):
+        last_time_ts = await hass.async_add_executor_job(
+            websocket_api._stream_columnar_historical_response,
+            hass,
+            connection,
+            1,
+            now - timedelta(hours=1),
+            now,
+            ["sensor.one"],
+            True,
+            True,
+            False,
+            False,
+            True,
+            cancelled,
+        )
+    await hass.async_block_till_done()
+
+    assert last_time_ts == 1.0
+    assert not connection.send_message.called
@@ -14,22 +14,26 @@ from homeassistant.components.profiler import (
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_JOB_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_START,
+    SERVICE_START_JOB_STATS,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_JOB_STATS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -367,3 +371,80 @@ async def test_log_object_sources(
         await hass.services.async_call(
             DOMAIN, SERVICE_STOP_LOG_OBJECT_SOURCES, {}, blocking=True
         )
+
+
+async def test_job_stats(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test we can record and report the time jobs spend in the event loop."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/job_stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_running"
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(DOMAIN, SERVICE_LOG_JOB_STATS, {}, blocking=True)
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_STATS, {}, blocking=True)
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_JOB_STATS, {}, blocking=True
+        )
+
+    @callback
+    def _slow_listener(event):
+        """Handle the test event."""
+
+    hass.bus.async_listen("test_event", _slow_listener)
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 2, "type": "profiler/job_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["duration"] > 0
+    jobs = {job["name"]: job for job in response["result"]["jobs"]}
+    assert jobs["listen test_event"]["calls"] == 2
+    assert jobs["listen test_event"]["integration"] is None
+    assert jobs["listen test_event"]["target"] == (
+        f"{__name__}.test_job_stats.<locals>._slow_listener"
+    )
+    assert set(jobs["listen test_event"]) == {
+        "name",
+        "target",
+        "integration",
+        "calls",
+        "total",
+        "max",
+        "p50",
+        "p99",
+    }
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_JOB_STATS, {}, blocking=True)
+    assert (
+        f"Job listen test_event ({__name__}.test_job_stats.<locals>._slow_listener,"
+        " None): 2 calls"
+    ) in caplog.text
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_JOB_STATS, {}, blocking=True)
+    assert hass.job_stats is None
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_JOB_STATS, {}, blocking=True
+        )
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_STATS, {}, blocking=True)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.job_stats is None
@@ -10,6 +10,7 @@ from functools import partial
 import importlib
 import sys
 import time
+from types import ModuleType
 from typing import Any, Literal, cast
 from unittest.mock import MagicMock, patch, sentinel
 
@@ -19,7 +20,14 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant import core as ha
 from homeassistant.components import recorder
-from homeassistant.components.recorder import Recorder, core, get_instance, statistics
+from homeassistant.components.recorder import (
+    Recorder,
+    bulk_insert,
+    core,
+    get_instance,
+    statistics,
+)
+from homeassistant.components.recorder.bulk_insert import PendingRow
 from homeassistant.components.recorder.db_schema import (
     Events,
     EventTypes,
@@ -410,14 +418,8 @@ def old_db_schema(schema_version_postfix: str) -> Iterator[None]:
 
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
-    ), patch.object(core, "StatesMeta", old_db_schema.StatesMeta), patch.object(
-        core, "EventTypes", old_db_schema.EventTypes
-    ), patch.object(
+    ), patch_bulk_insert_schema(old_db_schema), patch.object(
         core, "EventData", old_db_schema.EventData
-    ), patch.object(
-        core, "States", old_db_schema.States
-    ), patch.object(
-        core, "Events", old_db_schema.Events
     ), patch.object(
         core, "StateAttributes", old_db_schema.StateAttributes
     ), patch.object(
@@ -432,6 +434,54 @@ def old_db_schema(schema_version_postfix: str) -> Iterator[None]:
         yield
 
 
+def _row_from_db_object(db_object: Any, **params: Any) -> PendingRow:
+    """Create a pending row from the columns set on an old schema object."""
+    for column in db_object.__table__.columns:
+        if column.key in db_object.__dict__:
+            params[column.key] = getattr(db_object, column.key)
+    return PendingRow(params)
+
+
+@contextmanager
+def patch_bulk_insert_schema(old_db_schema: ModuleType) -> Iterator[None]:
+    """Patch the recorder to insert rows the way an old schema did."""
+
+    def _event_row_from_event(event: Event) -> PendingRow:
+        return _row_from_db_object(
+            old_db_schema.Events.from_event(event), event_type_id=None, data_id=None
+        )
+
+    def _state_row_from_event(event: Event, keep_entity_id: bool) -> PendingRow:
+        row = _row_from_db_object(
+            old_db_schema.States.from_event(event),
+            old_state_id=None,
+            attributes_id=None,
+            metadata_id=None,
+        )
+        if not keep_entity_id:
+            row.params["entity_id"] = None
+        if event.data.get("new_state") is None:
+            row.params["state"] = None
+        return row
+
+    with patch.object(
+        core, "event_row_from_event", _event_row_from_event
+    ), patch.object(core, "state_row_from_event", _state_row_from_event), patch.object(
+        bulk_insert, "_STATES_META_TABLE", old_db_schema.StatesMeta.__table__
+    ), patch.object(
+        bulk_insert, "_EVENT_TYPES_TABLE", old_db_schema.EventTypes.__table__
+    ), patch.object(
+        bulk_insert, "_STATE_ATTRIBUTES_TABLE", old_db_schema.StateAttributes.__table__
+    ), patch.object(
+        bulk_insert, "_EVENT_DATA_TABLE", old_db_schema.EventData.__table__
+    ), patch.object(
+        bulk_insert, "_EVENTS_TABLE", old_db_schema.Events.__table__
+    ), patch.object(
+        bulk_insert, "_STATES_TABLE", old_db_schema.States.__table__
+    ):
+        yield
+
+
 async def async_attach_db_engine(hass: HomeAssistant) -> None:
     """Attach a database engine to the recorder."""
     instance = recorder.get_instance(hass)
@@ -0,0 +1,133 @@
+"""The tests for the state attributes table manager."""
+from __future__ import annotations
+
+import sys
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import table_managers
+from homeassistant.components.recorder.queries import find_recent_shared_attributes
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_lru_grows_when_missing(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the LRU grows when too many lookups miss."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    manager = instance.state_attributes_manager
+    manager.reset()
+    lru = manager._id_map
+    size = lru.get_size()
+    for attributes_id in range(size):
+        manager._cache(f'{{"attr":{attributes_id}}}', attributes_id)
+
+    with patch.object(table_managers, "ADAPT_LOOKUPS", 10):
+        for attributes_id in range(10):
+            assert manager.get_from_cache(f'{{"attr":{attributes_id}}}') is not None
+        assert lru.get_size() == size
+        for attributes_id in range(10):
+            assert manager.get_from_cache(f'{{"missing":{attributes_id}}}') is None
+        assert lru.get_size() == size * 2
+
+    assert manager.cache_stats() == {
+        "hits": 10,
+        "misses": 10,
+        "hit_ratio": 0.5,
+        "size": size,
+        "max_size": size * 2,
+    }
+
+
+async def test_lru_shrinks_over_memory_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the LRU shrinks when the cached data exceeds the memory budget."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    manager = instance.state_attributes_manager
+    manager.reset()
+    lru = manager._id_map
+    for attributes_id in range(100):
+        manager._cache(f'{{"attr":{attributes_id}}}' + " " * 1000, attributes_id)
+
+    with patch.object(table_managers, "ADAPT_LOOKUPS", 1), patch.object(
+        manager, "_max_memory", 20_000
+    ):
+        assert manager.get_from_cache('{"attr":"missing"}') is None
+
+    assert 10 <= lru.get_size() < 20
+
+
+async def test_lru_data_bytes(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the size of the cached data is kept when data is cached or evicted."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    manager = instance.state_attributes_manager
+    manager.reset()
+    lru = manager._id_map
+    lru.set_size(10)
+
+    def _data_bytes() -> int:
+        return sum(sys.getsizeof(data) for data in lru.keys())  # noqa: SIM118
+
+    for attributes_id in range(15):
+        manager._cache(f'{{"attr":{attributes_id}}}', attributes_id)
+    manager._cache('{"attr":14}', 14)
+    assert len(lru) == 10
+    assert manager._data_bytes == _data_bytes()
+
+    manager.evict_purged({12, 13})
+    lru.set_size(5)
+    assert len(lru) == 5
+    assert manager._data_bytes == _data_bytes()
+
+    manager.reset()
+    assert manager._data_bytes == 0
+
+
+async def test_load_recent(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test loading the attributes of the most recent states."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    hass.states.async_set("sensor.one", "on", {"old": "attr"})
+    for state in range(5):
+        hass.states.async_set("sensor.two", str(state), {"new": "attr"})
+    await async_wait_recording_done(hass)
+    manager = instance.state_attributes_manager
+    manager.reset()
+
+    def _load_recent(limit: int) -> None:
+        manager._id_map.set_size(limit)
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            manager.load_recent(session)
+
+    def _find_recent(limit: int) -> list[int]:
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            return [
+                attributes_id
+                for attributes_id, _ in session.execute(
+                    find_recent_shared_attributes(limit)
+                )
+            ]
+
+    # The attributes shared by the recent states are only loaded once
+    assert len(await instance.async_add_executor_job(_find_recent, 10)) == 2
+
+    await instance.async_add_executor_job(_load_recent, 2)
+    assert manager.get_from_cache('{"new":"attr"}') is not None
+    assert manager.get_from_cache('{"old":"attr"}') is None
+
+    await instance.async_add_executor_job(_load_recent, 10)
+    assert manager.get_from_cache('{"old":"attr"}') is not None
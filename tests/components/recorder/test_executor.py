@@ -0,0 +1,55 @@
+"""Test the database executor."""
+import threading
+
+from homeassistant.components.recorder.const import DBPriority
+from homeassistant.components.recorder.executor import DBInterruptibleThreadPoolExecutor
+
+
+def test_interactive_jobs_run_first() -> None:
+    """Test interactive jobs run ahead of the queued background jobs."""
+    executor = DBInterruptibleThreadPoolExecutor(
+        thread_name_prefix="DbWorker", max_workers=1, shutdown_hook=lambda: None
+    )
+    blocked = threading.Event()
+    ran: list[str] = []
+
+    executor.submit(blocked.wait)
+    futures = [
+        executor.submit(ran.append, "background 1"),
+        executor.submit_with_priority(
+            DBPriority.INTERACTIVE, ran.append, "interactive 1"
+        ),
+        executor.submit(ran.append, "background 2"),
+        executor.submit_with_priority(
+            DBPriority.INTERACTIVE, ran.append, "interactive 2"
+        ),
+    ]
+    blocked.set()
+    for future in futures:
+        future.result()
+    executor.shutdown(wait=True)
+
+    assert ran == ["interactive 1", "interactive 2", "background 1", "background 2"]
+    wait_stats = executor.wait_stats()
+    assert wait_stats["interactive"]["jobs"] == 2
+    assert wait_stats["background"]["jobs"] == 3
+    assert wait_stats["interactive"]["max"] >= wait_stats["interactive"]["mean"] > 0
+
+
+def test_shutdown_cancels_queued_jobs() -> None:
+    """Test shutdown cancels the queued jobs of every priority."""
+    executor = DBInterruptibleThreadPoolExecutor(
+        thread_name_prefix="DbWorker", max_workers=1, shutdown_hook=lambda: None
+    )
+    blocked = threading.Event()
+
+    executor.submit(blocked.wait)
+    futures = [
+        executor.submit(print, "background"),
+        executor.submit_with_priority(DBPriority.INTERACTIVE, print, "interactive"),
+    ]
+    threading.Timer(0.1, blocked.set).start()
+    executor.shutdown()
+
+    assert all(future.cancelled() for future in futures)
+    assert not any(thread.is_alive() for thread in executor._threads)
@@ -522,6 +522,112 @@ def test_get_significant_states_minimal_response(
     )
 
 
+def _columns_to_compressed_states(
+    chunks: list[dict[str, dict[str, list]]]
+) -> dict[str, list[dict]]:
+    """Convert streamed chunks of columns to compressed states."""
+    compressed: dict[str, list[dict]] = {}
+    for chunk in chunks:
+        for entity_id, columns in chunk.items():
+            entity_states = compressed.setdefault(entity_id, [])
+            for idx, state in enumerate(columns["s"]):
+                comp_state = {"s": state, "lu": columns["lu"][idx]}
+                if "a" in columns and (attributes := columns["a"][idx]) is not None:
+                    comp_state["a"] = attributes
+                if "lc" in columns and (last_changed := columns["lc"][idx]):
+                    comp_state["lc"] = last_changed
+                entity_states.append(comp_state)
+    return compressed
+
+
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+def test_stream_significant_states(
+    hass_recorder: Callable[..., HomeAssistant],
+    minimal_response: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> None:
+    """Test streamed columns match the compressed significant states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    entity_ids = list(states)
+    chunks = list(
+        history.stream_significant_states(
+            hass,
+            zero,
+            four,
+            entity_ids,
+            significant_changes_only=significant_changes_only,
+            minimal_response=minimal_response,
+            no_attributes=no_attributes,
+            chunk_size=2,
+        )
+    )
+    assert len(chunks) > 1
+    assert all(
+        sum(len(columns["s"]) for columns in chunk.values()) <= 2 for chunk in chunks
+    )
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        significant_changes_only=significant_changes_only,
+        minimal_response=minimal_response,
+        no_attributes=no_attributes,
+        compressed_state_format=True,
+    )
+    assert _columns_to_compressed_states(chunks) == hist
+
+
+def test_stream_significant_states_no_matches(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test streaming states of entities without states yields nothing."""
+    hass = hass_recorder()
+    now = dt_util.utcnow()
+    assert list(history.stream_significant_states(hass, now, None, ["demo.id"])) == []
+
+
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+def test_get_significant_state_columns(
+    hass_recorder: Callable[..., HomeAssistant], significant_changes_only: bool
+) -> None:
+    """Test state columns match the compressed significant states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    entity_ids = list(states)
+    with session_scope(hass=hass, read_only=True) as session:
+        columns = history.get_significant_state_columns_with_session(
+            hass,
+            session,
+            zero,
+            four,
+            entity_ids,
+            significant_changes_only=significant_changes_only,
+        )
+        assert (
+            history.get_significant_state_columns_with_session(
+                hass, session, zero, four, ["demo.id"]
+            )
+            == {}
+        )
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        significant_changes_only=significant_changes_only,
+        compressed_state_format=True,
+    )
+    for comp_states in hist.values():
+        for comp_state in comp_states:
+            comp_state.pop("lc", None)
+    assert _columns_to_compressed_states([columns]) == hist
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 def test_get_significant_states_with_initial(
     time_zone, hass_recorder: Callable[..., HomeAssistant]
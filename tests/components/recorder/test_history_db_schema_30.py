@@ -292,6 +292,38 @@ def test_get_significant_states(hass_recorder: Callable[..., HomeAssistant]) ->
         assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+def test_get_significant_state_columns(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test state columns match the compressed significant states."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    with patch.object(instance.states_meta_manager, "active", False):
+        zero, four, states = record_states(hass)
+        with session_scope(hass=hass, read_only=True) as session:
+            columns = history.get_significant_state_columns_with_session(
+                hass, session, zero, four, list(states)
+            )
+        hist = history.get_significant_states(
+            hass, zero, four, list(states), compressed_state_format=True
+        )
+    assert {
+        entity_id: [
+            {"s": state, "lu": last_updated, "a": attributes}
+            for state, last_updated, attributes in zip(
+                entity_columns["s"], entity_columns["lu"], entity_columns["a"]
+            )
+        ]
+        for entity_id, entity_columns in columns.items()
+    } == {
+        entity_id: [
+            {"s": comp_state["s"], "lu": comp_state["lu"], "a": comp_state["a"]}
+            for comp_state in comp_states
+        ]
+        for entity_id, comp_states in hist.items()
+    }
+
+
 def test_get_significant_states_minimal_response(
     hass_recorder: Callable[..., HomeAssistant]
 ) -> None:
@@ -291,6 +291,39 @@ def test_get_significant_states(hass_recorder: Callable[..., HomeAssistant]) ->
         assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+def test_stream_significant_states(hass_recorder: Callable[..., HomeAssistant]) -> None:
+    """Test streaming columns of the legacy significant states."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    with patch.object(instance.states_meta_manager, "active", False):
+        zero, four, states = record_states(hass)
+        entity_ids = list(states)
+        chunks = list(
+            history.stream_significant_states(
+                hass, zero, four, entity_ids, minimal_response=True, chunk_size=2
+            )
+        )
+        hist = history.get_significant_states(
+            hass,
+            zero,
+            four,
+            entity_ids,
+            minimal_response=True,
+            compressed_state_format=True,
+        )
+    assert all(
+        sum(len(columns["s"]) for columns in chunk.values()) <= 2 for chunk in chunks
+    )
+    streamed: dict[str, list[str]] = {}
+    for chunk in chunks:
+        for entity_id, columns in chunk.items():
+            streamed.setdefault(entity_id, []).extend(columns["s"])
+    assert streamed == {
+        entity_id: [comp_state["s"] for comp_state in entity_states]
+        for entity_id, entity_states in hist.items()
+    }
+
+
 def test_get_significant_states_minimal_response(
     hass_recorder: Callable[..., HomeAssistant]
 ) -> None:
@@ -26,6 +26,7 @@ from homeassistant.components.recorder import (
     DOMAIN,
     SQLITE_URL_PREFIX,
     Recorder,
+    bulk_insert,
     get_instance,
     migration,
     pool,
@@ -67,6 +68,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED_BATCH,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
@@ -117,6 +119,8 @@ def _default_recorder(hass):
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        db_read_workers=4,
+        partition_tables=False,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
     )
@@ -270,6 +274,31 @@ async def test_saving_state(recorder_mock: Recorder, hass: HomeAssistant) -> Non
     assert state.as_dict() == _state_with_context(hass, entity_id).as_dict()
 
 
+async def test_saving_coalesced_states(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test saving states from a coalesced state_changed_batch event."""
+    hass.states._async_set_many_coalesced(
+        [
+            ("test.one", "on", {"test_attr": 1}),
+            ("test.two", "off", {"test_attr": 2}),
+        ]
+    )
+
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = {}
+        for db_state, states_meta in session.query(States, StatesMeta).outerjoin(
+            StatesMeta, States.metadata_id == StatesMeta.metadata_id
+        ):
+            db_states[states_meta.entity_id] = db_state.state
+        assert db_states == {"test.one": "on", "test.two": "off"}
+        assert not list(
+            session.execute(select_event_type_ids((EVENT_STATE_CHANGED_BATCH,)))
+        )
+
+
 @pytest.mark.parametrize(
     ("dialect_name", "expected_attributes"),
     (
@@ -377,17 +406,12 @@ def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with patch("time.sleep"), patch.object(
-        get_instance(hass).event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        bulk_insert,
+        "_insert_states",
+        side_effect=OperationalError(
+            "insert the state", "fake params", "forced to fail"
+        ),
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -419,17 +443,12 @@ def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with patch("time.sleep"), patch.object(
-        get_instance(hass).event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        bulk_insert,
+        "_insert_states",
+        side_effect=SQLAlchemyError(
+            "insert the state", "fake params", "forced to fail"
+        ),
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -449,6 +468,61 @@ def test_saving_state_with_sqlalchemy_exception(
     assert "SQLAlchemyError error processing task" not in caplog.text
 
 
+async def test_saving_events_and_states_when_commit_fails(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the rows of a commit that failed and was rolled back are retried."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    session = instance.event_session
+    assert session is not None
+    commit = session.commit
+    failed = False
+
+    def _commit_fails_once() -> None:
+        nonlocal failed
+        if not failed:
+            failed = True
+            session.rollback()
+            raise OperationalError("commit", "fake params", "forced to fail")
+        commit()
+
+    with patch("time.sleep"), patch.object(session, "commit", _commit_fails_once):
+        hass.bus.async_fire("test_event", {"test_data": 1})
+        hass.states.async_set("test.recorder", "on", {"test_attr": 5})
+        await async_wait_recording_done(hass)
+
+    assert failed
+    assert "Error executing query" in caplog.text
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = (
+            session.query(StatesMeta.entity_id, States.state, StateAttributes)
+            .select_from(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .join(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .all()
+        )
+        assert [(entity_id, state) for entity_id, state, _ in states] == [
+            ("test.recorder", "on")
+        ]
+        assert states[0][2].to_native() == {"test_attr": 5}
+        events = (
+            session.query(EventTypes.event_type, EventData)
+            .select_from(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .join(EventData, Events.data_id == EventData.data_id)
+            .filter(EventTypes.event_type == "test_event")
+            .all()
+        )
+        assert len(events) == 1
+        assert events[0][1].to_native() == {"test_data": 1}
+
+
 async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -1390,6 +1464,76 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("returning", [True, False])
+def test_saving_sets_old_state_in_same_commit(
+    hass_recorder: Callable[..., HomeAssistant], returning: bool
+) -> None:
+    """Test saving sets old state when the old state is in the same commit."""
+    hass = hass_recorder({CONF_COMMIT_INTERVAL: 30})
+    instance = get_instance(hass)
+
+    with patch.object(
+        instance.engine.dialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        returning,
+    ):
+        hass.states.set("test.one", "s1", {"attr": 1})
+        hass.states.set("test.two", "s2", {"attr": 1})
+        hass.states.set("test.one", "s3", {"attr": 2})
+        hass.states.set("test.one", "s4", {"attr": 2})
+        hass.states.set("test.two", "s5", {"attr": 1})
+        hass.block_till_done()
+        instance.block_till_done()
+        wait_recording_done(hass)
+        hass.states.set("test.one", "s6", {"attr": 2})
+        hass.block_till_done()
+        instance.block_till_done()
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+        )
+        assert [state.state for state in states] == ["s1", "s2", "s3", "s4", "s5", "s6"]
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s6"].old_state_id == states_by_state["s4"].state_id
+        assert [state.entity_id for state in states] == [
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.one",
+            "test.two",
+            "test.one",
+        ]
+        assert [state.shared_attrs for state in states] == [
+            '{"attr":1}',
+            '{"attr":1}',
+            '{"attr":2}',
+            '{"attr":2}',
+            '{"attr":1}',
+            '{"attr":2}',
+        ]
+        assert session.query(StateAttributes).count() == 2
+        assert session.query(StatesMeta).count() == 2
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -2247,7 +2391,8 @@ async def test_connect_args_priority(hass: HomeAssistant, config_url) -> None:
             return MockDialect
 
     with patch("sqlalchemy.engine.url.URL._get_entrypoint", MockEntrypoint), patch(
-        "sqlalchemy.engine.create.util.get_cls_kwargs", return_value=["echo"]
+        "sqlalchemy.engine.create.util.get_cls_kwargs",
+        return_value=["echo", "pool_size"],
     ):
         await async_setup_component(
             hass,
@@ -38,6 +38,7 @@ from .common import (
     async_attach_db_engine,
     async_recorder_block_till_done,
     async_wait_recording_done,
+    patch_bulk_insert_schema,
 )
 
 from tests.typing import RecorderInstanceGenerator
@@ -83,14 +84,8 @@ def db_schema_32():
 
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
-    ), patch.object(core, "StatesMeta", old_db_schema.StatesMeta), patch.object(
-        core, "EventTypes", old_db_schema.EventTypes
-    ), patch.object(
+    ), patch_bulk_insert_schema(old_db_schema), patch.object(
         core, "EventData", old_db_schema.EventData
-    ), patch.object(
-        core, "States", old_db_schema.States
-    ), patch.object(
-        core, "Events", old_db_schema.Events
     ), patch.object(
         core, "StateAttributes", old_db_schema.StateAttributes
     ), patch.object(
@@ -0,0 +1,260 @@
+"""The tests for maintaining partitioned recorder tables."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from homeassistant.components.recorder.db_schema import (
+    TABLE_EVENTS,
+    TABLE_STATES,
+    TABLE_STATISTICS_SHORT_TERM,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.partitions import (
+    PARTITIONS_AHEAD,
+    Partition,
+    _partition_from_bound,
+    create_partition_statement,
+    create_partitions_ahead,
+    drop_partition_statement,
+    get_partitions,
+    partition_ranges_to_create,
+    partitions_to_drop,
+)
+from homeassistant.components.recorder.tasks import PartitionTablesTask, PurgeTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_purge_done, async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+DAY = 86400
+
+PREPARER = postgresql.dialect().identifier_preparer
+
+
+def test_partition_from_bound() -> None:
+    """Test parsing the bounds of partitions."""
+    assert _partition_from_bound(
+        "states_p1", "FOR VALUES FROM ('1000') TO ('2000')"
+    ) == Partition("states_p1", 1000.0, 2000.0)
+    assert _partition_from_bound(
+        "states_p0", "FOR VALUES FROM (MINVALUE) TO (1000)"
+    ) == Partition("states_p0", None, 1000.0)
+    assert _partition_from_bound("states_default", "DEFAULT") == Partition(
+        "states_default", None, None, default=True
+    )
+
+
+def test_partitions_to_drop() -> None:
+    """Test only partitions entirely before the purge time are dropped."""
+    partitions = [
+        Partition("p0", None, 1000.0),
+        Partition("p1", 1000.0, 2000.0),
+        Partition("p2", 2000.0, 3000.0),
+        Partition("pmax", 3000.0, None),
+        Partition("default", None, None, default=True),
+    ]
+    assert partitions_to_drop(partitions, 2500.0) == partitions[:2]
+    assert partitions_to_drop(partitions, 999.0) == []
+
+
+def test_partition_ranges_to_create() -> None:
+    """Test the missing partitions for the next days are found."""
+    now = dt_util.utcnow()
+    start = dt_util.start_of_local_day(dt_util.as_local(now))
+    partitions = [
+        Partition("states_archive", None, start.timestamp() + DAY),
+        Partition("states_default", None, None, default=True),
+    ]
+    ranges = partition_ranges_to_create(TABLE_STATES, partitions, now)
+    assert len(ranges) == PARTITIONS_AHEAD
+    tomorrow = start + timedelta(days=1)
+    assert ranges[0] == (
+        f"states_p{tomorrow.strftime('%Y%m%d')}",
+        tomorrow.timestamp(),
+        (tomorrow + timedelta(days=1)).timestamp(),
+    )
+    assert (
+        partition_ranges_to_create(TABLE_STATES, [Partition("p", None, None)], now)
+        == []
+    )
+
+
+def test_partition_statements() -> None:
+    """Test the statements to create and drop a partition quote the names."""
+    assert (
+        create_partition_statement(PREPARER, TABLE_STATES, "states_p1", 1000, 2000)
+        == "CREATE TABLE states_p1 PARTITION OF states FOR VALUES FROM (1000) TO (2000)"
+    )
+    assert (
+        create_partition_statement(PREPARER, TABLE_STATES, "states_p0", None, 1000)
+        == "CREATE TABLE states_p0 PARTITION OF states "
+        "FOR VALUES FROM (MINVALUE) TO (1000)"
+    )
+    assert (
+        drop_partition_statement(PREPARER, Partition("States P1", 1000.0, 2000.0))
+        == 'DROP TABLE "States P1"'
+    )
+
+
+async def test_partition_tables_not_supported(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the tables are only partitioned on PostgreSQL."""
+    if recorder_db_url.startswith("postgresql://"):
+        pytest.skip("Partitioned tables are supported on PostgreSQL")
+    await async_setup_recorder_instance(hass, {"partition_tables": True})
+    await async_wait_recording_done(hass)
+    assert "Partitioned tables are only supported on PostgreSQL" in caplog.text
+
+
+async def test_partition_tables(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test converting the tables into partitioned tables and purging them."""
+    if not recorder_db_url.startswith("postgresql://"):
+        pytest.skip("Partitioned tables are only supported on PostgreSQL")
+    instance = await async_setup_recorder_instance(hass)
+    start = dt_util.start_of_local_day()
+
+    hass.states.async_set("sensor.old", "1")
+    hass.states.async_set("sensor.new", "1")
+    await async_wait_recording_done(hass)
+
+    def _make_old_state() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(States).filter(
+                States.metadata_id.in_(
+                    session.query(StatesMeta.metadata_id).filter(
+                        StatesMeta.entity_id == "sensor.old"
+                    )
+                )
+            ).update({States.last_updated_ts: start.timestamp() - 2 * DAY})
+
+    def _get_partitions() -> dict[str, list[str] | None]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return {
+                table_name: [partition.name for partition in partitions]
+                if (partitions := get_partitions(session, table_name))
+                else None
+                for table_name in (
+                    TABLE_STATES,
+                    TABLE_EVENTS,
+                    TABLE_STATISTICS_SHORT_TERM,
+                )
+            }
+
+    def _get_states() -> list[tuple[str, str, int | None]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                tuple(row)
+                for row in session.query(
+                    StatesMeta.entity_id, States.state, States.old_state_id
+                )
+                .select_from(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .order_by(States.state_id)
+            ]
+
+    await instance.async_add_executor_job(_make_old_state)
+    assert await instance.async_add_executor_job(_get_partitions) == {
+        TABLE_STATES: None,
+        TABLE_EVENTS: None,
+        TABLE_STATISTICS_SHORT_TERM: None,
+    }
+
+    instance.partition_tables = True
+    instance.queue_task(PartitionTablesTask())
+    await async_wait_recording_done(hass)
+
+    days = [
+        (start + timedelta(days=day)).strftime("%Y%m%d")
+        for day in range(PARTITIONS_AHEAD + 1)
+    ]
+    partitions = await instance.async_add_executor_job(_get_partitions)
+    for table_name in (TABLE_STATES, TABLE_EVENTS, TABLE_STATISTICS_SHORT_TERM):
+        assert partitions[table_name] == [
+            f"{table_name}_archive",
+            *(f"{table_name}_p{day}" for day in days),
+            f"{table_name}_default",
+        ]
+
+    # The rows are kept and the recorder keeps writing to the tables
+    hass.states.async_set("sensor.new", "2")
+    await async_wait_recording_done(hass)
+    states = await instance.async_add_executor_job(_get_states)
+    assert [state[:2] for state in states] == [
+        ("sensor.old", "1"),
+        ("sensor.new", "1"),
+        ("sensor.new", "2"),
+    ]
+    assert states[2][2] is not None
+
+    def _get_indexes() -> set[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return {
+                name
+                for (name,) in session.execute(
+                    text("SELECT indexname FROM pg_indexes WHERE tablename = 'states'")
+                )
+            }
+
+    assert {
+        index.name for index in States.__table__.indexes
+    } <= await instance.async_add_executor_job(_get_indexes)
+
+    # The partition of the rows from before today is dropped as a whole
+    instance.queue_task(PurgeTask(dt_util.as_utc(start), False, False))
+    await async_wait_purge_done(hass)
+
+    partitions = await instance.async_add_executor_job(_get_partitions)
+    assert partitions[TABLE_STATES][0] == f"{TABLE_STATES}_p{days[0]}"
+    states = await instance.async_add_executor_job(_get_states)
+    assert [state[:2] for state in states] == [("sensor.new", "1"), ("sensor.new", "2")]
+
+    # Rows without a partition for their day are kept in the default partition
+    # and moved to the partition that is created for them later
+    future = start + timedelta(days=PARTITIONS_AHEAD + 2)
+
+    def _move_state_to_future() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(States).filter(States.state == "2").update(
+                {States.last_updated_ts: future.timestamp() + 3600}
+            )
+
+    def _create_partitions_ahead() -> None:
+        with session_scope(hass=hass) as session:
+            create_partitions_ahead(session)
+
+    def _count_rows(partition_name: str) -> int:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.execute(
+                text(f"SELECT COUNT(*) FROM {partition_name}")  # noqa: S608
+            ).scalar_one()
+
+    await instance.async_add_executor_job(_move_state_to_future)
+    assert await instance.async_add_executor_job(_count_rows, "states_default") == 1
+
+    freezer.move_to(dt_util.utcnow() + timedelta(days=3))
+    await instance.async_add_executor_job(_create_partitions_ahead)
+    future_partition = f"states_p{future.strftime('%Y%m%d')}"
+    assert (
+        future_partition
+        in (await instance.async_add_executor_job(_get_partitions))[TABLE_STATES]
+    )
+    assert await instance.async_add_executor_job(_count_rows, "states_default") == 0
+    assert await instance.async_add_executor_job(_count_rows, future_partition) == 1
@@ -10,6 +10,7 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
+from homeassistant.components.recorder import purge
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
     Events,
@@ -188,6 +189,68 @@ async def test_purge_old_states(
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_progress(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the progress of purging old states is tracked."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    assert instance.purge_progress is None
+
+    with session_scope(hass=hass) as session:
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert not finished
+        progress = instance.purge_progress
+        assert progress.as_dict() == {
+            "purge_before": purge_before,
+            "started": progress.started,
+            "finished": None,
+            "states": 4,
+            "state_attributes": 2,
+            "events": 0,
+            "event_data": 0,
+            "short_term_statistics": 0,
+            "partitions": 0,
+            "states_remaining": 0,
+            "events_remaining": 0,
+        }
+        assert progress.states_to_purge == 4
+
+        assert purge_old_data(instance, purge_before, repack=False)
+        assert instance.purge_progress is progress
+        assert progress.finished is not None
+        assert session.query(States).count() == 2
+
+
+async def test_purge_old_states_yields_to_backlog(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging old states stops after a batch when the recorder has a backlog."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with session_scope(hass=hass) as session, patch.object(
+        instance, "max_bind_vars", 1
+    ), patch.object(purge, "MAX_BACKLOG_BEFORE_YIELD", -1):
+        states = session.query(States)
+        assert states.count() == 6
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert states.count() == 5
+        assert instance.purge_progress.as_dict()["states_remaining"] == 3
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert states.count() == 4
+
+    assert purge_old_data(instance, purge_before, repack=False)
+
+
 async def test_purge_old_states_encouters_database_corruption(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -0,0 +1,255 @@
+"""The tests for the downsampled state history."""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from freezegun import freeze_time
+
+from homeassistant.components.recorder.purge import purge_entity_data, purge_old_data
+from homeassistant.components.recorder.state_intervals import (
+    RESOLUTION_5MINUTE,
+    RESOLUTION_HOUR,
+    _metadata_ids_without_intervals_stmt,
+    get_state_intervals,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done, do_adhoc_statistics
+
+from tests.typing import RecorderInstanceGenerator
+
+START = datetime(2023, 5, 8, 12, 0, tzinfo=dt_util.UTC)
+
+
+async def _async_record_door(hass: HomeAssistant) -> None:
+    """Record the door states and compile the periods of an hour."""
+    for minutes, state in (
+        (1, "off"),
+        (2, "on"),
+        (3, "off"),
+        (7, "on"),
+        (16, "on"),
+        (56, "off"),
+    ):
+        with freeze_time(START + timedelta(minutes=minutes)):
+            hass.states.async_set(
+                "binary_sensor.door", state, {"minutes": minutes}, force_update=True
+            )
+    await async_wait_recording_done(hass)
+    for minutes in range(0, 60, 5):
+        do_adhoc_statistics(hass, start=START + timedelta(minutes=minutes))
+    await async_wait_recording_done(hass)
+
+
+async def test_compile_state_intervals(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test only the periods ending in a different state add an interval."""
+    instance = await async_setup_recorder_instance(hass)
+    await _async_record_door(hass)
+
+    def _get_state_intervals(
+        start: datetime, resolution: int, include_start_time_state: bool = True
+    ) -> dict:
+        return get_state_intervals(
+            hass,
+            start,
+            START + timedelta(hours=1),
+            ["binary_sensor.door", "binary_sensor.unknown"],
+            resolution,
+            include_start_time_state,
+        )
+
+    assert await instance.async_add_executor_job(
+        _get_state_intervals, START, RESOLUTION_5MINUTE
+    ) == {
+        "binary_sensor.door": [
+            {"s": "off", "lu": START.timestamp()},
+            {"s": "on", "lu": (START + timedelta(minutes=5)).timestamp()},
+            {"s": "off", "lu": (START + timedelta(minutes=55)).timestamp()},
+        ]
+    }
+    assert await instance.async_add_executor_job(
+        _get_state_intervals, START, RESOLUTION_HOUR
+    ) == {"binary_sensor.door": [{"s": "off", "lu": START.timestamp()}]}
+
+    start = START + timedelta(minutes=6)
+    assert await instance.async_add_executor_job(
+        _get_state_intervals, start, RESOLUTION_5MINUTE
+    ) == {
+        "binary_sensor.door": [
+            {"s": "on", "lu": start.timestamp()},
+            {"s": "off", "lu": (START + timedelta(minutes=55)).timestamp()},
+        ]
+    }
+    assert await instance.async_add_executor_job(
+        _get_state_intervals, start, RESOLUTION_5MINUTE, False
+    ) == {
+        "binary_sensor.door": [
+            {"s": "off", "lu": (START + timedelta(minutes=55)).timestamp()},
+        ]
+    }
+
+
+async def test_compile_state_intervals_unchanged_entity(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test an entity without an interval starts from its latest state."""
+    instance = await async_setup_recorder_instance(hass)
+    with freeze_time(START - timedelta(days=1)):
+        hass.states.async_set("sensor.stable", "10")
+    await _async_record_door(hass)
+
+    for resolution in (RESOLUTION_5MINUTE, RESOLUTION_HOUR):
+        assert await instance.async_add_executor_job(
+            get_state_intervals,
+            hass,
+            START,
+            START + timedelta(hours=1),
+            ["sensor.stable"],
+            resolution,
+            False,
+        ) == {"sensor.stable": [{"s": "10", "lu": START.timestamp()}]}
+
+
+async def test_purge_state_intervals(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging removes the 5-minute intervals and keeps the hourly ones.
+
+    The latest 5-minute interval of each entity before the purge is kept.
+    """
+    instance = await async_setup_recorder_instance(hass)
+    with freeze_time(START - timedelta(days=1)):
+        hass.states.async_set("sensor.stable", "10")
+    await _async_record_door(hass)
+    purge_before = START + timedelta(minutes=30)
+
+    def _purge_and_get_state_intervals() -> tuple[dict, dict, dict]:
+        while not purge_old_data(instance, purge_before, repack=False):
+            pass
+        return (
+            *(
+                get_state_intervals(
+                    hass,
+                    START,
+                    START + timedelta(hours=1),
+                    ["binary_sensor.door"],
+                    resolution,
+                    False,
+                )
+                for resolution in (RESOLUTION_5MINUTE, RESOLUTION_HOUR)
+            ),
+            get_state_intervals(
+                hass,
+                purge_before,
+                START + timedelta(hours=1),
+                ["binary_sensor.door", "sensor.stable"],
+                RESOLUTION_5MINUTE,
+            ),
+        )
+
+    five_minute, hourly, after_purge = await instance.async_add_executor_job(
+        _purge_and_get_state_intervals
+    )
+    assert five_minute == {
+        "binary_sensor.door": [
+            {"s": "on", "lu": (START + timedelta(minutes=5)).timestamp()},
+            {"s": "off", "lu": (START + timedelta(minutes=55)).timestamp()},
+        ]
+    }
+    assert hourly == {"binary_sensor.door": [{"s": "off", "lu": START.timestamp()}]}
+    assert after_purge == {
+        "binary_sensor.door": [
+            {"s": "on", "lu": purge_before.timestamp()},
+            {"s": "off", "lu": (START + timedelta(minutes=55)).timestamp()},
+        ],
+        "sensor.stable": [{"s": "10", "lu": purge_before.timestamp()}],
+    }
+
+
+async def test_purge_entity_data_state_intervals(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging the data of an entity removes its intervals."""
+    instance = await async_setup_recorder_instance(hass)
+    with freeze_time(START - timedelta(days=1)):
+        hass.states.async_set("sensor.stable", "10")
+    await _async_record_door(hass)
+
+    def _purge_and_get_state_intervals() -> dict:
+        while not purge_entity_data(
+            instance,
+            lambda entity_id: entity_id == "binary_sensor.door",
+            START + timedelta(hours=2),
+        ):
+            pass
+        return get_state_intervals(
+            hass,
+            START,
+            START + timedelta(hours=1),
+            ["binary_sensor.door", "sensor.stable"],
+            RESOLUTION_HOUR,
+        )
+
+    assert await instance.async_add_executor_job(_purge_and_get_state_intervals) == {
+        "sensor.stable": [{"s": "10", "lu": START.timestamp()}]
+    }
+
+
+async def test_compile_state_intervals_looks_up_unchanged_entities_once(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the entities without an interval are only looked up once."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.state_intervals_seeded.clear()
+    with patch(
+        "homeassistant.components.recorder.state_intervals."
+        "_metadata_ids_without_intervals_stmt",
+        wraps=_metadata_ids_without_intervals_stmt,
+    ) as metadata_ids_without_intervals_stmt:
+        await _async_record_door(hass)
+
+    assert [
+        call.args for call in metadata_ids_without_intervals_stmt.call_args_list
+    ] == [(RESOLUTION_5MINUTE,), (RESOLUTION_HOUR,)]
+    assert instance.state_intervals_seeded == {RESOLUTION_5MINUTE, RESOLUTION_HOUR}
+
+
+async def test_purge_state_intervals_of_removed_entities(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the intervals of removed entities are purged with their entity_id."""
+    instance = await async_setup_recorder_instance(hass)
+    with freeze_time(START - timedelta(days=1)):
+        hass.states.async_set("sensor.stable", "10")
+    await _async_record_door(hass)
+    with freeze_time(START + timedelta(hours=1)):
+        hass.states.async_remove("binary_sensor.door")
+    await async_wait_recording_done(hass)
+
+    def _purge_and_get_state_intervals() -> tuple[dict, dict[str, int | None]]:
+        while not purge_old_data(instance, START + timedelta(hours=2), repack=False):
+            pass
+        with session_scope(hass=hass, read_only=True) as session:
+            metadata_ids = instance.states_meta_manager.get_many(
+                ["binary_sensor.door", "sensor.stable"], session, False
+            )
+        return (
+            get_state_intervals(
+                hass,
+                START,
+                START + timedelta(hours=1),
+                ["binary_sensor.door", "sensor.stable"],
+                RESOLUTION_HOUR,
+            ),
+            metadata_ids,
+        )
+
+    intervals, metadata_ids = await instance.async_add_executor_job(
+        _purge_and_get_state_intervals
+    )
+    assert intervals == {"sensor.stable": [{"s": "10", "lu": START.timestamp()}]}
+    assert metadata_ids["binary_sensor.door"] is None
+    assert metadata_ids["sensor.stable"] is not None
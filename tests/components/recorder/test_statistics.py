@@ -1,6 +1,10 @@
 """The tests for sensor recorder platform."""
+from collections import defaultdict
 from collections.abc import Callable
 from datetime import timedelta
+from itertools import chain
+from statistics import mean
+from typing import Literal
 from unittest.mock import patch
 
 import pytest
@@ -15,6 +19,7 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
+    StatisticsRow,
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
@@ -452,6 +457,97 @@ def test_statistics_during_period_set_back_compat(
     )
 
 
+def test_statistics_during_period_cache(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test statistics read for periods are cached until they change."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    period1 = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        days=1
+    )
+    period2 = period1 + timedelta(hours=1)
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass, metadata, ({"start": period1, "state": 0, "sum": 2},)
+    )
+    wait_recording_done(hass)
+
+    def _sums() -> list[float]:
+        stats = statistics_during_period(
+            hass, period1, period2, {"test:total_energy_import"}, "hour", None, {"sum"}
+        )
+        sums = [row["sum"] for row in stats["test:total_energy_import"]]
+        # The cached statistics are not changed by callers
+        stats["test:total_energy_import"][0]["sum"] = None
+        return sums
+
+    with patch.object(
+        statistics,
+        "_sorted_statistics_to_dict",
+        wraps=statistics._sorted_statistics_to_dict,
+    ) as sorted_statistics_to_dict:
+        assert _sums() == [2]
+        assert _sums() == [2]
+        assert sorted_statistics_to_dict.call_count == 1
+
+        # Statistics after the period don't change it
+        async_add_external_statistics(
+            hass, metadata, ({"start": period2, "state": 0, "sum": 5},)
+        )
+        wait_recording_done(hass)
+        assert _sums() == [2]
+        assert sorted_statistics_to_dict.call_count == 1
+
+        async_add_external_statistics(
+            hass, metadata, ({"start": period1, "state": 0, "sum": 3},)
+        )
+        wait_recording_done(hass)
+        assert _sums() == [3]
+        assert sorted_statistics_to_dict.call_count == 2
+
+        recorder.get_instance(hass).async_adjust_statistics(
+            "test:total_energy_import", period1, 1, "kWh"
+        )
+        wait_recording_done(hass)
+        assert _sums() == [4]
+        assert sorted_statistics_to_dict.call_count == 3
+
+    with patch.object(
+        statistics,
+        "_get_newest_sum_statistic",
+        wraps=statistics._get_newest_sum_statistic,
+    ) as get_newest_sum_statistic:
+        for _ in range(2):
+            assert statistics.statistic_during_period(
+                hass, None, period2, "test:total_energy_import", {"change"}, None
+            ) == {"change": 4}
+        assert get_newest_sum_statistic.call_count == 1
+
+        # Periods which have not ended are not cached
+        for _ in range(2):
+            assert statistics.statistic_during_period(
+                hass, None, None, "test:total_energy_import", {"change"}, None
+            ) == {"change": 6}
+        assert get_newest_sum_statistic.call_count == 3
+
+        recorder.get_instance(hass).async_clear_statistics(["test:total_energy_import"])
+        wait_recording_done(hass)
+        assert (
+            statistics.statistic_during_period(
+                hass, None, period2, "test:total_energy_import", {"change"}, None
+            )
+            == {}
+        )
+
+
 def test_rename_entity_collision(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1743,6 +1839,171 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+def _reduce_statistics(
+    stats: dict[str, list[StatisticsRow]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to periods in Python to compare with the database."""
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    period_seconds = period.total_seconds()
+    _want_mean = "mean" in types
+    _want_min = "min" in types
+    _want_max = "max" in types
+    _want_last_reset = "last_reset" in types
+    _want_state = "state" in types
+    _want_sum = "sum" in types
+    for statistic_id, stat_list in stats.items():
+        max_values: list[float] = []
+        mean_values: list[float] = []
+        min_values: list[float] = []
+        prev_stat: StatisticsRow = stat_list[0]
+        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
+
+        # Loop over the hourly statistics + a fake entry to end the period
+        for statistic in chain(stat_list, (fake_entry,)):
+            if not same_period(prev_stat["start"], statistic["start"]):
+                start, end = period_start_end(prev_stat["start"])
+                # The previous statistic was the last entry of the period
+                row: StatisticsRow = {
+                    "start": start,
+                    "end": end,
+                }
+                if _want_mean:
+                    row["mean"] = mean(mean_values) if mean_values else None
+                    mean_values.clear()
+                if _want_min:
+                    row["min"] = min(min_values) if min_values else None
+                    min_values.clear()
+                if _want_max:
+                    row["max"] = max(max_values) if max_values else None
+                    max_values.clear()
+                if _want_last_reset:
+                    row["last_reset"] = prev_stat.get("last_reset")
+                if _want_state:
+                    row["state"] = prev_stat.get("state")
+                if _want_sum:
+                    row["sum"] = prev_stat["sum"]
+                result[statistic_id].append(row)
+            if _want_max and (_max := statistic.get("max")) is not None:
+                max_values.append(_max)
+            if _want_mean and (_mean := statistic.get("mean")) is not None:
+                mean_values.append(_mean)
+            if _want_min and (_min := statistic.get("min")) is not None:
+                min_values.append(_min)
+            prev_stat = statistic
+
+    return result
+
+
+def _reduce_statistics_per_day(
+    stats: dict[str, list[StatisticsRow]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily statistics."""
+    _same_day_ts, _day_start_end_ts = statistics.reduce_day_ts_factory()
+    return _reduce_statistics(
+        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
+    )
+
+
+def _reduce_statistics_per_week(
+    stats: dict[str, list[StatisticsRow]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to weekly statistics."""
+    _same_week_ts, _week_start_end_ts = statistics.reduce_week_ts_factory()
+    return _reduce_statistics(
+        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
+    )
+
+
+def _reduce_statistics_per_month(
+    stats: dict[str, list[StatisticsRow]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to monthly statistics."""
+    _same_month_ts, _month_start_end_ts = statistics.reduce_month_ts_factory()
+    return _reduce_statistics(
+        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
+    )
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.freeze_time("2022-01-01 00:00:00+00:00")
+def test_reduced_statistics_match_python_reducers(
+    hass_recorder: Callable[..., HomeAssistant], timezone: str, period: str
+) -> None:
+    """Test statistics reduced in the database match the Python reducers."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-20 00:00:00"))
+    metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": None,
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    # Hourly statistics across the end of daylight saving time in Europe
+    async_add_external_statistics(
+        hass,
+        metadata,
+        [
+            {
+                "start": start + timedelta(hours=hour),
+                "mean": hour % 7 / 3,
+                "min": None if hour % 11 == 0 else hour % 5,
+                "max": hour % 13,
+                "last_reset": start if hour % 17 else None,
+                "state": hour % 3,
+                "sum": hour * 1.5,
+            }
+            for hour in range(24 * 70)
+            if hour % 23
+        ],
+    )
+    wait_recording_done(hass)
+
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    reduce = {
+        "day": _reduce_statistics_per_day,
+        "week": _reduce_statistics_per_week,
+        "month": _reduce_statistics_per_month,
+    }[period]
+    for start_time, end_time, units in (
+        (start, None, None),
+        (start + timedelta(days=12), start + timedelta(days=40), None),
+        (start, None, {"energy": "Wh"}),
+    ):
+        reduced = statistics_during_period(
+            hass, start_time, end_time, None, period, units
+        )
+        hourly = statistics_during_period(
+            hass,
+            dt_util.utc_from_timestamp(reduced["test:total_energy_import"][0]["start"]),
+            dt_util.utc_from_timestamp(reduced["test:total_energy_import"][-1]["end"]),
+            None,
+            "hour",
+            units,
+        )
+        expected = reduce(hourly, types)
+        assert reduced.keys() == expected.keys()
+        for row, expected_row in zip(
+            reduced["test:total_energy_import"],
+            expected["test:total_energy_import"],
+            strict=True,
+        ):
+            assert row == {**expected_row, "mean": pytest.approx(expected_row["mean"])}
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -32,9 +32,24 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "event_data_cache_hit_ratio": ANY,
     }
 
 
+async def test_recorder_system_health_cache_hit_ratio(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health reports the hit ratio of the attributes cache."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.one", "on", {"any": "attr"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.one", "off", {"any": "attr"})
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["state_attributes_cache_hit_ratio"] == "50.0%"
+
+
 @pytest.mark.parametrize(
     "dialect_name", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -58,6 +73,7 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "event_data_cache_hit_ratio": ANY,
     }
 
 
@@ -89,6 +105,7 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "event_data_cache_hit_ratio": ANY,
     }
 
 
@@ -115,4 +132,5 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "event_data_cache_hit_ratio": ANY,
     }
@@ -19,7 +19,7 @@ from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
-from .common import async_wait_recording_done
+from .common import async_wait_recording_done, patch_bulk_insert_schema
 
 from tests.common import async_test_home_assistant
 
@@ -96,14 +96,8 @@ async def test_migrate_times(caplog: pytest.LogCaptureFixture, tmp_path: Path) -
 
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
-    ), patch.object(core, "StatesMeta", old_db_schema.StatesMeta), patch.object(
-        core, "EventTypes", old_db_schema.EventTypes
-    ), patch.object(
+    ), patch_bulk_insert_schema(old_db_schema), patch.object(
         core, "EventData", old_db_schema.EventData
-    ), patch.object(
-        core, "States", old_db_schema.States
-    ), patch.object(
-        core, "Events", old_db_schema.Events
     ), patch(
         CREATE_ENGINE_TARGET, new=_create_engine_test
     ), patch(
@@ -267,14 +261,8 @@ async def test_migrate_can_resume_entity_id_post_migration(
 
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
-    ), patch.object(core, "StatesMeta", old_db_schema.StatesMeta), patch.object(
-        core, "EventTypes", old_db_schema.EventTypes
-    ), patch.object(
+    ), patch_bulk_insert_schema(old_db_schema), patch.object(
         core, "EventData", old_db_schema.EventData
-    ), patch.object(
-        core, "States", old_db_schema.States
-    ), patch.object(
-        core, "Events", old_db_schema.Events
     ), patch(
         CREATE_ENGINE_TARGET, new=_create_engine_test
     ), patch(
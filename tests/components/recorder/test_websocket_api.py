@@ -2163,6 +2163,11 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge_progress": None,
+        "queue_wait": {
+            "interactive": {"jobs": 0, "mean": 0.0, "max": 0.0},
+            "background": {"jobs": ANY, "mean": ANY, "max": ANY},
+        },
         "recording": True,
         "thread_running": True,
     }
@@ -24,6 +24,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -31,6 +32,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1128,6 +1130,173 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_coalesced(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities receives coalesced state changes in one message."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.permitted", "light.removed"}
+
+    hass.states.async_remove("light.removed")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.removed"]}
+
+    hass.states._async_set_many_coalesced(
+        [
+            ("light.permitted", "on", {"color": "blue"}),
+            ("light.new", "on", None),
+            ("light.permitted", "on", {"color": "green"}),
+        ]
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"color": "green"}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        },
+        "a": {"light.new": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+    }
+
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.new": True}}})
+    hass.states._async_set_many_coalesced(
+        [("light.permitted", "off", None), ("light.new", "off", None)]
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.new": {"+": {"c": ANY, "lc": ANY, "s": "off"}}},
+    }
+
+
+async def test_subscribe_entities_conflated_while_client_behind(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test state changes are merged per entity while the client is behind."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.permitted", "light.removed"}
+
+    with patch(
+        "homeassistant.components.websocket_api.conflation.PENDING_MSG_CONFLATE", -1
+    ):
+        hass.states.async_set("light.permitted", "on", {"color": "blue"})
+        hass.states.async_set("light.permitted", "on", {"color": "green"})
+        hass.states.async_set("light.new", "on")
+        hass.states.async_set("light.new", "off")
+        hass.states.async_set("light.gone", "on")
+        hass.states.async_remove("light.gone")
+        hass.states.async_remove("light.removed")
+        hass.states._async_set_many_coalesced([("light.permitted", "off", None)])
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + datetime.timedelta(seconds=const.CONFLATE_INTERVAL)
+        )
+
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        # Diffed from the state the client knows, not the intermediate states
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY}, "-": {"a": ["color"]}}},
+        "a": {"light.new": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}},
+        "r": ["light.removed"],
+    }
+
+    # Once the client caught up, every change is sent right away again
+    hass.states.async_set("light.permitted", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}},
+    }
+
+
+async def test_subscribe_entities_resume(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test resuming a subscription only sends the missed state changes."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bedroom", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "resumable": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] is None
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.bedroom"}
+    snapshot_seq = msg["seq"]
+
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+    seq = msg["seq"]
+    assert seq == snapshot_seq + 1
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    # Missed while the client was away
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 255})
+    hass.states.async_remove("light.bedroom")
+    hass.states.async_set("light.hallway", "on")
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "subscribe_entities", "resume_from": seq}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["result"] == {"resumed": True}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"a": {"brightness": 255}, "c": ANY, "lc": ANY}}},
+        "r": ["light.bedroom"],
+        "a": {"light.hallway": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+    }
+    assert msg["seq"] == seq + 4
+
+    # A sequence the server no longer knows gets a snapshot
+    await websocket_client.send_json(
+        {"id": 10, "type": "subscribe_entities", "resume_from": seq + 100}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+    assert msg["result"] == {"resumed": False}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.hallway"}
+    assert msg["seq"] == seq + 4
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -0,0 +1,177 @@
+"""Test the websocket entity subscription hub."""
+from collections import deque
+from unittest.mock import Mock, patch
+
+from homeassistant.components.websocket_api.entity_subscriptions import (
+    async_get_entity_subscription_hub,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_CHANGED_BATCH
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockUser
+
+
+def _listener_count(hass: HomeAssistant) -> int:
+    """Return the number of state changed listeners."""
+    listeners = hass.bus.async_listeners()
+    return listeners.get(EVENT_STATE_CHANGED, 0) + listeners.get(
+        EVENT_STATE_CHANGED_BATCH, 0
+    )
+
+
+async def test_one_listener_for_all_subscriptions(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test all subscriptions share one pair of bus listeners."""
+    init_count = _listener_count(hass)
+    hub = async_get_entity_subscription_hub(hass)
+    unsubs = [hub.async_subscribe(Mock(), set(), hass_admin_user) for _ in range(40)]
+    unsubs.append(hub.async_subscribe(Mock(), {"light.kitchen"}, hass_admin_user))
+    assert _listener_count(hass) == init_count + 2
+
+    # The listeners keep recording the journal to resume from
+    for unsub in unsubs:
+        unsub()
+    assert _listener_count(hass) == init_count + 2
+    hub.async_subscribe(Mock(), set(), hass_admin_user)
+    assert _listener_count(hass) == init_count + 2
+
+
+async def test_remove_listeners_when_no_client_can_resume(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test the listeners are removed once the journal can not resume anymore."""
+    init_count = _listener_count(hass)
+    hub = async_get_entity_subscription_hub(hass)
+    with patch(
+        "homeassistant.components.websocket_api.entity_subscriptions."
+        "RESUME_JOURNAL_SIZE",
+        2,
+    ), patch.object(hub, "_journal", deque(maxlen=2)):
+        hub.async_subscribe(Mock(), set(), hass_admin_user)()
+        since = hub.sequence
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.kitchen", "off")
+        assert _listener_count(hass) == init_count + 2
+        assert len(hub.async_missed_events(since, set(), hass_admin_user)) == 2
+
+        hass.states.async_set("light.kitchen", "on")
+        assert _listener_count(hass) == init_count
+        assert hub.async_missed_events(since, set(), hass_admin_user) is None
+        assert hub.async_missed_events(hub.sequence, set(), hass_admin_user) is None
+
+        # A client can not resume across the state changes that were not recorded
+        since = hub.sequence
+        hass.states.async_set("light.kitchen", "off")
+        hub.async_subscribe(Mock(), set(), hass_admin_user)
+        assert _listener_count(hass) == init_count + 2
+        hass.states.async_set("light.kitchen", "on")
+        assert hub.async_missed_events(since, set(), hass_admin_user) is None
+        assert len(hub.async_missed_events(since + 1, set(), hass_admin_user)) == 1
+
+
+async def test_deliver_to_interested_subscriptions(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test state changes only reach the subscriptions interested in them."""
+    hub = async_get_entity_subscription_hub(hass)
+    all_entities = Mock()
+    kitchen = Mock()
+    bedroom = Mock()
+    hub.async_subscribe(all_entities, set(), hass_admin_user)
+    unsub_kitchen = hub.async_subscribe(kitchen, {"light.kitchen"}, hass_admin_user)
+    hub.async_subscribe(bedroom, {"light.bedroom", "light.kitchen"}, hass_admin_user)
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("light.hallway", "on")
+
+    assert [
+        call.args[0].data["entity_id"] for call in all_entities.async_send.mock_calls
+    ] == ["light.kitchen", "light.bedroom", "light.hallway"]
+    assert [
+        call.args[0].data["entity_id"] for call in kitchen.async_send.mock_calls
+    ] == ["light.kitchen"]
+    assert [
+        call.args[0].data["entity_id"] for call in bedroom.async_send.mock_calls
+    ] == ["light.kitchen", "light.bedroom"]
+
+    unsub_kitchen()
+    hass.states.async_set("light.kitchen", "off")
+    assert kitchen.async_send.call_count == 1
+    assert bedroom.async_send.call_count == 3
+
+
+async def test_deliver_batches(hass: HomeAssistant, hass_admin_user: MockUser) -> None:
+    """Test coalesced state changes are split between subscriptions."""
+    hub = async_get_entity_subscription_hub(hass)
+    all_entities = Mock()
+    kitchen = Mock()
+    hallway = Mock()
+    hub.async_subscribe(all_entities, set(), hass_admin_user)
+    hub.async_subscribe(kitchen, {"light.kitchen"}, hass_admin_user)
+    hub.async_subscribe(hallway, {"light.hallway"}, hass_admin_user)
+
+    hass.states._async_set_many_coalesced(
+        [("light.kitchen", "on", None), ("light.bedroom", "on", None)]
+    )
+
+    all_entities.async_send_cached_batch.assert_called_once()
+    all_entities.async_send_batch.assert_not_called()
+    (events,) = kitchen.async_send_batch.call_args.args
+    assert [event.data["entity_id"] for event in events] == ["light.kitchen"]
+    hallway.async_send_batch.assert_not_called()
+
+
+async def test_permissions_checked_when_changed(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test subscriptions follow the permissions of the user."""
+    hub = async_get_entity_subscription_hub(hass)
+    conflator = Mock()
+    hub.async_subscribe(conflator, set(), hass_admin_user)
+
+    hass.states.async_set("light.kitchen", "on")
+    assert conflator.async_send.call_count == 1
+
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.bedroom": True}}})
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bedroom", "off")
+    assert [
+        call.args[0].data["entity_id"] for call in conflator.async_send.mock_calls
+    ] == ["light.kitchen", "light.bedroom"]
+
+    hass.states._async_set_many_coalesced(
+        [("light.kitchen", "on", None), ("light.bedroom", "on", None)]
+    )
+    conflator.async_send_cached_batch.assert_not_called()
+    (events,) = conflator.async_send_batch.call_args.args
+    assert [event.data["entity_id"] for event in events] == ["light.bedroom"]
+
+
+async def test_missed_events(hass: HomeAssistant, hass_admin_user: MockUser) -> None:
+    """Test finding the state changes missed since a sequence."""
+    hub = async_get_entity_subscription_hub(hass)
+    hub.async_subscribe(Mock(), set(), hass_admin_user)()
+    hass.states.async_set("light.kitchen", "on")
+    since = hub.sequence
+    hass.states.async_set("light.kitchen", "off")
+    hass.states._async_set_many_coalesced(
+        [("light.bedroom", "on", None), ("light.hallway", "on", None)]
+    )
+    assert hub.sequence == since + 3
+
+    missed = hub.async_missed_events(since, set(), hass_admin_user)
+    assert [event.data["entity_id"] for event in missed] == [
+        "light.kitchen",
+        "light.bedroom",
+        "light.hallway",
+    ]
+    missed = hub.async_missed_events(since, {"light.hallway"}, hass_admin_user)
+    assert [event.data["entity_id"] for event in missed] == ["light.hallway"]
+    assert hub.async_missed_events(hub.sequence, set(), hass_admin_user) == []
+    assert hub.async_missed_events(hub.sequence + 1, set(), hass_admin_user) is None
+
+    with patch.object(hub, "_journal", deque(hub._journal, maxlen=2)):
+        assert hub.async_missed_events(since, set(), hass_admin_user) is None
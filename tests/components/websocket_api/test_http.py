@@ -3,6 +3,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -15,10 +16,16 @@ from homeassistant.components.websocket_api import (
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -431,6 +438,92 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_compress_messages(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test compressing messages for a client without permessage-deflate."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COMPRESS_MESSAGES: 10},
+        }
+    )
+    decompressor = zlib.decompressobj(-10)
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    result = json_loads(decompressor.decompress(msg.data))
+    assert result["id"] == 1
+    assert result["success"] is True
+
+    # Each message refers back to the messages before it
+    sizes = []
+    for id_ in range(2, 5):
+        await websocket_client.send_json({"id": id_, "type": "ping"})
+        msg = await websocket_client.receive()
+        assert msg.type == WSMsgType.BINARY
+        assert json_loads(decompressor.decompress(msg.data)) == {
+            "id": id_,
+            "type": "pong",
+        }
+        sizes.append(len(msg.data))
+    assert sizes[-1] < sizes[0]
+
+
+@pytest.mark.parametrize("window_bits", [1, 8, 16])
+async def test_compress_messages_invalid_window_bits(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket, window_bits: int
+) -> None:
+    """Test compressing messages with invalid window bits is rejected."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_COMPRESS_MESSAGES: window_bits,
+            },
+        }
+    )
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    result = json_loads(msg.data)
+    assert result["success"] is False
+    assert result["error"]["code"] == const.ERR_INVALID_FORMAT
+
+    # The features are not changed and messages are not compressed
+    await websocket_client.send_json({"id": 2, "type": "ping"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert json_loads(msg.data) == {"id": 2, "type": "pong"}
+
+
+async def test_compress_messages_negotiated_in_handshake(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+    socket_enabled: None,
+) -> None:
+    """Test messages are not compressed twice with permessage-deflate."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await aiohttp_client(hass.http.app)
+    async with client.ws_connect(const.URL, compress=15) as websocket:
+        assert (await websocket.receive_json())["type"] == "auth_required"
+        await websocket.send_json({"type": "auth", "access_token": hass_access_token})
+        assert (await websocket.receive_json())["type"] == "auth_ok"
+
+        await websocket.send_json(
+            {
+                "id": 1,
+                "type": "supported_features",
+                "features": {const.FEATURE_COMPRESS_MESSAGES: 15},
+            }
+        )
+        msg = await websocket.receive()
+        assert msg.type == WSMsgType.TEXT
+        assert json_loads(msg.data)["success"] is True
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
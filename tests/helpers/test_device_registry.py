@@ -4,6 +4,7 @@ import time
 from typing import Any
 from unittest.mock import patch
 
+import attr
 import pytest
 from yarl import URL
 
@@ -2010,3 +2011,45 @@ async def test_loading_invalid_configuration_url_from_storage(
         identifiers={("serial", "123456ABCDEF")},
     )
     assert entry.configuration_url == "invalid"
+
+
+def test_active_device_registry_items() -> None:
+    """Test the ActiveDeviceRegistryItems container."""
+    devices = dr.ActiveDeviceRegistryItems()
+    assert devices.get_devices_for_area_id("kitchen") == []
+    assert devices.get_devices_for_config_entry_id("entry_1") == []
+
+    device1 = dr.DeviceEntry(area_id="kitchen", config_entries={"entry_1"})
+    device2 = dr.DeviceEntry(config_entries={"entry_1", "entry_2"})
+    devices[device1.id] = device1
+    devices[device2.id] = device2
+
+    assert devices.get_devices_for_area_id("kitchen") == [device1]
+    assert devices.get_devices_for_config_entry_id("entry_1") == [device1, device2]
+    assert devices.get_devices_for_config_entry_id("entry_2") == [device2]
+
+    # Updating a device keeps its place in the indexes it is still in
+    device1 = devices[device1.id] = attr.evolve(
+        device1, config_entries={"entry_1", "entry_2"}
+    )
+    assert devices.get_devices_for_area_id("kitchen") == [device1]
+    assert devices.get_devices_for_config_entry_id("entry_1") == [device1, device2]
+    assert devices.get_devices_for_config_entry_id("entry_2") == [device2, device1]
+
+    device1 = devices[device1.id] = attr.evolve(device1, config_entries={"entry_1"})
+    assert devices.get_devices_for_config_entry_id("entry_1") == [device1, device2]
+    assert devices.get_devices_for_config_entry_id("entry_2") == [device2]
+
+    device2 = devices[device2.id] = attr.evolve(
+        device2, area_id="kitchen", config_entries={"entry_2"}
+    )
+    del devices[device1.id]
+
+    assert devices.get_devices_for_area_id("kitchen") == [device2]
+    assert devices.get_devices_for_config_entry_id("entry_1") == []
+    assert devices.get_devices_for_config_entry_id("entry_2") == [device2]
+
+    devices.pop(device2.id)
+
+    assert devices.get_devices_for_area_id("kitchen") == []
+    assert devices.get_devices_for_config_entry_id("entry_2") == []
@@ -8,6 +8,7 @@ import threading
 from typing import Any
 from unittest.mock import MagicMock, PropertyMock, patch
 
+import attr
 import pytest
 import voluptuous as vol
 
@@ -1361,6 +1362,52 @@ async def test_friendly_name_updated(
     assert state.attributes.get(ATTR_FRIENDLY_NAME) == expected_friendly_name3
 
 
+async def test_friendly_name_cached(hass: HomeAssistant) -> None:
+    """Test the friendly name is cached until what it is computed from changes."""
+
+    class NamedEntity(entity.Entity):
+        _attr_has_entity_name = True
+
+    ent = NamedEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent.platform = MockEntityPlatform(hass)
+    ent.device_entry = dr.DeviceEntry(name="Device")
+    ent._attr_name = "Power"
+
+    with patch.object(
+        entity.Entity,
+        "_friendly_name_internal",
+        autospec=True,
+        side_effect=entity.Entity._friendly_name_internal,
+    ) as friendly_name_internal:
+        assert ent._async_generate_attributes()[1][ATTR_FRIENDLY_NAME] == (
+            "Device Power"
+        )
+        assert ent._async_generate_attributes()[1][ATTR_FRIENDLY_NAME] == (
+            "Device Power"
+        )
+        assert friendly_name_internal.call_count == 1
+
+        ent._attr_name = "Energy"
+        assert ent._async_generate_attributes()[1][ATTR_FRIENDLY_NAME] == (
+            "Device Energy"
+        )
+        ent.device_entry = attr.evolve(ent.device_entry, name_by_user="My Device")
+        assert ent._async_generate_attributes()[1][ATTR_FRIENDLY_NAME] == (
+            "My Device Energy"
+        )
+        ent._attr_name = None
+        assert ent._async_generate_attributes()[1][ATTR_FRIENDLY_NAME] == "My Device"
+        assert friendly_name_internal.call_count == 4
+
+        # The cache is kept by identity, an updated device entry is a new one
+        ent.device_entry = attr.evolve(ent.device_entry)
+        assert ent._async_generate_attributes()[1][ATTR_FRIENDLY_NAME] == "My Device"
+        assert ent._async_generate_attributes()[1][ATTR_FRIENDLY_NAME] == "My Device"
+        assert friendly_name_internal.call_count == 5
+
+
 async def test_translation_key(hass: HomeAssistant) -> None:
     """Test translation key property."""
     mock_entity1 = entity.Entity()
@@ -115,7 +115,7 @@ async def test_setup_does_discovery(
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.PollingScheduler.async_track")
 async def test_set_scan_interval_via_config(
     mock_track: Mock, hass: HomeAssistant
 ) -> None:
@@ -140,7 +140,7 @@ async def test_set_scan_interval_via_config(
 
     await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert timedelta(seconds=30) == mock_track.call_args[0][1]
 
 
 async def test_set_entity_namespace_via_config(hass: HomeAssistant) -> None:
@@ -1,16 +1,24 @@
 """Tests for the EntityPlatform helper."""
 import asyncio
 from collections.abc import Iterable
-from datetime import timedelta
+from datetime import datetime, timedelta
+from functools import partial
 import logging
 from typing import Any
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
+import zlib
 
 import pytest
 
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+)
 from homeassistant.core import (
+    CALLBACK_TYPE,
     CoreState,
+    Event,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -177,7 +185,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.PollingScheduler.async_track")
 async def test_set_scan_interval_via_platform(
     mock_track: Mock, hass: HomeAssistant
 ) -> None:
@@ -203,7 +211,7 @@ async def test_set_scan_interval_via_platform(
 
     await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert timedelta(seconds=30) == mock_track.call_args[0][1]
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -523,6 +531,256 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
     assert peak_update_count == 1
 
 
+async def test_polling_first_poll_jitter(hass: HomeAssistant) -> None:
+    """Test the first poll is moved ahead by a deterministic part of the interval."""
+    scheduler = entity_platform._async_get_polling_scheduler(hass)
+    polls = []
+
+    async def _poll(now: datetime) -> None:
+        polls.append(now)
+
+    interval = timedelta(seconds=60)
+    jitter = entity_platform.POLL_JITTER * zlib.crc32(b"mock-entry") / 2**32
+    first_poll = interval * (1 - jitter)
+    now = dt_util.utcnow()
+    cancel = scheduler.async_track(
+        _poll, interval, "mock-entry", "test", entity_platform.PollingStats()
+    )
+
+    async_fire_time_changed(hass, now + first_poll - timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert not polls
+
+    async_fire_time_changed(hass, now + first_poll)
+    await hass.async_block_till_done()
+    assert len(polls) == 1
+
+    async_fire_time_changed(hass, now + first_poll + interval)
+    await hass.async_block_till_done()
+    assert len(polls) == 2
+
+    cancel()
+    async_fire_time_changed(hass, now + first_poll + interval * 2)
+    await hass.async_block_till_done()
+    assert len(polls) == 2
+
+
+async def test_polling_limits_concurrent_polls(hass: HomeAssistant) -> None:
+    """Test the number of platforms polling at the same time is limited."""
+    scheduler = entity_platform.PollingScheduler(hass)
+    scheduler.concurrency = 1
+    stats = entity_platform.PollingStats()
+    release = asyncio.Event()
+    started = []
+
+    async def _poll(idx: int) -> None:
+        started.append(idx)
+        await release.wait()
+
+    tasks = [
+        hass.async_create_task(scheduler.async_poll(partial(_poll, idx), stats))
+        for idx in range(2)
+    ]
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert started == [0]
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert started == [0, 1]
+    assert stats.polls == 2
+
+
+def _track_platforms(
+    scheduler: entity_platform.PollingScheduler, count: int
+) -> tuple[list[entity_platform.PollingStats], list[CALLBACK_TYPE]]:
+    """Track platforms that do not poll during the test."""
+
+    async def _poll(now: datetime) -> None:
+        """Do not poll."""
+
+    all_stats = [entity_platform.PollingStats() for _ in range(count)]
+    cancels = [
+        scheduler.async_track(_poll, timedelta(days=1), f"key{idx}", "test", stats)
+        for idx, stats in enumerate(all_stats)
+    ]
+    return all_stats, cancels
+
+
+async def test_polling_adapts_concurrency(hass: HomeAssistant) -> None:
+    """Test the limit of concurrent polls adapts to the poll durations."""
+    scheduler = entity_platform.PollingScheduler(hass)
+    all_stats, cancels = _track_platforms(scheduler, 3)
+    stats = all_stats[0]
+
+    for _ in range(5):
+        for platform_stats in all_stats:
+            scheduler._async_record(platform_stats, 0.2)
+    assert scheduler.concurrency == entity_platform.POLL_CONCURRENCY_MAX
+    assert stats.baseline_duration == pytest.approx(0.2)
+
+    # Polls of many platforms that take much longer than usual lower the limit
+    for _ in range(100):
+        scheduler._async_record(all_stats[0], 2.0)
+        scheduler._async_record(all_stats[1], 2.0)
+        scheduler._async_record(all_stats[2], 0.2)
+    assert scheduler.concurrency == entity_platform.POLL_CONCURRENCY_MIN
+    assert stats.polls == 105
+    assert stats.last_duration == 2.0
+    assert stats.max_duration == 2.0
+
+    # The limit is raised again while polls are waiting for it
+    scheduler._waiters.append(hass.loop.create_future())
+    for _ in range(50):
+        for platform_stats in all_stats:
+            scheduler._async_record(platform_stats, 0.2)
+    assert scheduler.concurrency > entity_platform.POLL_CONCURRENCY_MIN
+
+    for cancel in cancels:
+        cancel()
+
+
+async def test_polling_one_slow_platform(hass: HomeAssistant) -> None:
+    """Test a single slow platform does not lower the limit of the others."""
+    scheduler = entity_platform.PollingScheduler(hass)
+    all_stats, cancels = _track_platforms(scheduler, 4)
+    slow_stats = all_stats[0]
+
+    for _ in range(5):
+        for stats in all_stats:
+            scheduler._async_record(stats, 0.2)
+
+    for _ in range(20):
+        scheduler._async_record(slow_stats, 2.0)
+        for stats in all_stats[1:]:
+            scheduler._async_record(stats, 0.2)
+    assert scheduler._slow == {slow_stats}
+    assert scheduler.concurrency == entity_platform.POLL_CONCURRENCY_MAX
+
+    # A platform that stops polling is no longer counted as slow
+    cancels[0]()
+    assert not scheduler._slow
+
+    for cancel in cancels[1:]:
+        cancel()
+
+
+async def test_polling_overruns(hass: HomeAssistant) -> None:
+    """Test polls skipped because the previous poll is still running are counted."""
+    platform = MockEntityPlatform(hass)
+    platform._process_updates = asyncio.Lock()
+
+    async with platform._process_updates:
+        await platform._update_entity_states(dt_util.utcnow())
+    assert platform.polling_stats.overruns == 1
+    assert platform.polling_stats.polls == 0
+
+    await platform._update_entity_states(dt_util.utcnow())
+    assert platform.polling_stats.polls == 1
+
+
+async def test_polling_waits_for_turn(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test waiting for a turn is not counted as part of the poll."""
+    scheduler = entity_platform._async_get_polling_scheduler(hass)
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(should_poll=True)
+    ent.update = Mock()
+    await platform.async_add_entities([ent])
+    ent.update.reset_mock()
+
+    scheduler._polling = scheduler.concurrency
+    task = hass.async_create_task(platform._update_entity_states(dt_util.utcnow()))
+    await asyncio.sleep(0)
+    assert not platform._process_updates.locked()
+
+    # A poll waiting for its turn is not an overrun of the previous poll
+    await platform._update_entity_states(dt_util.utcnow())
+    stats = platform.polling_stats
+    assert stats.overruns == 0
+    assert stats.wait_overruns == 1
+    assert "took longer than the scheduled update interval" not in caplog.text
+
+    scheduler._polling -= 1
+    scheduler._async_wake_next()
+    await task
+    assert ent.update.called
+    assert stats.polls == 1
+    assert stats.waits == 1
+    assert stats.max_wait == stats.last_wait > 0
+
+
+async def test_polling_async_entities_not_limited(hass: HomeAssistant) -> None:
+    """Test platforms that do not update in the executor do not wait for a turn."""
+    scheduler = entity_platform._async_get_polling_scheduler(hass)
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(should_poll=True)
+    ent.async_update = AsyncMock()
+    await platform.async_add_entities([ent])
+    ent.async_update.reset_mock()
+
+    scheduler._polling = scheduler.concurrency
+    await platform._update_entity_states(dt_util.utcnow())
+    assert ent.async_update.called
+    assert platform.polling_stats.polls == 1
+    assert platform.polling_stats.waits == 0
+    assert not scheduler._waiters
+    scheduler._polling = 0
+
+
+async def test_coalesce_state_writes(hass: HomeAssistant) -> None:
+    """Test platform can coalesce the state writes of its entities."""
+    platform = MockPlatform()
+    platform.COALESCE_STATE_WRITES = True
+
+    mock_entity_platform(hass, "test_domain.platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    assert handle.coalesce_state_writes is True
+
+    state_changes = []
+
+    @callback
+    def _state_changed(event: Event) -> None:
+        state_changes.append(event.data["new_state"].state)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed, run_immediately=True)
+
+    entity1 = MockEntity(name="test_1", state="initial")
+    entity2 = MockEntity(name="test_2", state="initial")
+    await handle.async_add_entities([entity1, entity2])
+    # The first state is written when the entity is added
+    assert hass.states.get(entity1.entity_id).state == "initial"
+    assert state_changes == ["initial", "initial"]
+
+    for state in ("one", "two", "three"):
+        entity1._values["state"] = state
+        entity1.async_write_ha_state()
+    entity2._values["state"] = "one"
+    entity2.async_write_ha_state()
+    assert hass.states.get(entity1.entity_id).state == "initial"
+
+    await hass.async_block_till_done()
+    assert hass.states.get(entity1.entity_id).state == "three"
+    assert hass.states.get(entity2.entity_id).state == "one"
+    assert state_changes == ["initial", "initial", "three", "one"]
+    assert handle.coalesced_state_writes == 2
+
+    # A write scheduled before the entity is removed is dropped
+    entity1._values["state"] = "four"
+    entity1.async_write_ha_state()
+    await handle.async_remove_entity(entity1.entity_id)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity1.entity_id) is None
+
+
 async def test_raise_error_on_update(hass: HomeAssistant) -> None:
     """Test the add entity if they raise an error on update."""
     updates = []
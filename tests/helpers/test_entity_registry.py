@@ -1475,6 +1475,65 @@ def test_entity_registry_items() -> None:
     assert entities.get_entity_id(("test", "hue", "2345")) is None
     assert entities.get_entry(entry2.id) is None
 
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="mock-entry",
+        device_id="mock-device",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        config_entry_id="mock-entry",
+        device_id="mock-device",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("mock-device") == [entry1]
+    assert entities.get_entries_for_device_id("mock-device", True) == [
+        entry1,
+        entry2,
+    ]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+    assert entities.get_entries_for_config_entry_id("mock-entry") == [
+        entry1,
+        entry2,
+    ]
+
+    # Updating an entry keeps its place in the indexes it is still in
+    entry1 = entities["test.entity1"] = attr.evolve(entry1, name="Entity 1")
+    assert entities.get_entries_for_device_id("mock-device", True) == [
+        entry1,
+        entry2,
+    ]
+    assert entities.get_entries_for_config_entry_id("mock-entry") == [
+        entry1,
+        entry2,
+    ]
+
+    entry1 = entities["test.entity1"] = attr.evolve(entry1, area_id="bedroom")
+    assert entities.get_entries_for_config_entry_id("mock-entry") == [
+        entry1,
+        entry2,
+    ]
+    del entities["test.entity2"]
+
+    assert entities.get_entries_for_device_id("mock-device", True) == [entry1]
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("bedroom") == [entry1]
+    assert entities.get_entries_for_config_entry_id("mock-entry") == [entry1]
+
+    del entities["test.entity1"]
+
+    assert entities.get_entries_for_device_id("mock-device", True) == []
+    assert entities.get_entries_for_area_id("bedroom") == []
+    assert entities.get_entries_for_config_entry_id("mock-entry") == []
+
 
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
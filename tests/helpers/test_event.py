@@ -13,7 +13,11 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import (
+    EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
+    MATCH_ALL,
+)
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
@@ -522,6 +526,63 @@ async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     unsub_throws()
 
 
+async def test_async_track_state_change_event_coalesced(hass: HomeAssistant) -> None:
+    """Test async_track_state_change_event with coalesced state changes."""
+    tracker = []
+
+    @ha.callback
+    def run_callback(event: EventType[EventStateChangedData]) -> None:
+        tracker.append(event.data["entity_id"])
+
+    unsub = async_track_state_change_event(
+        hass, ["light.bowl", "switch.kitchen"], run_callback
+    )
+    # The dispatcher keyed by each tracked entity counts as one listener
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == 1
+
+    hass.states._async_set_many_coalesced(
+        [
+            ("light.bowl", "on", None),
+            ("light.other", "on", None),
+            ("switch.kitchen", "off", None),
+        ]
+    )
+    await hass.async_block_till_done()
+    assert tracker == ["light.bowl", "switch.kitchen"]
+
+    unsub()
+    assert not hass.bus.async_listeners().get(EVENT_STATE_CHANGED_BATCH)
+
+    hass.states._async_set_many_coalesced([("light.bowl", "off", None)])
+    await hass.async_block_till_done()
+    assert tracker == ["light.bowl", "switch.kitchen"]
+
+
+async def test_async_track_state_added_domain_coalesced(hass: HomeAssistant) -> None:
+    """Test async_track_state_added_domain with coalesced state changes."""
+    tracker = []
+
+    @ha.callback
+    def run_callback(event: EventType[EventStateChangedData]) -> None:
+        tracker.append(event.data["entity_id"])
+
+    unsub = async_track_state_added_domain(hass, "light", run_callback)
+
+    hass.states.async_set("light.existing", "on")
+    await hass.async_block_till_done()
+    hass.states._async_set_many_coalesced(
+        [
+            ("light.existing", "off", None),
+            ("light.new", "on", None),
+            ("switch.new", "on", None),
+        ]
+    )
+    await hass.async_block_till_done()
+    assert tracker == ["light.existing", "light.new"]
+
+    unsub()
+
+
 async def test_async_track_state_change_event_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
@@ -2906,6 +2967,54 @@ async def test_track_template_unavailable_states_has_default_rate_limit(
     info.async_remove()
 
 
+async def test_track_template_counting_states_is_incremental(
+    hass: HomeAssistant,
+) -> None:
+    """Test a template counting states updates its result for each state change."""
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("switch.one", "on")
+    template_count = Template(
+        "{{ states.light | selectattr('state', 'eq', 'on') | list | count }} on",
+        hass,
+    )
+
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_count, None, timedelta(seconds=0))],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    assert template_count._aggregate is not None
+
+    with patch.object(jinja2.Template, "render", side_effect=AssertionError) as render:
+        hass.states.async_set("light.two", "on")
+        await hass.async_block_till_done()
+        hass.states.async_set("switch.one", "off")
+        hass.states.async_set("light.three", "on")
+        await hass.async_block_till_done()
+        hass.states._async_set_many_coalesced(
+            [("light.one", "off", None), ("light.four", "on", None)]
+        )
+        await hass.async_block_till_done()
+        hass.states.async_remove("light.two")
+        await hass.async_block_till_done()
+        render.assert_not_called()
+
+    assert refresh_runs == ["2 on", "3 on", "2 on"]
+    info.async_remove()
+    assert template_count._aggregate is None
+
+
 async def test_specifically_referenced_entity_is_not_rate_limited(
     hass: HomeAssistant,
 ) -> None:
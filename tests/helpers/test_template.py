@@ -4789,3 +4789,84 @@ async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     assert template.CACHED_TEMPLATE_NO_COLLECT_LRU.get_size() == int(
         round(mock_entity_count * template.ENTITY_COUNT_GROWTH_FACTOR)
     )
+
+
+async def test_render_to_info_shared_between_templates(hass: HomeAssistant) -> None:
+    """Test templates with the same source share a render until a state changes."""
+    hass.states.async_set("sensor.power", "150")
+    template_str = "{{ states('sensor.power') | int * 2 }}"
+    first = template.Template(template_str, hass)
+    second = template.Template(template_str, hass)
+    second.async_render()
+
+    info = first.async_render_to_info()
+    assert info.result() == 300
+    with patch.object(
+        template, "_render_fast_with_context", side_effect=AssertionError
+    ):
+        shared = second.async_render_to_info({"this": "unused"})
+    assert shared.result() == 300
+    assert shared.template is second
+    assert shared.entities == {"sensor.power"}
+
+    hass.states.async_set("sensor.power", "200")
+    assert second.async_render_to_info().result() == 400
+
+
+async def test_render_to_info_shared_while_states_exist(hass: HomeAssistant) -> None:
+    """Test a shared render is only used while the states it read are unchanged."""
+    hass.states.async_set("sensor.power", "150")
+    template_str = "{{ 'yes' if states.sensor.power else 'no' }}"
+    assert template.Template(template_str, hass).async_render_to_info().result() == (
+        "yes"
+    )
+
+    hass.states.async_remove("sensor.power")
+    assert template.Template(template_str, hass).async_render_to_info().result() == (
+        "no"
+    )
+
+
+async def test_render_to_info_shared_until_registry_changes(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test a shared render is not used after a registry changed."""
+    entry = entity_registry.async_get_or_create(
+        "sensor", "test", "power", suggested_object_id="power"
+    )
+    hass.states.async_set(entry.entity_id, "150.123")
+    template_str = "{{ states('sensor.power', rounded=True) }}"
+    tpl = template.Template(template_str, hass)
+    tpl.async_render()
+    info = template.Template(template_str, hass).async_render_to_info()
+    assert info.result() == 150.123
+
+    entity_registry.async_update_entity_options(
+        entry.entity_id, "sensor", {"display_precision": 1}
+    )
+    assert tpl.async_render_to_info().result() == 150.1
+
+
+@pytest.mark.parametrize(
+    ("template_str", "variables"),
+    [
+        ("{{ states('sensor.power') | int * value }}", {"value": 2}),
+        ("{{ now().year > 2000 and states('sensor.power') }}", None),
+        ("{% for state in states.sensor %}{{ state.state }}{% endfor %}", None),
+        ("{{ states('sensor.power') | int(2) / 0 }}", None),
+    ],
+)
+async def test_render_to_info_not_shared(
+    hass: HomeAssistant, template_str: str, variables: TemplateVarsType
+) -> None:
+    """Test renders that depend on more than states are not shared."""
+    hass.states.async_set("sensor.power", "150")
+    template.Template(template_str, hass).async_render_to_info(variables)
+    tpl = template.Template(template_str, hass)
+    tpl.async_render_to_info(variables)
+
+    with patch.object(
+        template, "_render_fast_with_context", wraps=template._render_fast_with_context
+    ) as render:
+        tpl.async_render_to_info(variables)
+    render.assert_called_once()
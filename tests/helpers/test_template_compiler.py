@@ -0,0 +1,234 @@
+"""Test the compiled template fast path."""
+from contextlib import suppress
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import template
+from homeassistant.helpers.template_compiler import compile_fast_render
+
+
+def _environment(hass: HomeAssistant) -> template.TemplateEnvironment:
+    """Return the template environment."""
+    return template.TemplateEnvironment(hass)
+
+
+@pytest.mark.parametrize(
+    ("template_str", "variables"),
+    [
+        ("{{ states('sensor.power') }}", {}),
+        ("{{ states('sensor.power') | float(0) * 2 }}", {}),
+        ("{{ (states('sensor.power') | float + 0.5) | round(1) }}", {}),
+        ("{{ states('sensor.missing') | float(0) - 1 }}", {}),
+        ("{{ states.sensor.power.state }}", {}),
+        ("{{ states.sensor.power.attributes.unit_of_measurement }}", {}),
+        ("{{ state_attr('sensor.power', 'unit_of_measurement') }}", {}),
+        ("{{ is_state('sensor.power', '150') }}", {}),
+        ("{{ is_state('sensor.power', ['1', '150']) and not false }}", {}),
+        ("{{ 'on' if is_state('binary_sensor.door', 'on') else 'off' }}", {}),
+        ("{{ has_value('sensor.missing') }}", {}),
+        ("{{ 1 < states('sensor.power') | int < 200 }}", {}),
+        ("{{ states('sensor.power') in ['150', '200'] }}", {}),
+        ("{{ max(states('sensor.power') | int, 10) }}", {}),
+        ("{{ [1, 2] }} {{ (3, 4) }}", {}),
+        ("Power: {{ states('sensor.power') ~ ' W' }}", {}),
+        ("{{ value | int // 3 }} {{ value | int % 3 }}", {"value": "11"}),
+        ("{{ value_json.power }}", {"value_json": {"power": 5}}),
+        ("{{ value_json['power'] ** 2 }}", {"value_json": {"power": 5}}),
+        ("{{ -value }} {{ +value }}", {"value": 5}),
+        (
+            "{% if is_state('binary_sensor.door', 'off') %}closed"
+            "{% elif is_state('binary_sensor.door', 'on') %}open"
+            "{% else %}unknown{% endif %}",
+            {},
+        ),
+        ("{{ states | lower }}", {"states": "SHADOWED"}),
+    ],
+)
+async def test_fast_render_matches_jinja(
+    hass: HomeAssistant, template_str: str, variables: dict
+) -> None:
+    """Test the fast path renders the same result as Jinja."""
+    hass.states.async_set("sensor.power", "150", {"unit_of_measurement": "W"})
+    hass.states.async_set("binary_sensor.door", "on")
+    env = _environment(hass)
+
+    fast_render = compile_fast_render(env, template_str)
+    assert fast_render is not None
+    assert fast_render(variables) == env.from_string(template_str).render(**variables)
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{% for state in states.sensor %}{{ state.state }}{% endfor %}",
+        "{% set power = states('sensor.power') %}{{ power }}",
+        "{{ states.sensor | map(attribute='state') | list }}",
+        "{{ expand('group.all') }}",
+        "{{ value is number }}",
+        "{{ value[1:] }}",
+        "{{ states(*entities) }}",
+        "{{ namespace(a=1).a }}",
+    ],
+)
+async def test_unsupported_templates_are_not_compiled(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates using unsupported syntax are left to Jinja."""
+    assert compile_fast_render(_environment(hass), template_str) is None
+
+
+async def test_fast_render_used_by_template(hass: HomeAssistant) -> None:
+    """Test a template renders through the fast path and falls back to Jinja."""
+    hass.states.async_set("sensor.power", "150")
+    tpl = template.Template("{{ states('sensor.power') | int + value }}", hass)
+    assert tpl.async_render({"value": 1}) == 151
+    assert tpl._fast_render is not None
+
+    with patch.object(
+        template.jinja2.Template, "render", return_value="fallback"
+    ) as render:
+        assert tpl.async_render({"value": 1}) == 151
+        render.assert_not_called()
+        # An undefined variable is left to Jinja
+        assert tpl.async_render() == "fallback"
+        render.assert_called_once()
+
+
+async def test_fast_render_collects_render_info(hass: HomeAssistant) -> None:
+    """Test the fast path tracks the entities a template reads."""
+    hass.states.async_set("sensor.power", "150")
+    hass.states.async_set("binary_sensor.door", "on")
+    tpl = template.Template(
+        "{% if is_state('binary_sensor.door', 'on') %}"
+        "{{ states.sensor.power.state }}{% endif %}",
+        hass,
+    )
+
+    info = tpl.async_render_to_info()
+    assert tpl._fast_render is not None
+    assert info.result() == 150
+    assert info.entities == {"binary_sensor.door", "sensor.power"}
+    assert not info.domains
+    assert not info.all_states
+
+
+async def test_fast_render_errors(hass: HomeAssistant) -> None:
+    """Test the fast path raises the same errors as Jinja."""
+    tpl = template.Template("{{ states('sensor.missing') | float }}", hass)
+    with pytest.raises(TemplateError, match="no default was specified"):
+        tpl.async_render()
+    assert tpl._fast_render is not None
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+        "{{ states['light'] | rejectattr('state', 'in', ['on']) | list | length }}",
+        "{{ states | selectattr('attributes.brightness') | list | count }} lights",
+        "{{ states.light | map(attribute='attributes.brightness', default=0)"
+        " | map('int') | sum }}",
+        "{{ states.light | selectattr('state', 'eq', 'on')"
+        " | sum(attribute='attributes.brightness') }}",
+        "{{ states.light | map(attribute='state') | select('eq', 'on') | list | count }}",
+    ],
+)
+async def test_state_aggregate_matches_jinja(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test a state aggregate renders the same result as Jinja after state changes."""
+    hass.states.async_set("light.one", "on", {"brightness": 100})
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("switch.one", "on", {"brightness": 1})
+    env = _environment(hass)
+    tpl = template.Template(template_str, hass)
+    tpl.async_render()
+    aggregate = tpl.async_start_aggregate()
+    assert aggregate is not None
+    assert tpl.async_start_aggregate() is None
+
+    for entity_id, state, attributes in (
+        ("light.two", "on", {"brightness": 50}),
+        ("light.three", "on", {"brightness": 20}),
+        ("switch.one", "off", {"brightness": 3}),
+        ("light.one", "off", {}),
+        ("light.two", None, None),
+    ):
+        if state is None:
+            hass.states.async_remove(entity_id)
+        else:
+            hass.states.async_set(entity_id, state, attributes)
+        aggregate.async_update(entity_id)
+        assert aggregate.valid
+        with patch.object(
+            template.jinja2.Template, "render", side_effect=AssertionError
+        ):
+            result = tpl.async_render(parse_result=False)
+        assert result == env.from_string(template_str).render()
+
+    tpl.async_stop_aggregate()
+    assert tpl._aggregate is None
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states.light | selectattr('state', 'eq', 'on') | count }}",
+        "{{ states.light | list | first }}",
+        "{{ states.light.kitchen | list | count }}",
+        "{{ states.light | selectattr('state', 'eq', value) | list | count }}",
+        "{{ states.light | map('state_attr', 'brightness') | sum }}",
+        "{{ states.light | list | count }}{{ states.switch | list | count }}",
+        "{% if true %}{{ states.light | list | count }}{% endif %}",
+    ],
+)
+async def test_unsupported_state_aggregates(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates that are not aggregates of states are left to Jinja."""
+    tpl = template.Template(template_str, hass)
+    with suppress(TemplateError):
+        tpl.async_render({"value": "on"})
+    assert tpl.async_start_aggregate() is None
+
+
+async def test_state_aggregate_falls_back_to_jinja(hass: HomeAssistant) -> None:
+    """Test a state aggregate leaves floats and errors to Jinja."""
+    hass.states.async_set("sensor.one", "1")
+    tpl = template.Template(
+        "{{ states.sensor | map(attribute='state') | map('int', 0) | sum }}", hass
+    )
+    assert tpl.async_render() == 1
+    aggregate = tpl.async_start_aggregate()
+    assert aggregate is not None
+    assert aggregate.valid
+
+    hass.states.async_set("sensor.two", "two")
+    aggregate.async_update("sensor.two")
+    assert aggregate.valid
+    assert tpl.async_render() == 1
+
+    tpl = template.Template(
+        "{{ states.sensor | map(attribute='state') | map('float', 0) | sum }}", hass
+    )
+    assert tpl.async_render() == 1.0
+    aggregate = tpl.async_start_aggregate()
+    assert aggregate is not None
+    assert not aggregate.valid
+    assert tpl.async_render({"states": []}) == 0
+    assert tpl.async_render() == 1.0
+
+    tpl = template.Template(
+        "{{ states.sensor | map(attribute='state') | map('int') | sum }}",
+        hass,
+    )
+    with pytest.raises(TemplateError):
+        tpl.async_render()
+    aggregate = tpl.async_start_aggregate()
+    assert aggregate is not None
+    assert not aggregate.valid
+    with pytest.raises(TemplateError):
+        tpl.async_render()
@@ -31,6 +31,7 @@ from homeassistant.const import (
     EVENT_SERVICE_REGISTERED,
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     MATCH_ALL,
     __version__,
 )
@@ -53,6 +54,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.job_stats import JobStats
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -78,7 +80,7 @@ def test_split_entity_id() -> None:
 
 def test_async_add_hass_job_schedule_callback() -> None:
     """Test that we schedule callbacks and add jobs to the job pool."""
-    hass = MagicMock()
+    hass = MagicMock(job_stats=None)
     job = MagicMock()
 
     ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(ha.callback(job)))
@@ -102,7 +104,7 @@ def test_async_add_hass_job_coro_named(hass: HomeAssistant) -> None:
 
 def test_async_add_hass_job_schedule_partial_callback() -> None:
     """Test that we schedule partial coros and add jobs to the job pool."""
-    hass = MagicMock()
+    hass = MagicMock(job_stats=None)
     job = MagicMock()
     partial = functools.partial(ha.callback(job))
 
@@ -114,7 +116,7 @@ def test_async_add_hass_job_schedule_partial_callback() -> None:
 
 def test_async_add_hass_job_schedule_coroutinefunction(event_loop) -> None:
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=event_loop))
+    hass = MagicMock(loop=MagicMock(wraps=event_loop), job_stats=None)
 
     async def job():
         pass
@@ -127,7 +129,7 @@ def test_async_add_hass_job_schedule_coroutinefunction(event_loop) -> None:
 
 def test_async_add_hass_job_schedule_partial_coroutinefunction(event_loop) -> None:
     """Test that we schedule partial coros and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=event_loop))
+    hass = MagicMock(loop=MagicMock(wraps=event_loop), job_stats=None)
 
     async def job():
         pass
@@ -142,7 +144,7 @@ def test_async_add_hass_job_schedule_partial_coroutinefunction(event_loop) -> No
 
 def test_async_add_job_add_hass_threaded_job_to_pool() -> None:
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock()
+    hass = MagicMock(job_stats=None)
 
     def job():
         pass
@@ -155,7 +157,7 @@ def test_async_add_job_add_hass_threaded_job_to_pool() -> None:
 
 def test_async_create_task_schedule_coroutine(event_loop) -> None:
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=event_loop))
+    hass = MagicMock(loop=MagicMock(wraps=event_loop), job_stats=None)
 
     async def job():
         pass
@@ -168,7 +170,7 @@ def test_async_create_task_schedule_coroutine(event_loop) -> None:
 
 def test_async_create_task_schedule_coroutine_with_name(event_loop) -> None:
     """Test that we schedule coroutines and add jobs to the job pool with a name."""
-    hass = MagicMock(loop=MagicMock(wraps=event_loop))
+    hass = MagicMock(loop=MagicMock(wraps=event_loop), job_stats=None)
 
     async def job():
         pass
@@ -182,7 +184,7 @@ def test_async_create_task_schedule_coroutine_with_name(event_loop) -> None:
 
 def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(job_stats=None)
     calls = []
 
     def job():
@@ -193,9 +195,30 @@ def test_async_run_hass_job_calls_callback() -> None:
     assert len(hass.async_add_job.mock_calls) == 0
 
 
+async def test_job_stats_record_jobs(hass: HomeAssistant) -> None:
+    """Test the time spent running jobs is recorded when enabled."""
+    hass.job_stats = JobStats()
+
+    @ha.callback
+    def callback_job():
+        pass
+
+    async def coro_job():
+        await asyncio.sleep(0)
+
+    hass.async_run_hass_job(ha.HassJob(callback_job, "callback job"))
+    hass.async_add_hass_job(ha.HassJob(callback_job, "callback job"))
+    await hass.async_add_hass_job(ha.HassJob(coro_job, "coro job"))
+    await hass.async_block_till_done()
+
+    stats = {job["name"]: job for job in hass.job_stats.as_list()}
+    assert stats["callback job"]["calls"] == 2
+    assert stats["coro job"]["calls"] == 1
+
+
 def test_async_run_hass_job_delegates_non_async() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(job_stats=None)
     calls = []
 
     def job():
@@ -826,6 +849,121 @@ async def test_eventbus_run_immediately_not_callback(hass: HomeAssistant) -> Non
         hass.bus.async_listen("test", listener, run_immediately=True)
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners only run for events matching their key."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen("test", listener, key="light.kitchen")
+    unsub_immediate = hass.bus.async_listen(
+        "test", listener, run_immediately=True, key="light.kitchen"
+    )
+    assert hass.bus.async_listeners()["test"] == 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 1
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    unsub()
+    unsub_immediate()
+    assert "test" not in hass.bus.async_listeners()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_eventbus_keyed_listener_many_keys(hass: HomeAssistant) -> None:
+    """Test a listener job keyed by many keys is counted once."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    filterable_job = (ha.HassJob(listener), None, False)
+    unsubs = [
+        hass.bus._async_listen_keyed_filterable_job("test", key, filterable_job)
+        for key in ("light.kitchen", "light.bedroom")
+    ]
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    unsubs[0]()
+    assert hass.bus.async_listeners()["test"] == 1
+    unsubs[1]()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_listener_match_all(hass: HomeAssistant) -> None:
+    """Test we raise when passing a key for MATCH_ALL."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(MATCH_ALL, listener, key="light.kitchen")
+
+
+async def test_eventbus_remove_unknown_keyed_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test removing a keyed listener twice logs instead of raising."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    unsub = hass.bus.async_listen("test", listener, key="light.kitchen")
+    unsub()
+    unsub()
+    assert "Unable to remove unknown job listener" in caplog.text
+
+
+async def test_eventbus_listener_removes_itself(hass: HomeAssistant) -> None:
+    """Test a listener removing itself while firing does not skip others."""
+    calls = []
+
+    @ha.callback
+    def listener_one(event):
+        """Remove itself when called."""
+        calls.append(1)
+        unsub_one()
+
+    @ha.callback
+    def listener_two(event):
+        """Mock listener."""
+        calls.append(2)
+
+    unsub_one = hass.bus.async_listen("test", listener_one, run_immediately=True)
+    unsub_two = hass.bus.async_listen("test", listener_two, run_immediately=True)
+
+    hass.bus.async_fire("test")
+    assert calls == [1, 2]
+
+    hass.bus.async_fire("test")
+    assert calls == [1, 2, 2]
+
+    unsub_two()
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1111,6 +1249,27 @@ async def test_statemachine_last_changed_not_updated_on_same_state(
     assert state.last_changed == state2.last_changed
 
 
+async def test_statemachine_shares_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test a new state shares the attributes of the old state if unchanged."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state2 = hass.states.get("light.bowl")
+    assert state2.state == "off"
+    assert state2.attributes is state.attributes
+
+    hass.states.async_set("light.bowl", "on", state2.attributes)
+    state3 = hass.states.get("light.bowl")
+    assert state3.state == "on"
+    assert state3.attributes is state.attributes
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    state4 = hass.states.get("light.bowl")
+    assert state4.attributes == {"brightness": 50}
+    assert state4.attributes is not state.attributes
+
+
 async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     """Test force update option."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1125,6 +1284,111 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states fires a state_changed event per change."""
+    hass.states.async_set("light.bowl", "on", {})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [
+            ("light.bowl", "on", None),
+            ("light.Kitchen", "off", {"brightness": 0}),
+            ("sensor.temperature", 21.5, None),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.kitchen",
+        "sensor.temperature",
+    ]
+    kitchen = hass.states.get("light.kitchen")
+    temperature = hass.states.get("sensor.temperature")
+    assert kitchen.attributes == {"brightness": 0}
+    assert temperature.state == "21.5"
+    assert kitchen.context is temperature.context
+    assert kitchen.last_updated == temperature.last_updated
+    assert events[0].context is kitchen.context
+    assert events[0].time_fired == kitchen.last_updated
+
+    hass.states.async_set_many([("light.bowl", "on", None)], force_update=True)
+    await hass.async_block_till_done()
+    assert len(events) == 3
+
+
+async def test_statemachine_async_set_many_coalesce(hass: HomeAssistant) -> None:
+    """Test setting many states can fire a single coalesced event."""
+    hass.states.async_set("light.bowl", "on", {})
+    old_state = hass.states.get("light.bowl")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batch_events = async_capture_events(hass, EVENT_STATE_CHANGED_BATCH)
+    context = ha.Context()
+
+    hass.states._async_set_many_coalesced(
+        [("light.bowl", "off", None), ("light.kitchen", "on", None)], context=context
+    )
+    await hass.async_block_till_done()
+
+    assert len(events) == 0
+    assert len(batch_events) == 1
+    assert batch_events[0].context is context
+    state_events = batch_events[0].data["events"]
+    assert [event.event_type for event in state_events] == [
+        EVENT_STATE_CHANGED,
+        EVENT_STATE_CHANGED,
+    ]
+    assert state_events[0].data == {
+        "entity_id": "light.bowl",
+        "old_state": old_state,
+        "new_state": hass.states.get("light.bowl"),
+    }
+    assert state_events[1].data["old_state"] is None
+    assert state_events[1].context is context
+
+    hass.states._async_set_many_coalesced([("light.bowl", "off", None)])
+    await hass.async_block_till_done()
+    assert len(batch_events) == 1
+
+
+async def test_statemachine_async_set_many_state_info(hass: HomeAssistant) -> None:
+    """Test setting many states passes the state info of each entity."""
+    state_info = {"unrecorded_attributes": frozenset({"picture"})}
+    hass.states.async_set_many(
+        [("light.bowl", "on", None), ("light.kitchen", "on", None)],
+        state_info={"light.bowl": state_info},
+    )
+    assert hass.states.get("light.bowl").state_info == state_info
+    assert hass.states.get("light.kitchen").state_info is None
+
+
+async def test_statemachine_async_set_many_invalid(hass: HomeAssistant) -> None:
+    """Test a batch with an invalid state does not change any state."""
+    hass.states.async_set("light.bowl", "on", {})
+    old_state = hass.states.get("light.bowl")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [("light.bowl", "off", None), ("invalid_entity_id", "on", None)]
+        )
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [("light.bowl", "off", None), ("light.kitchen", "x" * 256, None)]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl") is old_state
+    assert hass.states.get("light.kitchen") is None
+    assert not events
+
+    hass.states.async_set_many(
+        [("light.bowl", "off", None), ("light.bowl", "dim", None)]
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("light.bowl").state == "dim"
+    assert [event.data["old_state"].state for event in events] == ["on", "off"]
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1,4 +1,5 @@
 """Test to verify that we can load components."""
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -6,6 +7,7 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
 
 from .common import MockModule, async_get_persistent_notifications, mock_integration
@@ -873,3 +875,87 @@ async def test_async_suggest_report_issue(
         )
         == report_issue
     )
+
+
+async def test_integration_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any], enable_custom_integrations: None
+) -> None:
+    """Test integrations are resolved from the cache on the next start."""
+    await loader.async_load_integration_cache(hass)
+    integration = await loader.async_get_integration(hass, "automation")
+    await loader.async_get_integration(hass, "test_package")
+    assert await integration.resolve_dependencies()
+    await loader.async_save_integration_cache(hass)
+
+    data = hass_storage[loader.INTEGRATION_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    cached = data["integrations"]["automation"]
+    assert cached["dependencies"] == sorted(integration.all_dependencies)
+    assert "logbook" in cached["platforms"]
+    assert data["integrations"]["test_package"]["manifest"]["is_built_in"] is False
+
+    loader.async_setup(hass)
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+    with patch(
+        "homeassistant.loader.Integration.resolve_from_root"
+    ) as mock_resolve, patch(
+        "homeassistant.loader._async_component_dependencies"
+    ) as mock_dependencies:
+        await loader.async_load_integration_cache(hass)
+        integration = await loader.async_get_integration(hass, "automation")
+        custom = await loader.async_get_integration(hass, "test_package")
+        assert await integration.resolve_dependencies()
+
+    mock_resolve.assert_not_called()
+    mock_dependencies.assert_not_called()
+    assert integration.all_dependencies == set(cached["dependencies"])
+    assert not custom.is_built_in
+    assert integration.get_platform("logbook")
+    with pytest.raises(ImportError, match="automation.missing"):
+        integration.get_platform("missing")
+
+    # Nothing changed, so the cache is not written again
+    with patch("homeassistant.helpers.storage.Store.async_save") as mock_save:
+        await loader.async_save_integration_cache(hass)
+    mock_save.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("ha_version", "stale_path"),
+    [("2020.1.0", None), (__version__, "/non-existing/manifest.json")],
+)
+async def test_integration_cache_invalidated(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    ha_version: str,
+    stale_path: str | None,
+) -> None:
+    """Test the cache is not used after an update or a custom component change."""
+    mtimes = loader._get_custom_components_mtimes(loader._get_custom_components_paths())
+    if stale_path:
+        mtimes[stale_path] = 0
+    hass_storage[loader.INTEGRATION_CACHE_STORAGE_KEY] = {
+        "version": loader.INTEGRATION_CACHE_STORAGE_VERSION,
+        "key": loader.INTEGRATION_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": ha_version,
+            "mtimes": mtimes,
+            "integrations": {
+                "automation": {
+                    "pkg_path": "homeassistant.components.automation",
+                    "file_path": "/non-existing/automation",
+                    "manifest": {
+                        "domain": "automation",
+                        "name": "Cached",
+                        "is_built_in": True,
+                    },
+                    "dependencies": [],
+                    "platforms": [],
+                }
+            },
+        },
+    }
+
+    await loader.async_load_integration_cache(hass)
+    integration = await loader.async_get_integration(hass, "automation")
+    assert integration.name == "Automation"
@@ -0,0 +1,155 @@
+"""Test Home Assistant job stats."""
+import asyncio
+from functools import partial
+
+import pytest
+
+from homeassistant.util.job_stats import OTHER_JOBS, JobStats, JobTiming
+
+
+def test_job_timing_percentiles() -> None:
+    """Test percentiles are taken from the histogram buckets."""
+    timing = JobTiming("test", None)
+    assert timing.percentile(50) == 0.0
+
+    for _ in range(98):
+        timing.record(0.000003)
+    timing.record(0.0005)
+    timing.record(0.2)
+
+    assert timing.calls == 100
+    assert timing.total == pytest.approx(0.000003 * 98 + 0.2005)
+    assert timing.max == 0.2
+    assert timing.percentile(50) == 0.000004
+    assert timing.percentile(99) == 0.000512
+    assert timing.percentile(100) == 0.2
+
+
+def test_job_timing_slowest_bucket() -> None:
+    """Test very slow runs land in the last bucket."""
+    timing = JobTiming("test", None)
+    timing.record(100)
+    assert timing.histogram[-1] == 1
+    assert timing.percentile(99) == 100
+
+
+def test_job_stats_run() -> None:
+    """Test running jobs records timings by name and integration."""
+    job_stats = JobStats()
+
+    def _target(value: int) -> int:
+        return value * 2
+
+    assert job_stats.run("double", _target, 2) == 4
+    assert job_stats.run("double", _target, 3) == 6
+    job_stats.run(None, partial(_target, 1))
+
+    def _raise() -> None:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        job_stats.run("raise", _raise)
+
+    stats = {job["name"]: job for job in job_stats.as_list()}
+    assert stats["double"]["calls"] == 2
+    assert stats["double"]["integration"] is None
+    assert stats["raise"]["calls"] == 1
+    assert stats[f"{__name__}.test_job_stats_run.<locals>._target"]["calls"] == 1
+
+
+def test_job_stats_integration() -> None:
+    """Test the integration is detected from the target module."""
+    job_stats = JobStats()
+
+    def _target() -> None:
+        """Target in an integration."""
+
+    _target.__module__ = "homeassistant.components.light.switch"
+    job_stats.run("light", _target)
+    _target.__module__ = "custom_components.my_light"
+    job_stats.run("custom", _target)
+
+    stats = {job["name"]: job for job in job_stats.as_list()}
+    assert stats["light"]["integration"] == "light"
+    assert stats["custom"]["integration"] == "my_light"
+
+
+def test_job_stats_same_name() -> None:
+    """Test jobs with the same name and different targets are kept apart."""
+    job_stats = JobStats()
+
+    def _light() -> None:
+        """Handle an event in the light integration."""
+
+    def _switch() -> None:
+        """Handle an event in the switch integration."""
+
+    _light.__module__ = "homeassistant.components.light"
+    _switch.__module__ = "homeassistant.components.switch"
+    job_stats.run("listen state_changed", _light)
+    job_stats.run("listen state_changed", _switch)
+    job_stats.run("listen state_changed", _switch)
+
+    stats = {job["integration"]: job for job in job_stats.as_list()}
+    assert stats["light"]["name"] == stats["switch"]["name"]
+    assert stats["light"]["calls"] == 1
+    assert stats["switch"]["calls"] == 2
+    assert stats["switch"]["target"] == (
+        "homeassistant.components.switch.test_job_stats_same_name.<locals>._switch"
+    )
+
+
+def test_job_stats_max_jobs() -> None:
+    """Test jobs beyond the maximum are combined."""
+    job_stats = JobStats(max_jobs=2)
+
+    for name in ("one", "two", "three", "four"):
+        job_stats.run(name, lambda: None)
+
+    stats = {job["name"]: job for job in job_stats.as_list()}
+    assert set(stats) == {"one", "two", OTHER_JOBS}
+    assert stats[OTHER_JOBS]["calls"] == 2
+
+
+async def test_job_stats_run_coroutine() -> None:
+    """Test coroutines are timed per step."""
+    job_stats = JobStats()
+    event = asyncio.Event()
+
+    async def _target(value: int) -> int:
+        await event.wait()
+        await asyncio.sleep(0)
+        return value
+
+    task = asyncio.create_task(job_stats.run_coroutine("coro", _target, _target(5)))
+    await asyncio.sleep(0.05)
+    event.set()
+    assert await task == 5
+
+    stats = job_stats.as_list()[0]
+    assert stats["calls"] == 1
+    # Time spent waiting for the event is not time spent in the loop
+    assert stats["total"] < 0.05
+
+
+async def test_job_stats_run_coroutine_cancel() -> None:
+    """Test cancelling a timed coroutine cancels the coroutine."""
+    job_stats = JobStats()
+    cancelled = False
+
+    async def _target() -> None:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    task = asyncio.create_task(job_stats.run_coroutine("coro", _target, _target()))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert cancelled
+    assert job_stats.as_list()[0]["calls"] == 1